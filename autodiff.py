@@ -0,0 +1,186 @@
+import math
+from array import array
+
+from functions import Variable, Constant, Sum, Product, Power, Logarithm, Exponential, is_array, numpy
+
+
+MODES = ('forward', 'reverse')
+
+
+def natural_log(value):
+    return numpy.log(value) if is_array(value) else math.log(value)
+
+
+class Dual(object):
+    __slots__ = ('value', 'derivative')
+
+    def __init__(self, value, derivative=0.0):
+        self.value = value
+        self.derivative = derivative
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.derivative + other.derivative)
+        return Dual(self.value + other, self.derivative)
+
+    __radd__ = __add__
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value, self.derivative * other.value + self.value * other.derivative)
+        return Dual(self.value * other, self.derivative * other)
+
+    __rmul__ = __mul__
+
+    def __pow__(self, power, modulo=None):
+        if isinstance(power, Dual):
+            value = self.value ** power.value
+            return Dual(value, value * (power.derivative * natural_log(self.value) +
+                                        power.value * self.derivative / self.value))
+        if power == 0:
+            return Dual(self.value ** 0, 0.0)
+        return Dual(self.value ** power, power * self.value ** (power - 1) * self.derivative)
+
+    def log(self, base):
+        return Dual(natural_log(self.value) / math.log(base), self.derivative / (self.value * math.log(base)))
+
+    def __repr__(self):
+        return 'Dual({0!r}, {1!r})'.format(self.value, self.derivative)
+
+
+def forward_sum(node, value, arguments):
+    return sum(arguments, Dual(0.0))
+
+
+def forward_product(node, value, arguments):
+    result = Dual(1.0)
+    for argument in arguments:
+        result = result * argument
+    return result
+
+
+def forward_variable(node, value, variable):
+    return Dual(node.evaluate(value), 1.0 if variable is None or variable == node.name else 0.0)
+
+
+FORWARD_RULES = {
+    Constant: lambda node, value, arguments: Dual(node.constant),
+    Sum: forward_sum,
+    Product: forward_product,
+    Power: lambda node, value, arguments: arguments[0] ** node.power,
+    Logarithm: lambda node, value, arguments: arguments[0].log(node.base),
+    Exponential: lambda node, value, arguments: arguments[0] ** arguments[1],
+}
+
+
+def forward_derivative(function, value, variable=None):
+    results = {}
+    for node in function.nodes():
+        if isinstance(node, Variable):
+            results[id(node)] = forward_variable(node, value, variable)
+            continue
+        results[id(node)] = FORWARD_RULES[type(node)](node, value, [results[id(child)] for child in node.children()])
+    result = results[id(function)]
+    return result.value, result.derivative
+
+
+def local_sum(node, value, arguments):
+    return sum(arguments, 0.0), [1.0] * len(arguments)
+
+
+def local_product(node, value, arguments):
+    prefix = [1.0]
+    for argument in arguments[:-1]:
+        prefix.append(prefix[-1] * argument)
+    partials = [None] * len(arguments)
+    suffix = 1.0
+    for i in range(len(arguments) - 1, -1, -1):
+        partials[i] = prefix[i] * suffix
+        suffix = suffix * arguments[i]
+    return suffix, partials
+
+
+def local_power(node, value, arguments):
+    base = arguments[0]
+    if node.power == 0:
+        return base ** 0, [0.0]
+    return base ** node.power, [node.power * base ** (node.power - 1)]
+
+
+def local_logarithm(node, value, arguments):
+    scale = math.log(node.base)
+    return natural_log(arguments[0]) / scale, [1.0 / (arguments[0] * scale)]
+
+
+def local_exponential(node, value, arguments):
+    base, power = arguments
+    result = base ** power
+    return result, [power * base ** (power - 1), result * natural_log(base)]
+
+
+LOCAL_RULES = {
+    Variable: lambda node, value, arguments: (node.evaluate(value), []),
+    Constant: lambda node, value, arguments: (node.constant, []),
+    Sum: local_sum,
+    Product: local_product,
+    Power: local_power,
+    Logarithm: local_logarithm,
+    Exponential: local_exponential,
+}
+
+
+class Tape(object):
+    def __init__(self, function, value):
+        self.function = function
+        self.entries = []
+        self.values = {}
+        for node in function.nodes():
+            children = node.children()
+            result, partials = LOCAL_RULES[type(node)](node, value, [self.values[id(child)] for child in children])
+            self.values[id(node)] = result
+            self.entries.append((node, children, partials))
+
+    @property
+    def value(self):
+        return self.values[id(self.function)]
+
+    def gradient(self):
+        adjoints = {id(self.function): 1.0}
+        gradient = {}
+        for node, children, partials in reversed(self.entries):
+            adjoint = adjoints.pop(id(node), None)
+            if adjoint is None:
+                continue
+            if isinstance(node, Variable):
+                gradient[node.name] = gradient[node.name] + adjoint if node.name in gradient else adjoint
+            for child, partial in zip(children, partials):
+                contribution = adjoint * partial
+                adjoints[id(child)] = adjoints[id(child)] + contribution if id(child) in adjoints else contribution
+        return gradient
+
+    def backward(self, variable=None):
+        gradient = self.gradient()
+        if variable is not None:
+            return gradient.get(variable, 0.0)
+        return sum(gradient.values(), 0.0)
+
+
+def reverse_derivative(function, value, variable=None):
+    tape = Tape(function, value)
+    return tape.value, tape.backward(variable)
+
+
+def derivative_many(function, values, mode='forward', variable=None):
+    if mode not in MODES:
+        raise ValueError('Unknown differentiation mode {0}, expected one of {1}.'.format(mode, MODES))
+    differentiate = forward_derivative if mode == 'forward' else reverse_derivative
+    if is_array(values):
+        values = values.astype(float)
+        value, derivative = differentiate(function, values, variable)
+        zeros = numpy.zeros(values.shape)
+        return zeros + value, zeros + derivative
+    results = [differentiate(function, value, variable) for value in values]
+    try:
+        return array('d', [result[0] for result in results]), array('d', [result[1] for result in results])
+    except TypeError:
+        return [result[0] for result in results], [result[1] for result in results]
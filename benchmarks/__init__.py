@@ -0,0 +1,3 @@
+"""Benchmarks import the top-level modules, so run them from the repository root as
+``python -m benchmarks.<name>``, for example ``python -m benchmarks.bench_det``.
+"""
@@ -0,0 +1,46 @@
+import math
+import sys
+import time
+
+from autodiff import forward_derivative, reverse_derivative
+from benchmarks.bench_functions import deep_expression
+from functions import Variable, Constant, Product, Sum, Power, Exponential, Logarithm, clear_cache
+
+DEPTHS = [2, 4, 8, 16]
+
+
+def expression(depth):
+    x = Variable('x')
+    return Product([deep_expression(depth), Exponential(math.e, Product([Constant(0.1), x])),
+                    Logarithm(Sum([Power(x, 2), Constant(1)]), math.e)])
+
+
+def time_calls(function, values):
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return time.perf_counter() - start
+
+
+def symbolic(function, value):
+    clear_cache()
+    return function.evaluate(value), function.derivative().evaluate(value)
+
+
+def main(depths, evaluations=200):
+    values = [0.5 + i / evaluations for i in range(evaluations)]
+    print('{0:>6} {1:>14} {2:>14} {3:>14} {4:>14}'.format('depth', 'symbolic (s)', 'prebuilt (s)', 'forward (s)',
+                                                          'reverse (s)'))
+    for depth in depths:
+        function = expression(depth)
+        derivative = function.derivative()
+        symbolic_time = time_calls(lambda value: symbolic(function, value), values)
+        cached_time = time_calls(derivative.evaluate, values)
+        forward_time = time_calls(lambda value: forward_derivative(function, value), values)
+        reverse_time = time_calls(lambda value: reverse_derivative(function, value), values)
+        print('{0:>6} {1:>14.4f} {2:>14.4f} {3:>14.4f} {4:>14.4f}'.format(
+            depth, symbolic_time, cached_time, forward_time, reverse_time))
+
+
+if __name__ == '__main__':
+    main([int(depth) for depth in sys.argv[1:]] or DEPTHS)
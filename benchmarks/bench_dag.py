@@ -0,0 +1,41 @@
+import math
+import sys
+import time
+
+from benchmarks.bench_hash_consing import count_nodes
+from functions import Variable, Constant, Product, Sum, Power, Exponential, Logarithm
+
+ORDERS = [2, 4, 6, 8]
+
+
+def product_of_factors():
+    x = Variable('x')
+    return Product([Sum([x, Constant(1)]), Power(x, 3), Exponential(math.e, x),
+                    Logarithm(Sum([x, Constant(2)]), math.e)])
+
+
+def time_calls(function, values):
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return time.perf_counter() - start
+
+
+def main(orders, evaluations=200):
+    values = [1.0 + i / evaluations for i in range(evaluations)]
+    print('{0:>6} {1:>12} {2:>10} {3:>14} {4:>14} {5:>10}'.format('order', 'tree nodes', 'dag nodes', 'tree-walk (s)',
+                                                                   'shared (s)', 'speedup'))
+    function = product_of_factors()
+    for order in range(1, max(orders) + 1):
+        function = function.derivative()
+        if order not in orders:
+            continue
+        tree, unique = count_nodes(function)
+        tree_time = time_calls(function.evaluate, values)
+        shared_time = time_calls(function.evaluate_shared, values)
+        print('{0:>6} {1:>12} {2:>10} {3:>14.4f} {4:>14.4f} {5:>10.1f}'.format(
+            order, tree, unique, tree_time, shared_time, tree_time / shared_time))
+
+
+if __name__ == '__main__':
+    main([int(order) for order in sys.argv[1:]] or ORDERS)
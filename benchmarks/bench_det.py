@@ -0,0 +1,33 @@
+import random
+import sys
+import time
+
+from matrix import Matrix, Fraction
+
+SIZES = [3, 5, 8, 10, 25, 50, 100, 200, 500]
+
+
+def random_matrix(size, data_type):
+    if data_type == float:
+        return Matrix([[random.uniform(-10, 10) for _ in range(size)] for _ in range(size)])
+    data = [[random.randint(-10, 10) for _ in range(size)] for _ in range(size)]
+    return Matrix(data, data_type=data_type)
+
+
+def time_det(matrix):
+    start = time.perf_counter()
+    matrix.det()
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    print('{0:>6} {1:>12} {2:>12} {3:>12}'.format('n', 'float (s)', 'int (s)', 'Fraction (s)'))
+    for size in sizes:
+        timings = [time_det(random_matrix(size, data_type)) for data_type in (float, int)]
+        timings.append(time_det(random_matrix(size, Fraction)) if size <= 50 else None)
+        print('{0:>6} {1}'.format(size, ' '.join(
+            '{0:>12.5f}'.format(timing) if timing is not None else '{0:>12}'.format('-') for timing in timings)))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,65 @@
+import random
+import sys
+import time
+
+from matrix import Fraction, pivoted_reduction
+
+SIZES = [5, 10, 20, 30]
+
+
+def legacy_gcd(a, b):
+    if b == 0:
+        return a
+    return legacy_gcd(b, a % b)
+
+
+class LegacyFraction(object):
+    def __init__(self, numerator, denominator):
+        self.numerator = numerator
+        self.denominator = denominator
+
+    def __sub__(self, other):
+        return self.add(other.negate())
+
+    def __mul__(self, other):
+        return LegacyFraction(self.numerator * other.numerator, self.denominator * other.denominator).simplify()
+
+    def __truediv__(self, other):
+        return self * LegacyFraction(other.denominator, other.numerator).simplify()
+
+    def __ne__(self, other):
+        if isinstance(other, int):
+            other = LegacyFraction(other, 1)
+        return self.numerator != other.numerator or self.denominator != other.denominator
+
+    def simplify(self):
+        divisor = legacy_gcd(self.numerator, self.denominator)
+        return LegacyFraction(self.numerator / divisor, self.denominator / divisor)
+
+    def add(self, other):
+        denominator = self.denominator * other.denominator / legacy_gcd(self.denominator, other.denominator)
+        numerator = denominator / self.denominator * self.numerator + denominator / other.denominator * other.numerator
+        return LegacyFraction(numerator, denominator).simplify()
+
+    def negate(self):
+        return LegacyFraction(-self.numerator, self.denominator).simplify()
+
+
+def time_reduction(rows, fraction_type):
+    rows = [[fraction_type(value, 1) for value in row] for row in rows]
+    start = time.perf_counter()
+    pivoted_reduction(rows, len(rows[0]))
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    print('{0:>6} {1:>14} {2:>14} {3:>10}'.format('n', 'legacy (s)', 'Fraction (s)', 'speedup'))
+    for size in sizes:
+        rows = [[random.randint(-9, 9) for _ in range(size + 1)] for _ in range(size)]
+        legacy = time_reduction(rows, LegacyFraction)
+        current = time_reduction(rows, Fraction)
+        print('{0:>6} {1:>14.4f} {2:>14.4f} {3:>10.1f}'.format(size, legacy, current, legacy / current))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,41 @@
+import sys
+import time
+
+from functions import Variable, Constant, Product, Sum, Power
+
+DEPTHS = [2, 4, 8, 16, 32]
+
+
+def deep_expression(depth):
+    x = Variable('x')
+    function = x
+    for level in range(depth):
+        function = Sum([Product([Constant(1.0 + level / 10.0), function]),
+                        Power(Sum([x, Constant(level)]), 2), Product([Constant(2), Constant(0.5)])])
+    return function
+
+
+def time_calls(function, values):
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return time.perf_counter() - start
+
+
+def main(depths, evaluations=10000):
+    values = [i / evaluations for i in range(evaluations)]
+    print('{0:>6} {1:>14} {2:>14} {3:>14} {4:>10}'.format('depth', 'tree-walk (s)', 'compile (s)', 'compiled (s)',
+                                                          'speedup'))
+    for depth in depths:
+        function = deep_expression(depth)
+        start = time.perf_counter()
+        compiled = function.compile()
+        compile_time = time.perf_counter() - start
+        tree_time = time_calls(function.evaluate, values)
+        compiled_time = time_calls(compiled, values)
+        print('{0:>6} {1:>14.4f} {2:>14.4f} {3:>14.4f} {4:>10.1f}'.format(
+            depth, tree_time, compile_time, compiled_time, tree_time / compiled_time))
+
+
+if __name__ == '__main__':
+    main([int(depth) for depth in sys.argv[1:]] or DEPTHS)
@@ -0,0 +1,49 @@
+import math
+import sys
+import time
+import tracemalloc
+
+from functions import Variable, Constant, Product, Sum, Power, Exponential
+
+ORDERS = [2, 4, 6, 8]
+
+
+def base_expression():
+    x = Variable('x')
+    return Sum([Product([Power(x, 3), Exponential(math.e, x)]), Product([Constant(2.0), Power(x, 2)])])
+
+
+def count_nodes(function):
+    tree, unique, stack = 0, set(), [function]
+    while stack:
+        node = stack.pop()
+        tree += 1
+        unique.add(id(node))
+        stack.extend(node.children())
+    return tree, len(unique)
+
+
+def derivative_chain(order):
+    function = base_expression()
+    for _ in range(order):
+        function = function.derivative()
+    return function
+
+
+def main(orders):
+    print('{0:>6} {1:>12} {2:>12} {3:>12} {4:>14}'.format('order', 'tree nodes', 'unique nodes', 'time (s)',
+                                                          'peak (KiB)'))
+    for order in orders:
+        start = time.perf_counter()
+        function = derivative_chain(order)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        derivative_chain(order)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        tree, unique = count_nodes(function)
+        print('{0:>6} {1:>12} {2:>12} {3:>12.4f} {4:>14.1f}'.format(order, tree, unique, elapsed, peak / 1024.0))
+
+
+if __name__ == '__main__':
+    main([int(order) for order in sys.argv[1:]] or ORDERS)
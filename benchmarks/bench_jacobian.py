@@ -0,0 +1,40 @@
+import math
+import sys
+import time
+
+from functions import Variable, Constant, Product, Sum, Power, Exponential
+from jacobian import Jacobian
+
+SIZES = [2, 4, 8]
+
+
+def system(size):
+    variables = [Variable('x{0}'.format(i)) for i in range(size)]
+    functions = []
+    for i, variable in enumerate(variables):
+        neighbour = variables[(i + 1) % size]
+        functions.append(Sum([Product([variable, neighbour, Constant(i + 1)]), Power(Sum(variables), 2),
+                              Exponential(math.e, Product([Constant(0.1), neighbour]))]))
+    return functions, [variable.name for variable in variables]
+
+
+def main(sizes, evaluations=1000):
+    print('{0:>6} {1:>14} {2:>14} {3:>10}'.format('size', 'tree-walk (s)', 'compiled (s)', 'speedup'))
+    for size in sizes:
+        functions, names = system(size)
+        jacobian = Jacobian(functions, names)
+        points = [[(i + j) / float(evaluations) for j in range(size)] for i in range(evaluations)]
+        start = time.perf_counter()
+        for point in points:
+            binding = dict(zip(names, point))
+            [[partial.evaluate(binding) for partial in row] for row in jacobian.partials]
+        tree_time = time.perf_counter() - start
+        start = time.perf_counter()
+        jacobian.evaluate_many(points)
+        compiled_time = time.perf_counter() - start
+        print('{0:>6} {1:>14.4f} {2:>14.4f} {3:>10.1f}'.format(size, tree_time, compiled_time,
+                                                              tree_time / compiled_time))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,46 @@
+import random
+import sys
+import time
+
+from lazy import Evaluator, lazy
+from matrix import Matrix
+
+SIZES = [32, 64, 128, 256]
+
+
+def random_matrix(m, n, engine):
+    return Matrix([[random.random() for _ in range(n)] for _ in range(m)], data_type=float, engine=engine)
+
+
+def timed(call):
+    start = time.perf_counter()
+    call()
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    random.seed(0)
+    print('{0:>6} {1:>8} {2:>24} {3:>12} {4:>12} {5:>8}'.format(
+        'n', 'engine', 'expression', 'eager (s)', 'lazy (s)', 'allocs'))
+    for size in sizes:
+        for engine in ('python', None):
+            a, b, c, d = [random_matrix(size, size, engine) for _ in range(4)]
+            thin = random_matrix(size, 4, engine)
+            wide = random_matrix(4, size, engine)
+            cases = [
+                ('A*B + 2*C - D', lambda: a.multiply(b).add(c.scalar_multiplication(2)).subtract(d),
+                 lazy(a) * b + 2 * lazy(c) - d),
+                ('A + 0.5*B - C + D', lambda: a.add(b.scalar_multiplication(0.5)).subtract(c).add(d),
+                 lazy(a) + lazy(b) * 0.5 - c + d),
+                ('(A*B)*thin', lambda: a.multiply(b).multiply(thin), lazy(a) * b * thin),
+                ('thin*wide*A', lambda: thin.multiply(wide).multiply(a), lazy(thin) * wide * a),
+            ]
+            for name, eager, expression in cases:
+                evaluator = Evaluator()
+                print('{0:>6} {1:>8} {2:>24} {3:>12.4f} {4:>12.4f} {5:>8}'.format(
+                    size, engine or 'auto', name, timed(eager), timed(lambda: evaluator.evaluate(expression)),
+                    evaluator.allocations))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,38 @@
+import sys
+import time
+
+from functions import Variable, Constant, Product, Sum, Power, cache_info, clear_cache, set_cache_size, \
+    DEFAULT_CACHE_SIZE
+
+DEPTHS = [1, 2, 3, 4]
+
+
+def nested_product(depth):
+    x = Variable('x')
+    function = x
+    for level in range(depth):
+        function = Product([Sum([function, Constant(level + 1)]), Power(x, 2), function])
+    return function
+
+
+def time_derivative(function, size):
+    set_cache_size(size)
+    clear_cache()
+    start = time.perf_counter()
+    function.derivative().derivative()
+    return time.perf_counter() - start, cache_info()
+
+
+def main(depths):
+    print('{0:>6} {1:>14} {2:>14} {3:>10} {4:>10} {5:>10}'.format('depth', 'node memo (s)', 'with LRU (s)', 'speedup',
+                                                                   'hits', 'misses'))
+    for depth in depths:
+        function = nested_product(depth)
+        node_memo, _ = time_derivative(function, 0)
+        cached, info = time_derivative(function, DEFAULT_CACHE_SIZE)
+        print('{0:>6} {1:>14.4f} {2:>14.4f} {3:>10.1f} {4:>10} {5:>10}'.format(
+            depth, node_memo, cached, node_memo / cached, info['hits'], info['misses']))
+
+
+if __name__ == '__main__':
+    main([int(depth) for depth in sys.argv[1:]] or DEPTHS)
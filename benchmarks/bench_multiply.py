@@ -0,0 +1,30 @@
+import random
+import sys
+import time
+
+from matrix import Matrix
+
+SIZES = [16, 32, 64, 128, 256, 512]
+
+
+def time_multiply(first, second, algorithm):
+    start = time.perf_counter()
+    first.multiply(second, algorithm=algorithm)
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    columns = ['naive', 'blocked', 'strassen', 'parallel']
+    print('{0:>6} {1}'.format('n', ' '.join('{0:>12}'.format(column + ' (s)') for column in columns + ['auto'])))
+    for size in sizes:
+        first = Matrix([[random.random() for _ in range(size)] for _ in range(size)], engine='python')
+        second = Matrix([[random.random() for _ in range(size)] for _ in range(size)], engine='python')
+        timings = [time_multiply(first, second, algorithm) if algorithm != 'naive' or size <= 256 else None
+                   for algorithm in columns]
+        timings.append(time_multiply(first, second, None))
+        print('{0:>6} {1}'.format(size, ' '.join(
+            '{0:>12.4f}'.format(timing) if timing is not None else '{0:>12}'.format('-') for timing in timings)))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
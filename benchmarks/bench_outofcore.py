@@ -0,0 +1,57 @@
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from matrix import Matrix
+from outofcore import multiply_files
+from serialization import MatrixWriter
+
+SIZE = 256
+BUDGETS = [2 ** 16, 2 ** 18, 2 ** 20, 2 ** 22]
+
+
+def write_random(path, size):
+    with MatrixWriter(path, size, float) as writer:
+        for _ in range(size):
+            writer.write_row([random.random() for _ in range(size)])
+
+
+def main(size, budgets):
+    random.seed(0)
+    directory = tempfile.mkdtemp()
+    first, second, output = [os.path.join(directory, name) for name in ('a.bin', 'b.bin', 'c.bin')]
+    try:
+        write_random(first, size)
+        write_random(second, size)
+        print('{0:>12} {1:>6} {2:>8} {3:>12} {4:>12} {5:>12} {6:>10}'.format(
+            'budget', 'tile', 'tiles', 'read (MiB)', 'written', 'peak (MiB)', 'time (s)'))
+        for budget in budgets:
+            multiply_files(first, second, output, budget)
+            tracemalloc.start()
+            start = time.perf_counter()
+            report = multiply_files(first, second, output, budget)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print('{0:>12} {1:>6} {2:>8} {3:>12.2f} {4:>12.2f} {5:>12.2f} {6:>10.3f}'.format(
+                budget, report['tile_size'], report['tiles'], report['bytes_read'] / 2.0 ** 20,
+                report['bytes_written'] / 2.0 ** 20, peak / 2.0 ** 20, elapsed))
+        tracemalloc.start()
+        start = time.perf_counter()
+        Matrix([[random.random() for _ in range(size)] for _ in range(size)]).multiply(
+            Matrix([[random.random() for _ in range(size)] for _ in range(size)]))
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print('{0:>12} {1:>6} {2:>8} {3:>12} {4:>12} {5:>12.2f} {6:>10.3f}'.format(
+            'in-memory', '-', '-', '-', '-', peak / 2.0 ** 20, elapsed))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE, [int(budget) for budget in sys.argv[2:]] or BUDGETS)
@@ -0,0 +1,40 @@
+import random
+import sys
+import time
+
+from functions import Variable, Constant, Product, Sum, Power
+from polynomial import Polynomial, naive_convolve, karatsuba_convolve
+
+DEGREES = [64, 256, 1024]
+
+
+def timed(function, *arguments):
+    start = time.perf_counter()
+    result = function(*arguments)
+    return time.perf_counter() - start, result
+
+
+def main(degrees, evaluations=1000):
+    random.seed(0)
+    print('{0:>6} {1:>12} {2:>14} {3:>12} {4:>14} {5:>12}'.format('degree', 'naive (s)', 'karatsuba (s)', 'tree (s)',
+                                                                   'compiled (s)', 'horner (s)'))
+    x = Variable('x')
+    values = [i / evaluations for i in range(evaluations)]
+    for degree in degrees:
+        first = [random.randint(-100, 100) for _ in range(degree + 1)]
+        second = [random.randint(-100, 100) for _ in range(degree + 1)]
+        naive_time, expected = timed(naive_convolve, first, second)
+        karatsuba_time, result = timed(karatsuba_convolve, first, second)
+        assert result == expected
+        polynomial = Polynomial([float(value) for value in first])
+        function = Sum([Product([Constant(value), Power(x, exponent)]) for exponent, value in enumerate(first)])
+        tree_time, _ = timed(lambda: [function.evaluate(value) for value in values])
+        compiled = function.compile()
+        compiled_time, _ = timed(lambda: [compiled(value) for value in values])
+        horner_time, _ = timed(lambda: [polynomial.evaluate(value) for value in values])
+        print('{0:>6} {1:>12.4f} {2:>14.4f} {3:>12.4f} {4:>14.4f} {5:>12.4f}'.format(
+            degree, naive_time, karatsuba_time, tree_time, compiled_time, horner_time))
+
+
+if __name__ == '__main__':
+    main([int(degree) for degree in sys.argv[1:]] or DEGREES)
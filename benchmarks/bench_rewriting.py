@@ -0,0 +1,41 @@
+import sys
+import time
+
+from functions import Variable, Constant, Product, Sum, Power, clear_cache
+from rewriting import RewriteEngine, STANDARD_RULES
+
+SIZES = [10, 50, 200]
+
+
+def expanded_expression(size):
+    x = Variable('x')
+    y = Variable('y')
+    terms = []
+    for i in range(size):
+        terms.append(Product([Constant(i + 1), x, Power(x, i % 4), Sum([y, y])]))
+        terms.append(Product([Power(Product([Constant(i + 2), x]), 2), Constant(-1)]))
+    return Sum([Sum(terms[:size]), Sum(terms[size:])])
+
+
+def timed(function, argument):
+    start = time.perf_counter()
+    result = function(argument)
+    return time.perf_counter() - start, result
+
+
+def main(sizes):
+    print('{0:>6} {1:>12} {2:>14} {3:>14} {4:>14} {5:>12}'.format('size', 'nodes', 'simplify (s)', 'normalize (s)',
+                                                                   'warm (s)', 'normal nodes'))
+    for size in sizes:
+        function = expanded_expression(size)
+        clear_cache()
+        simplify_time, _ = timed(lambda f: f.simplify(), function)
+        engine = RewriteEngine(STANDARD_RULES)
+        normalize_time, normal = timed(engine.normalize, function)
+        warm_time, _ = timed(engine.normalize, function)
+        print('{0:>6} {1:>12} {2:>14.4f} {3:>14.4f} {4:>14.6f} {5:>12}'.format(
+            size, len(function.nodes()), simplify_time, normalize_time, warm_time, len(normal.nodes())))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
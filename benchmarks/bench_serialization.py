@@ -0,0 +1,44 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from matrix import Matrix
+from serialization import load_matrix, save_matrix
+
+SIZES = [256, 1024, 2048]
+
+
+def timed(function, *arguments):
+    start = time.perf_counter()
+    result = function(*arguments)
+    return time.perf_counter() - start, result
+
+
+def main(sizes, samples=100):
+    random.seed(0)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'matrix.bin')
+    print('{0:>6} {1:>10} {2:>10} {3:>12} {4:>10} {5:>12} {6:>12}'.format(
+        'n', 'MiB', 'save (s)', 'str (s)', 'read (s)', 'mmap (s)', 'rows (s)'))
+    try:
+        for size in sizes:
+            matrix = Matrix([[random.random() for _ in range(size)] for _ in range(size)], data_type=float)
+            save_time, _ = timed(save_matrix, matrix, path)
+            text_time, _ = timed(str, matrix)
+            read_time, _ = timed(load_matrix, path)
+            mmap_time, mapped = timed(load_matrix, path, 'r')
+            rows = [random.randrange(size) for _ in range(samples)]
+            rows_time, _ = timed(lambda: [sum(mapped.data[i]) for i in rows])
+            del mapped
+            print('{0:>6} {1:>10.1f} {2:>10.4f} {3:>12.4f} {4:>10.4f} {5:>12.6f} {6:>12.4f}'.format(
+                size, os.path.getsize(path) / 2.0 ** 20, save_time, text_time, read_time, mmap_time, rows_time))
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+        os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,47 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from matrix import Matrix
+from sparse import CSRMatrix
+
+DENSITIES = [0.001, 0.01, 0.05, 0.1, 0.3]
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def random_sparse_rows(size, density):
+    return [[random.random() if random.random() < density else 0.0 for _ in range(size)] for _ in range(size)]
+
+
+def allocated(function):
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main(size, densities):
+    print('n = {0}'.format(size))
+    print('{0:>8} {1:>10} {2:>10} {3:>12} {4:>12} {5:>12}'.format(
+        'density', 'dense MB', 'csr MB', 'dense*dense', 'csr*dense', 'csr*csr'))
+    for density in densities:
+        first, dense_size = allocated(lambda: Matrix(random_sparse_rows(size, density), engine='python'))
+        second = Matrix(random_sparse_rows(size, density), engine='python')
+        first_csr, csr_size = allocated(lambda: CSRMatrix.from_matrix(first))
+        second_csr = CSRMatrix.from_matrix(second)
+        _, dense_time = timed(lambda: first.multiply(second))
+        _, mixed_time = timed(lambda: first_csr.multiply(second))
+        _, sparse_time = timed(lambda: first_csr.multiply(second_csr))
+        print('{0:>8} {1:>10.2f} {2:>10.2f} {3:>12.4f} {4:>12.4f} {5:>12.4f}'.format(
+            density, dense_size / 1e6, csr_size / 1e6, dense_time, mixed_time, sparse_time))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300, [float(value) for value in sys.argv[2:]] or DENSITIES)
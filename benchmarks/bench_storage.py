@@ -0,0 +1,37 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from matrix import Matrix
+
+SIZES = [100, 250, 500, 1000]
+
+
+def measure(function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(sizes):
+    print('{0:>6} {1:>10} {2:>10} {3:>14} {4:>10} {5:>10}'.format(
+        'n', 'backend', 'scale MB', 'copy+add (s)', 'transp (s)', 'peak MB'))
+    for size in sizes:
+        rows = [[random.random() for _ in range(size)] for _ in range(size)]
+        for backend, data_type in (('lists', None), ('packed', float)):
+            matrix = Matrix([list(row) for row in rows], data_type=data_type)
+            _, _, scale_peak = measure(lambda: matrix.scalar_multiplication(2.0))
+            _, add_time, add_peak = measure(lambda: matrix.copy().add(matrix))
+            _, transpose_time, transpose_peak = measure(matrix.transpose)
+            print('{0:>6} {1:>10} {2:>10.2f} {3:>14.4f} {4:>10.4f} {5:>10.2f}'.format(
+                size, backend, scale_peak / 1e6, add_time, transpose_time,
+                max(add_peak, transpose_peak) / 1e6))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
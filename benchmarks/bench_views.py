@@ -0,0 +1,53 @@
+import random
+import sys
+import time
+
+from matrix import Matrix
+
+SIZES = [64, 256, 1024]
+COFACTOR_SIZE = 7
+
+
+def timed(call, number=20):
+    start = time.perf_counter()
+    for _ in range(number):
+        call()
+    return (time.perf_counter() - start) / number
+
+
+def cofactor_determinant(matrix, minor):
+    row = list(matrix.data[0])
+    if matrix.m == 1:
+        return row[0]
+    return sum((-1) ** j * row[j] * cofactor_determinant(minor(matrix, j), minor)
+               for j in range(matrix.n) if row[j] != 0)
+
+
+def copied_minor(matrix, column):
+    return Matrix([[value for j, value in enumerate(row) if j != column] for row in list(matrix.data)[1:]],
+                  data_type=matrix.data_type)
+
+
+def main(sizes):
+    random.seed(0)
+    print('{0:>6} {1:>16} {2:>12} {3:>12}'.format('n', 'operation', 'view (s)', 'copy (s)'))
+    for size in sizes:
+        matrix = Matrix([[random.random() for _ in range(size)] for _ in range(size)], data_type=float)
+        half = size // 2
+        cases = [
+            ('transpose', lambda: matrix.transpose(view=True), lambda: matrix.transpose()),
+            ('block', lambda: matrix[:half, half:], lambda: matrix[:half, half:].copy()),
+            ('minor', lambda: matrix.minor(half, half), lambda: matrix.remove_row(half).remove_column(half)),
+        ]
+        for name, view, copy in cases:
+            print('{0:>6} {1:>16} {2:>12.6f} {3:>12.6f}'.format(size, name, timed(view), timed(copy)))
+    matrix = Matrix([[random.randint(-9, 9) for _ in range(COFACTOR_SIZE)] for _ in range(COFACTOR_SIZE)],
+                    data_type=int)
+    print('{0:>6} {1:>16} {2:>12.6f} {3:>12.6f}'.format(
+        COFACTOR_SIZE, 'cofactor det',
+        timed(lambda: cofactor_determinant(matrix, lambda m, j: m.minor(0, j)), 1),
+        timed(lambda: cofactor_determinant(matrix, copied_minor), 1)))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
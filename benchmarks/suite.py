@@ -0,0 +1,136 @@
+"""Run from the repository root with ``python -m benchmarks.suite``."""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+
+from benchmarks.bench_functions import deep_expression
+from functions import clear_cache
+from matrix import Matrix, Fraction
+
+SIZES = [8, 16, 32]
+DEPTHS = [4, 8, 16]
+DATA_TYPES = {'int': int, 'float': float, 'Fraction': Fraction}
+MATRIX_OPERATIONS = {
+    'multiply': lambda matrix, other: matrix.multiply(other),
+    'det': lambda matrix, other: matrix.det(),
+    'inverse': lambda matrix, other: matrix.inverse(),
+    'gauss_jordan_reduction': lambda matrix, other: matrix.gauss_jordan_reduction(),
+    'transpose': lambda matrix, other: matrix.transpose(),
+}
+FUNCTION_OPERATIONS = ('evaluate', 'simplify', 'derivative')
+THRESHOLD = 0.25
+MINIMUM_TIME = 0.05
+
+
+def random_matrix(size, data_type):
+    rows = [[random.randint(-10, 10) for _ in range(size)] for _ in range(size)]
+    for i in range(size):
+        rows[i][i] = 11 * size
+    if data_type == float:
+        return Matrix([[float(value) for value in row] for row in rows], data_type=float)
+    return Matrix(rows, data_type=data_type)
+
+
+def matrix_cases(sizes, data_types):
+    for name, operation in sorted(MATRIX_OPERATIONS.items()):
+        for type_name in data_types:
+            for size in sizes:
+                matrix = random_matrix(size, DATA_TYPES[type_name])
+                other = random_matrix(size, DATA_TYPES[type_name])
+                yield ('matrix.' + name, {'n': size, 'type': type_name},
+                       lambda operation=operation, matrix=matrix, other=other: operation(matrix, other))
+
+
+def function_cases(depths):
+    for operation in FUNCTION_OPERATIONS:
+        for depth in depths:
+            function = deep_expression(depth)
+            if operation == 'evaluate':
+                call = lambda function=function: function.evaluate(0.75)
+            else:
+                call = lambda function=function, operation=operation: (clear_cache(), getattr(function, operation)())
+            yield 'function.' + operation, {'depth': depth}, call
+
+
+def measure(call, repeat=5, minimum=MINIMUM_TIME):
+    timer = timeit.Timer(call)
+    number = 1
+    while timer.timeit(number) < minimum:
+        number *= 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number, number
+
+
+def case_key(name, parameters):
+    return '{0}[{1}]'.format(name, ','.join('{0}={1}'.format(key, parameters[key]) for key in sorted(parameters)))
+
+
+def run(sizes=None, depths=None, data_types=None, repeat=5, seed=0, minimum=MINIMUM_TIME, log=None):
+    random.seed(seed)
+    cases = list(matrix_cases(sizes or SIZES, data_types or sorted(DATA_TYPES))) + list(
+        function_cases(depths or DEPTHS))
+    results = []
+    for name, parameters, call in cases:
+        seconds, number = measure(call, repeat, minimum)
+        results.append({'name': name, 'parameters': parameters, 'key': case_key(name, parameters),
+                        'seconds': seconds, 'number': number, 'repeat': repeat})
+        if log is not None:
+            log('{0:<60} {1:>14.6f} ms'.format(results[-1]['key'], seconds * 1000))
+    return {'python': platform.python_version(), 'platform': platform.platform(), 'created': time.time(),
+            'results': results}
+
+
+def compare(report, baseline, threshold=THRESHOLD):
+    previous = {result['key']: result['seconds'] for result in baseline['results']}
+    comparisons = []
+    for result in report['results']:
+        if result['key'] not in previous:
+            continue
+        ratio = result['seconds'] / previous[result['key']] if previous[result['key']] > 0 else float('inf')
+        comparisons.append({'key': result['key'], 'baseline': previous[result['key']], 'seconds': result['seconds'],
+                            'ratio': ratio, 'regression': ratio > 1.0 + threshold})
+    return comparisons
+
+
+def save(report, path):
+    with open(path, 'w') as output:
+        json.dump(report, output, indent=2, sort_keys=True)
+
+
+def load(path):
+    with open(path) as source:
+        return json.load(source)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite',
+                                     description='Time Matrix and Function hot paths.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--depths', type=int, nargs='+', default=DEPTHS)
+    parser.add_argument('--types', nargs='+', choices=sorted(DATA_TYPES), default=sorted(DATA_TYPES))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='compare against the results stored in this JSON file')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='relative slowdown that counts as a regression')
+    options = parser.parse_args(arguments)
+    report = run(options.sizes, options.depths, options.types, options.repeat, log=print)
+    if options.output:
+        save(report, options.output)
+    if not options.baseline:
+        return 0
+    comparisons = compare(report, load(options.baseline), options.threshold)
+    regressions = [comparison for comparison in comparisons if comparison['regression']]
+    for comparison in regressions:
+        print('REGRESSION {0}: {1:.6f} ms -> {2:.6f} ms ({3:.2f}x)'.format(
+            comparison['key'], comparison['baseline'] * 1000, comparison['seconds'] * 1000, comparison['ratio']))
+    print('{0} of {1} benchmarks regressed by more than {2:.0%}.'.format(len(regressions), len(comparisons),
+                                                                         options.threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
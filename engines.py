@@ -0,0 +1,171 @@
+from array import array
+
+from storage import PackedStorage, PACKED_TYPECODES, is_packed, is_view
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+ENGINES = ('auto', 'python', 'numpy')
+AUTO_THRESHOLD = 32768
+INT64_LIMIT = 2 ** 63 - 1
+
+
+class EngineNotAvailableException(Exception):
+    pass
+
+
+_engine = 'auto'
+
+
+def numpy_available():
+    return numpy is not None
+
+
+def check_engine(name):
+    if name not in ENGINES:
+        raise EngineNotAvailableException('Unknown engine {0}, expected one of {1}.'.format(name, ENGINES))
+    if name == 'numpy' and numpy is None:
+        raise EngineNotAvailableException('The numpy engine requires numpy to be installed.')
+    return name
+
+
+def set_engine(name):
+    global _engine
+    _engine = check_engine(name)
+
+
+def get_engine():
+    return _engine
+
+
+def select_engine(matrices, work):
+    name = _engine
+    for matrix in matrices:
+        if matrix.engine is not None:
+            name = matrix.engine
+            break
+    if name == 'python' or numpy is None:
+        return None
+    if name == 'auto' and work < AUTO_THRESHOLD:
+        return None
+    return NUMPY_ENGINE
+
+
+def dispatch(operation, work, matrices, *arguments):
+    engine = select_engine(matrices, work)
+    if engine is None:
+        return NotImplemented
+    arrays = [engine.as_array(matrix) for matrix in matrices]
+    if any(value is None for value in arrays):
+        return NotImplemented
+    result = getattr(engine, operation)(*(arrays + list(arguments)))
+    if result is NotImplemented or not isinstance(result, numpy.ndarray):
+        return result
+    return engine.from_array(result, all(matrix.data_type in PACKED_TYPECODES for matrix in matrices))
+
+
+def index_selection(indices):
+    if isinstance(indices, range):
+        return slice(indices.start, indices.stop if indices.stop >= 0 else None, indices.step)
+    return list(indices)
+
+
+class NumPyEngine(object):
+    name = 'numpy'
+
+    def as_array(self, matrix):
+        if matrix.m == 0 or matrix.n == 0:
+            return None
+        return self.storage_array(matrix.data, matrix.data_type)
+
+    def storage_array(self, data, data_type):
+        if is_view(data):
+            if data.materialized is not None:
+                return self.storage_array(data.materialized, data_type)
+            values = self.storage_array(data.source, data_type)
+            if values is None:
+                return None
+            values = values[index_selection(data.rows)][:, index_selection(data.columns)]
+            return values.T if data.transposed else values
+        if is_packed(data):
+            return numpy.frombuffer(data.buffer, dtype=data.typecode).reshape(data.m, data.n)
+        if data_type is not None:
+            return None
+        values = numpy.array(data)
+        if values.ndim != 2 or values.dtype.kind not in 'if':
+            return None
+        if values.dtype.kind == 'f' and not all(isinstance(value, float) for row in data for value in row):
+            return None
+        return values
+
+    def from_array(self, values, packed):
+        if not packed:
+            return values.tolist()
+        data_type = int if values.dtype.kind == 'i' else float
+        typecode = PACKED_TYPECODES[data_type]
+        buffer = array(typecode)
+        buffer.frombytes(numpy.ascontiguousarray(values, dtype=typecode).tobytes())
+        return PackedStorage(values.shape[0], values.shape[1], typecode, buffer)
+
+    @staticmethod
+    def magnitude(values):
+        return int(numpy.abs(values).max()) if values.size > 0 else 0
+
+    def multiply(self, first, second):
+        if first.dtype.kind == 'i' and second.dtype.kind == 'i' and \
+                self.magnitude(first) * self.magnitude(second) * first.shape[1] > INT64_LIMIT:
+            return NotImplemented
+        return numpy.matmul(first, second)
+
+    def add(self, first, second):
+        if first.dtype.kind == 'i' and second.dtype.kind == 'i' and \
+                self.magnitude(first) + self.magnitude(second) > INT64_LIMIT:
+            return NotImplemented
+        return first + second
+
+    def subtract(self, first, second):
+        if first.dtype.kind == 'i' and second.dtype.kind == 'i' and \
+                self.magnitude(first) + self.magnitude(second) > INT64_LIMIT:
+            return NotImplemented
+        return first - second
+
+    def scalar_multiplication(self, values, scalar):
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        if values.dtype.kind == 'i' and isinstance(scalar, int) and abs(scalar) * self.magnitude(values) > INT64_LIMIT:
+            return NotImplemented
+        return values * scalar
+
+    def linear_combination(self, *arguments):
+        arrays, coefficients = arguments[:-1], arguments[-1]
+        if not all(isinstance(coefficient, (int, float)) for coefficient in coefficients):
+            return NotImplemented
+        if all(values.dtype.kind == 'i' for values in arrays) and all(isinstance(c, int) for c in coefficients) and \
+                sum(abs(c) * self.magnitude(values) for c, values in zip(coefficients, arrays)) > INT64_LIMIT:
+            return NotImplemented
+        floating = any(values.dtype.kind == 'f' for values in arrays) or \
+            any(isinstance(coefficient, float) for coefficient in coefficients)
+        result = arrays[0] * (float(coefficients[0]) if floating else coefficients[0])
+        for values, coefficient in zip(arrays[1:], coefficients[1:]):
+            result += values * coefficient if coefficient != 1 else values
+        return result
+
+    def transpose(self, values):
+        return values.T
+
+    def inverse(self, values):
+        try:
+            return numpy.linalg.inv(values.astype(float))
+        except numpy.linalg.LinAlgError:
+            return NotImplemented
+
+    def det(self, values):
+        if values.dtype.kind != 'f':
+            return NotImplemented
+        return float(numpy.linalg.det(values))
+
+
+NUMPY_ENGINE = NumPyEngine()
@@ -0,0 +1,115 @@
+import sys
+from functools import reduce
+
+from storage import promote
+
+
+class SingularMatrixException(Exception):
+    pass
+
+
+def is_inexact(rows):
+    return any(isinstance(value, (int, float, complex)) for row in rows for value in row)
+
+
+class LUFactorization(object):
+    def __init__(self, rows):
+        self.lu = [list(row) for row in rows]
+        self.m = len(self.lu)
+        self.n = len(self.lu[0]) if self.m > 0 else 0
+        self.permutation = list(range(self.m))
+        self.pivot_columns = []
+        self.sign = 1
+        self.inexact = is_inexact(self.lu)
+        largest = max((abs(value) for row in self.lu for value in row), default=0) if self.inexact else 0
+        self.tolerance = max(self.m, self.n) * sys.float_info.epsilon * largest
+        self.decompose()
+
+    def is_zero(self, value):
+        return abs(value) <= self.tolerance if self.inexact else value == 0
+
+    def choose_pivot(self, row, column):
+        if self.inexact:
+            pivot = max(range(row, self.m), key=lambda k: abs(self.lu[k][column]))
+            return pivot if not self.is_zero(self.lu[pivot][column]) else None
+        for k in range(row, self.m):
+            if self.lu[k][column] != 0:
+                return k
+        return None
+
+    def decompose(self):
+        lu = self.lu
+        row = 0
+        for column in range(self.n):
+            if row == self.m:
+                break
+            pivot = self.choose_pivot(row, column)
+            if pivot is None:
+                continue
+            if pivot != row:
+                lu[row], lu[pivot] = lu[pivot], lu[row]
+                self.permutation[row], self.permutation[pivot] = self.permutation[pivot], self.permutation[row]
+                self.sign = -self.sign
+            pivot_row = lu[row]
+            pivot_value = pivot_row[column]
+            for k in range(row + 1, self.m):
+                current = lu[k]
+                if current[column] == 0:
+                    continue
+                factor = current[column] / pivot_value
+                current[column] = factor
+                for j in range(column + 1, self.n):
+                    current[j] -= factor * pivot_row[j]
+            self.pivot_columns.append(column)
+            row += 1
+
+    @property
+    def rank(self):
+        return len(self.pivot_columns)
+
+    @property
+    def is_singular(self):
+        return self.m != self.n or self.rank < self.n
+
+    def det(self):
+        if self.m != self.n:
+            raise SingularMatrixException('The determinant is only defined for square matrices.')
+        if self.rank < self.n:
+            return 0.0 if self.inexact else 0
+        result = self.lu[0][0] if self.n > 0 else 1
+        for i in range(1, self.n):
+            result = result * self.lu[i][i]
+        return result if self.sign == 1 else -result
+
+    def solve_vector(self, b):
+        lu = self.lu
+        n = self.n
+        y = [b[self.permutation[i]] for i in range(n)]
+        for i in range(n):
+            row = lu[i]
+            value = y[i]
+            for k in range(i):
+                value -= row[k] * y[k]
+            y[i] = value
+        for i in range(n - 1, -1, -1):
+            row = lu[i]
+            value = y[i]
+            for k in range(i + 1, n):
+                value -= row[k] * y[k]
+            y[i] = value / row[i]
+        return y
+
+    def solve(self, b):
+        if self.is_singular:
+            raise SingularMatrixException('Cannot solve a system with a singular or non-square coefficient matrix.')
+        if hasattr(b, 'data'):
+            if b.m != self.n:
+                raise ValueError('The right hand side must have {0} rows.'.format(self.n))
+            columns = [self.solve_vector([b.data[i][j] for i in range(b.m)]) for j in range(b.n)]
+            rows = [[column[i] for column in columns] for i in range(self.n)]
+            data_type = reduce(promote, set(type(value) for column in columns for value in column), b.data_type)
+            return b.__class__(rows, data_type=data_type, engine=b.engine)
+        b = list(b)
+        if len(b) != self.n:
+            raise ValueError('The right hand side must have {0} entries.'.format(self.n))
+        return self.solve_vector(b)
@@ -1,29 +1,344 @@
+import inspect
 import math
+import weakref
+from array import array
+from collections import OrderedDict
+from functools import wraps
+from operator import add, mul
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class OperationNotSupportedException(Exception):
     pass
 
 
+def is_array(values):
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def constant_batch(value, values):
+    if isinstance(values, dict):
+        values = next(iter(values.values()), ())
+    return numpy.full(len(values), value) if is_array(values) else [value] * len(values)
+
+
+def combine_batches(operator, first, second):
+    return operator(first, second) if is_array(first) else list(map(operator, first, second))
+
+
+class CompilationContext(object):
+    def __init__(self, variables=None):
+        self.constants = {}
+        self.lines = []
+        self.folded = {}
+        self.variables = None if variables is None else list(variables)
+
+    def variable(self, name):
+        if self.variables is None:
+            return 'value'
+        if name not in self.variables:
+            raise ValueError('Variable {0} is not one of the compiled arguments.'.format(name))
+        return 'v{0}'.format(self.variables.index(name))
+
+    def signature(self):
+        if self.variables is None:
+            return 'value'
+        return ', '.join('v{0}'.format(i) for i in range(len(self.variables)))
+
+    def function(self, result):
+        source = 'def compiled({0}):\n{1}    return {2}\n'.format(self.signature(), ''.join(self.lines), result)
+        namespace = self.namespace()
+        exec(source, namespace)
+        compiled = namespace['compiled']
+        compiled.source = source
+        return compiled
+
+    def constant(self, value):
+        name = 'c{0}'.format(len(self.constants))
+        self.constants[name] = value
+        return name
+
+    def namespace(self):
+        return dict(self.constants, log=math.log)
+
+    def fold(self, function):
+        if not isinstance(function, Function):
+            return self.constant(function)
+        if id(function) in self.folded:
+            return self.folded[id(function)][1]
+        expression = function.code(self)
+        children = function.children()
+        if not children or expression in self.constants:
+            name = expression
+        elif all(self.fold(child) in self.constants for child in children):
+            try:
+                name = self.constant(eval(expression, self.namespace()))
+            except (ArithmeticError, ValueError, TypeError):
+                name = self.assign(expression)
+        else:
+            name = self.assign(expression)
+        self.folded[id(function)] = (function, name)
+        return name
+
+    def assign(self, expression):
+        name = 't{0}'.format(len(self.lines))
+        self.lines.append('    {0} = {1}\n'.format(name, expression))
+        return name
+
+
+INTERNED = weakref.WeakValueDictionary()
+
+
+def identity_key(value):
+    if isinstance(value, Function):
+        return id(value)
+    if isinstance(value, tuple):
+        return tuple(id(item) if isinstance(item, Function) else identity_key(item) for item in value)
+    return type(value), repr(value)
+
+
+def structural_hash(value):
+    if isinstance(value, Function):
+        return value.hash_value
+    if isinstance(value, tuple):
+        return hash(tuple(map(structural_hash, value)))
+    return hash(value)
+
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class ExpressionCache(object):
+    def __init__(self, size=DEFAULT_CACHE_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, operation, function, compute):
+        key = (operation, id(function))
+        entries = self.entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key][1]
+        self.misses += 1
+        result = compute(function)
+        if self.size > 0:
+            entries[key] = (function, result)
+            if len(entries) > self.size:
+                entries.popitem(last=False)
+        return result
+
+    def resize(self, size):
+        self.size = size
+        while len(self.entries) > max(size, 0):
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': self.size, 'entries': len(self.entries)}
+
+
+EXPRESSION_CACHE = ExpressionCache()
+
+
+def set_cache_size(size):
+    EXPRESSION_CACHE.resize(size)
+
+
+def cache_info():
+    return EXPRESSION_CACHE.info()
+
+
+def clear_cache():
+    EXPRESSION_CACHE.clear()
+    for function in list(INTERNED.values()):
+        object.__setattr__(function, 'memo', None)
+
+
+def memoized(method):
+    operation = method.__name__
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self, *arguments, **keywords):
+        if keywords:
+            arguments = signature.bind(self, *arguments, **keywords).args[1:]
+        key = (operation,) + arguments
+        memo = self.memo
+        if memo is None:
+            memo = {}
+            object.__setattr__(self, 'memo', memo)
+        elif key in memo:
+            EXPRESSION_CACHE.hits += 1
+            return memo[key]
+        result = EXPRESSION_CACHE.lookup(key, self, lambda function: method(function, *arguments))
+        memo[key] = result
+        return result
+    return wrapper
+
+
+def compile_functions(functions, variables=None):
+    context = CompilationContext(variables)
+    results = [context.fold(function) for function in functions]
+    return context.function('({0})'.format(''.join(map('{0}, '.format, results))))
+
+
 class Function(object):
+    fields = ()
+    hash_value = None
+    node_order = None
+    memo = None
+
+    def __new__(cls, *arguments, **keywords):
+        values = tuple(cls.canonical(*arguments, **keywords))
+        key = (cls,) + tuple(map(identity_key, values))
+        existing = INTERNED.get(key)
+        if existing is not None:
+            return existing
+        instance = object.__new__(cls)
+        for field, value in zip(cls.fields, values):
+            object.__setattr__(instance, field, value)
+        object.__setattr__(instance, 'hash_value', hash((cls.__name__, structural_hash(values))))
+        INTERNED[key] = instance
+        return instance
+
+    @classmethod
+    def canonical(cls, *arguments, **keywords):
+        values = arguments + tuple(keywords.pop(field) for field in cls.fields[len(arguments):] if field in keywords)
+        if keywords or len(values) > len(cls.fields):
+            raise TypeError('{0} takes the arguments ({1}).'.format(cls.__name__, ', '.join(cls.fields)))
+        return values
+
+    def __reduce__(self):
+        return self.__class__, tuple(getattr(self, field) for field in self.fields)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Function nodes are immutable.')
+
+    def __hash__(self):
+        return self.hash_value
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(self) is not type(other) or self.hash_value != other.hash_value:
+            return False
+        return all(getattr(self, field) == getattr(other, field) for field in self.fields)
+
+    def __ne__(self, other):
+        return not self == other
+
     def evaluate(self, value):
         raise OperationNotSupportedException('Operation not implemented yet.')
 
     def simplify(self):
         raise OperationNotSupportedException('Operation not implemented yet.')
 
+    def children(self):
+        return ()
+
+    def rebuild(self, children):
+        return self
+
+    def apply(self, value, arguments):
+        raise OperationNotSupportedException('Operation not implemented yet.')
+
+    def nodes(self):
+        if self.node_order is not None:
+            return self.node_order
+        order, seen, stack = [], set(), [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+            elif id(node) not in seen:
+                seen.add(id(node))
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children()))
+        object.__setattr__(self, 'node_order', tuple(order))
+        return self.node_order
+
+    def variables(self):
+        return tuple(sorted(set(node.name for node in self.nodes() if isinstance(node, Variable))))
+
+    def bind(self, point, variables=None):
+        if isinstance(point, dict):
+            return point
+        variables = self.variables() if variables is None else variables
+        point = list(point)
+        if len(point) != len(variables):
+            raise ValueError('Expected {0} values for variables {1}.'.format(len(variables), variables))
+        return dict(zip(variables, point))
+
+    def evaluate_at(self, point, variables=None):
+        return self.evaluate(self.bind(point, variables))
+
+    def evaluate_shared(self, value):
+        results = {}
+        for node in self.nodes():
+            results[id(node)] = node.apply(value, [results[id(child)] for child in node.children()])
+        return results[id(self)]
+
+    def code(self, context):
+        raise OperationNotSupportedException('Operation not implemented yet.')
+
+    def evaluate_batch(self, values):
+        raise OperationNotSupportedException('Operation not implemented yet.')
+
+    def evaluate_many(self, values):
+        if isinstance(values, dict):
+            values = {name: batch.astype(float) if is_array(batch) else list(batch) for name, batch in values.items()}
+            result = self.evaluate_batch(values)
+            if is_array(result):
+                return result.copy() if any(result is batch for batch in values.values()) else result
+            try:
+                return array('d', result)
+            except TypeError:
+                return result
+        if is_array(values):
+            if values.dtype.kind in 'biu':
+                values = values.astype(float)
+            result = self.evaluate_batch(values)
+            return result.copy() if result is values else result
+        result = self.evaluate_batch(list(values))
+        try:
+            return array('d', result)
+        except TypeError:
+            return result
+
+    def compile(self, variables=None):
+        context = CompilationContext(variables)
+        return context.function(context.fold(self))
+
 
 class Variable(Function):
+    fields = ('name',)
     name = None
 
-    def __init__(self, name):
-        self.name = name
-
     def evaluate(self, value):
-        return value
+        return value[self.name] if isinstance(value, dict) else value
+
+    def evaluate_batch(self, values):
+        return values[self.name] if isinstance(values, dict) else values
 
-    def derivative(self):
-        return Constant.one()
+    def apply(self, value, arguments):
+        return value[self.name] if isinstance(value, dict) else value
+
+    def code(self, context):
+        return context.variable(self.name)
+
+    def derivative(self, variable=None):
+        return Constant.one() if variable is None or variable == self.name else Constant.zero()
 
     def simplify(self):
         return self
@@ -46,21 +361,14 @@ class Variable(Function):
     def __pow__(self, power, modulo=None):
         return Power(self, power).simplify()
 
-    def __eq__(self, other):
-        if not isinstance(other, Variable):
-            return False
-        return self.name == other.name
-
     def __str__(self):
         return '{0}'.format(self.name)
 
 
 class Constant(Function):
+    fields = ('constant',)
     constant = 0.0
 
-    def __init__(self, constant):
-        self.constant = constant
-
     @staticmethod
     def zero():
         return Constant(0.0)
@@ -90,26 +398,32 @@ class Constant(Function):
     def evaluate(self, value):
         return self.constant
 
+    def evaluate_batch(self, values):
+        return constant_batch(self.constant, values)
+
+    def apply(self, value, arguments):
+        return self.constant
+
+    def code(self, context):
+        return context.constant(self.constant)
+
     def simplify(self):
         return self
 
-    def derivative(self):
+    def derivative(self, variable=None):
         return Constant.zero()
 
-    def __eq__(self, other):
-        if not isinstance(other, Constant):
-            return False
-        return self.constant == other.constant
-
     def __str__(self):
         return '{0}'.format(self.constant)
 
 
 class Sum(Function):
-    summands = []
+    fields = ('summands',)
+    summands = ()
 
-    def __init__(self, summands):
-        self.summands = summands
+    @classmethod
+    def canonical(cls, summands):
+        return tuple(summands),
 
     def evaluate(self, value):
         result = 0.0
@@ -117,6 +431,25 @@ class Sum(Function):
             result += function.evaluate(value)
         return result
 
+    def evaluate_batch(self, values):
+        result = constant_batch(0.0, values)
+        for function in self.summands:
+            result = combine_batches(add, result, function.evaluate_batch(values))
+        return result
+
+    def children(self):
+        return self.summands
+
+    def rebuild(self, children):
+        return Sum(children)
+
+    def apply(self, value, arguments):
+        return sum(arguments, 0.0)
+
+    def code(self, context):
+        return '(0.0{0})'.format(''.join(map(' + {0}'.format, map(context.fold, self.summands))))
+
+    @memoized
     def simplify(self):
         result_summands = []
         constant_value = None
@@ -138,7 +471,7 @@ class Sum(Function):
                     variables_count[function.name] = 0
                 variables_count[function.name] += 1
             else:
-                result_summands.append(function.simplify())
+                result_summands.append(function)
         if constant_value is not None:
             result_summands = [Constant(constant_value)] + result_summands
         if len(variables_count) > 0:
@@ -155,10 +488,11 @@ class Sum(Function):
             return result_summands[0]
         return Sum(result_summands)
 
-    def derivative(self):
+    @memoized
+    def derivative(self, variable=None):
         result_summands = []
         for function in self.summands:
-            result_summands.append(function.derivative())
+            result_summands.append(function.derivative(variable))
         return Sum(result_summands).simplify()
 
     def __add__(self, other):
@@ -179,11 +513,6 @@ class Sum(Function):
     def __pow__(self, power, modulo=None):
         return Power(self, power).simplify()
 
-    def __eq__(self, other):
-        if not isinstance(other, Sum):
-            return False
-        return self.summands == other.summands
-
     def __str__(self):
         result = ''
         for function in self.summands:
@@ -192,10 +521,12 @@ class Sum(Function):
 
 
 class Product(Function):
-    multiplicands = []
+    fields = ('multiplicands',)
+    multiplicands = ()
 
-    def __init__(self, multiplicands):
-        self.multiplicands = multiplicands
+    @classmethod
+    def canonical(cls, multiplicands):
+        return tuple(multiplicands),
 
     def evaluate(self, value):
         result = 1.0
@@ -203,6 +534,28 @@ class Product(Function):
             result *= function.evaluate(value)
         return result
 
+    def evaluate_batch(self, values):
+        result = constant_batch(1.0, values)
+        for function in self.multiplicands:
+            result = combine_batches(mul, result, function.evaluate_batch(values))
+        return result
+
+    def children(self):
+        return self.multiplicands
+
+    def rebuild(self, children):
+        return Product(children)
+
+    def apply(self, value, arguments):
+        result = 1.0
+        for argument in arguments:
+            result *= argument
+        return result
+
+    def code(self, context):
+        return '(1.0{0})'.format(''.join(map(' * {0}'.format, map(context.fold, self.multiplicands))))
+
+    @memoized
     def simplify(self):
         constant_value = None
         result_multiplicands = []
@@ -224,7 +577,7 @@ class Product(Function):
                     variables_count[function.name] = 0
                 variables_count[function.name] += 1
             else:
-                result_multiplicands.append(function.simplify())
+                result_multiplicands.append(function)
         if constant_value is not None and constant_value != 0.0:
             result_multiplicands = [Constant(constant_value)] + result_multiplicands
         if len(variables_count) > 0:
@@ -242,19 +595,20 @@ class Product(Function):
             return result_multiplicands[0]
         return Product(result_multiplicands)
 
-    def derivative(self):
+    @memoized
+    def derivative(self, variable=None):
         simplified = self.simplify()
         if not isinstance(simplified, Product):
-            return simplified.derivative()
+            return simplified.derivative(variable)
         current_derivative = Sum(
-            [Product([simplified.multiplicands[0].derivative(), simplified.multiplicands[1]]),
-             Product([simplified.multiplicands[0], simplified.multiplicands[1].derivative()])
+            [Product([simplified.multiplicands[0].derivative(variable), simplified.multiplicands[1]]),
+             Product([simplified.multiplicands[0], simplified.multiplicands[1].derivative(variable)])
              ]).simplify()
         current_product = Product(simplified.multiplicands[:2]).simplify()
         for i in range(2, len(simplified.multiplicands)):
             current_derivative = Sum(
                 [Product([current_derivative, simplified.multiplicands[i]]),
-                 Product([current_product, simplified.multiplicands[i].derivative()])
+                 Product([current_product, simplified.multiplicands[i].derivative(variable)])
                  ]).simplify()
             current_product = Product(simplified.multiplicands[:(i + 1)]).simplify()
         return current_derivative.simplify()
@@ -277,11 +631,6 @@ class Product(Function):
     def __pow__(self, power, modulo=None):
         return Power(self, power).simplify()
 
-    def __eq__(self, other):
-        if not isinstance(other, Product):
-            return False
-        return self.multiplicands == other.multiplicands
-
     def __str__(self):
         result = ''
         for function in self.multiplicands:
@@ -290,16 +639,36 @@ class Product(Function):
 
 
 class Power(Function):
+    fields = ('function', 'power')
     power = None
     function = None
 
-    def __init__(self, function, power):
-        self.power = power
-        self.function = function
+    @classmethod
+    def canonical(cls, function, power):
+        if isinstance(function, (int, float, complex)):
+            function = Constant(function)
+        return function, power
 
     def evaluate(self, value):
         return self.function.evaluate(value) ** self.power
 
+    def evaluate_batch(self, values):
+        batch = self.function.evaluate_batch(values)
+        return batch ** self.power if is_array(batch) else [value ** self.power for value in batch]
+
+    def children(self):
+        return (self.function,)
+
+    def rebuild(self, children):
+        return Power(children[0], self.power)
+
+    def apply(self, value, arguments):
+        return arguments[0] ** self.power
+
+    def code(self, context):
+        return '({0} ** {1})'.format(context.fold(self.function), context.constant(self.power))
+
+    @memoized
     def simplify(self):
         if self.power == 0:
             return Constant.one()
@@ -307,12 +676,13 @@ class Power(Function):
             return self.function
         return Power(self.function, self.power)
 
-    def derivative(self):
+    @memoized
+    def derivative(self, variable=None):
         simplified = self.simplify()
         if not isinstance(simplified, Power):
-            return simplified.derivative()
+            return simplified.derivative(variable)
         return Product([Constant(self.power),
-                        self.function.derivative(), Power(self.function, self.power - 1)]).simplify()
+                        self.function.derivative(variable), Power(self.function, self.power - 1)]).simplify()
 
     def __add__(self, other):
         if isinstance(other, (int, float, complex)):
@@ -332,66 +702,98 @@ class Power(Function):
     def __pow__(self, power, modulo=None):
         return Power(self, power).simplify()
 
-    def __eq__(self, other):
-        if not isinstance(other, Power):
-            return False
-        return self.function == other.function and self.power == other.power
-
     def __str__(self):
         return '({0})^{1}'.format(self.function, self.power)
 
 
 class Logarithm(Function):
+    fields = ('function', 'base')
     function = None
     base = None
 
-    def __init__(self, function, base):
+    @classmethod
+    def canonical(cls, function, base):
         if isinstance(function, (int, float, complex)):
             function = Constant(function)
-        self.function = function
-        self.base = base
+        return function, base
 
     def evaluate(self, value):
         return math.log(self.function.evaluate(value), self.base)
 
+    def evaluate_batch(self, values):
+        batch = self.function.evaluate_batch(values)
+        if is_array(batch):
+            return numpy.log(batch) / math.log(self.base)
+        return [math.log(value, self.base) for value in batch]
+
+    def children(self):
+        return (self.function,)
+
+    def rebuild(self, children):
+        return Logarithm(children[0], self.base)
+
+    def apply(self, value, arguments):
+        return math.log(arguments[0], self.base)
+
+    def code(self, context):
+        return 'log({0}, {1})'.format(context.fold(self.function), context.constant(self.base))
+
+    @memoized
     def simplify(self):
         if isinstance(self.function, Constant):
             return Constant(math.log(self.function.constant, self.base))
+        return Logarithm(self.function.simplify(), self.base)
 
-    def derivative(self):
-        return Product([self.function.derivative(), Power(self.function, -1),
-                        Power(math.log(self.base, math.e), -1)])
+    @memoized
+    def derivative(self, variable=None):
+        return Product([self.function.derivative(variable), Power(self.function, -1),
+                        Power(math.log(self.base, math.e), -1)]).simplify()
 
 
 class Exponential(Function):
+    fields = ('base', 'power')
     base = None
     power = None
 
-    def __init__(self, base, power):
+    @classmethod
+    def canonical(cls, base, power):
         if isinstance(base, (float, int, complex)):
             base = Constant(base)
         if isinstance(power, (float, int, complex)):
             power = Constant(power)
-        self.base = base
-        self.power = power
+        return base, power
 
     def evaluate(self, value):
         return self.base.evaluate(value) ** self.power.evaluate(value)
 
+    def evaluate_batch(self, values):
+        return combine_batches(pow, self.base.evaluate_batch(values), self.power.evaluate_batch(values))
+
+    def children(self):
+        return (self.base, self.power)
+
+    def rebuild(self, children):
+        return Exponential(children[0], children[1])
+
+    def apply(self, value, arguments):
+        return arguments[0] ** arguments[1]
+
+    def code(self, context):
+        return '({0} ** {1})'.format(context.fold(self.base), context.fold(self.power))
+
+    @memoized
     def simplify(self):
         if isinstance(self.power, Constant):
             return Power(self.base, self.power.constant)
         return Exponential(self.base, self.power)
 
-    def derivative(self):
+    @memoized
+    def derivative(self, variable=None):
         return Product([
             Exponential(self.base, self.power),
-            Sum([Product([Logarithm(self.base, math.e), self.power.derivative()]),
-                 Product([Logarithm(self.base, math.e).derivative(), self.power])])]).simplify()
+            Sum([Product([Logarithm(self.base, math.e), self.power.derivative(variable)]),
+                 Product([Logarithm(self.base, math.e).derivative(variable), self.power])])]).simplify()
 
     def __str__(self):
         return '({0})^({1})'.format(self.base, self.power)
 
-    def __eq__(self, other):
-        return self.base == other.base and self.power == other.power
-
@@ -0,0 +1,125 @@
+import time
+from functools import wraps
+
+from functions import Variable, Constant, Sum, Product, Power, Logarithm, Exponential
+
+
+NODE_TYPES = (Variable, Constant, Sum, Product, Power, Logarithm, Exponential)
+OPERATIONS = ('evaluate', 'simplify', 'derivative')
+COSTS = {
+    'Variable': 0,
+    'Constant': 0,
+    'Sum': 1,
+    'Product': 1,
+    'Power': 4,
+    'Logarithm': 20,
+    'Exponential': 20,
+}
+
+
+def node_cost(node):
+    cost = COSTS.get(type(node).__name__, 1)
+    if isinstance(node, (Sum, Product)):
+        return cost * max(len(node.children()) - 1, 1)
+    return cost
+
+
+def expression_statistics(function):
+    nodes = function.nodes()
+    sizes, depths, costs, parents, types = {}, {}, {}, {}, {}
+    dag_cost = 0
+    for node in nodes:
+        children = node.children()
+        sizes[id(node)] = 1 + sum(sizes[id(child)] for child in children)
+        depths[id(node)] = 1 + max((depths[id(child)] for child in children), default=0)
+        cost = node_cost(node)
+        costs[id(node)] = cost + sum(costs[id(child)] for child in children)
+        dag_cost += cost
+        for child in children:
+            parents[id(child)] = parents.get(id(child), 0) + 1
+        name = type(node).__name__
+        types[name] = types.get(name, 0) + 1
+    shared = sum(1 for node in nodes if parents.get(id(node), 0) > 1)
+    return {
+        'tree_nodes': sizes[id(function)],
+        'unique_nodes': len(nodes),
+        'shared_nodes': shared,
+        'depth': depths[id(function)],
+        'node_types': types,
+        'tree_cost': costs[id(function)],
+        'dag_cost': dag_cost,
+    }
+
+
+def derivative_statistics(function, variable=None):
+    before = expression_statistics(function)
+    after = expression_statistics(function.derivative(variable))
+    return {'function': before, 'derivative': after,
+            'growth': float(after['unique_nodes']) / before['unique_nodes']}
+
+
+class Profiler(object):
+    def __init__(self, operations=OPERATIONS):
+        self.operations = tuple(operations)
+        self.counters = {}
+        self.originals = {}
+        self.stack = []
+
+    @property
+    def enabled(self):
+        return bool(self.originals)
+
+    def record(self, name, operation, elapsed, exclusive):
+        counter = self.counters.setdefault(name, {}).setdefault(operation, {'calls': 0, 'total': 0.0, 'self': 0.0})
+        counter['calls'] += 1
+        counter['total'] += elapsed
+        counter['self'] += exclusive
+
+    def timed(self, name, operation, method):
+        profiler = self
+
+        @wraps(method)
+        def wrapper(function, *arguments):
+            profiler.stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return method(function, *arguments)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = profiler.stack.pop()
+                if profiler.stack:
+                    profiler.stack[-1] += elapsed
+                profiler.record(name, operation, elapsed, elapsed - children)
+        return wrapper
+
+    def enable(self):
+        if self.enabled:
+            return self
+        for node_type in NODE_TYPES:
+            for operation in self.operations:
+                method = node_type.__dict__.get(operation)
+                if method is None:
+                    continue
+                self.originals[(node_type, operation)] = method
+                setattr(node_type, operation, self.timed(node_type.__name__, operation, method))
+        return self
+
+    def disable(self):
+        for (node_type, operation), method in self.originals.items():
+            setattr(node_type, operation, method)
+        self.originals = {}
+        self.stack = []
+        return self
+
+    def reset(self):
+        self.counters = {}
+
+    def as_dict(self):
+        return {name: {operation: dict(counter) for operation, counter in operations.items()}
+                for name, operations in self.counters.items()}
+
+    def __enter__(self):
+        return self.enable()
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.disable()
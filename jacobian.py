@@ -0,0 +1,43 @@
+from functions import compile_functions
+from matrix import Matrix
+
+
+class Jacobian(object):
+    def __init__(self, functions, variables=None):
+        self.functions = list(functions)
+        if variables is None:
+            variables = sorted(set(name for function in self.functions for name in function.variables()))
+        self.variables = tuple(variables)
+        self.partials = [[function.derivative(variable) for variable in self.variables] for function in self.functions]
+        self.compiled = compile_functions([partial for row in self.partials for partial in row], self.variables)
+
+    @property
+    def m(self):
+        return len(self.functions)
+
+    @property
+    def n(self):
+        return len(self.variables)
+
+    def arguments(self, point):
+        if isinstance(point, dict):
+            return [point[variable] for variable in self.variables]
+        point = list(point)
+        if len(point) != self.n:
+            raise ValueError('Expected {0} values for variables {1}.'.format(self.n, self.variables))
+        return point
+
+    def values(self, point):
+        return self.compiled(*self.arguments(point))
+
+    def evaluate(self, point):
+        values = self.values(point)
+        return Matrix([list(values[i * self.n:(i + 1) * self.n]) for i in range(self.m)])
+
+    def evaluate_many(self, points):
+        return [self.evaluate(point) for point in points]
+
+
+def gradient(function, points, variables=None):
+    jacobian = Jacobian([function], variables)
+    return Matrix([list(jacobian.values(point)) for point in points])
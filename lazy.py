@@ -0,0 +1,245 @@
+from engines import INT64_LIMIT, dispatch
+from matrix import Matrix, empty_matrix
+from storage import PACKED_TYPECODES, is_packed, promote
+
+
+class MatrixExpression(object):
+    m = 0
+    n = 0
+
+    def check_shape(self, other):
+        if other.m != self.m or other.n != self.n:
+            raise ValueError('Matrix dimensions do not match: {0}x{1} and {2}x{3}.'.format(
+                self.m, self.n, other.m, other.n))
+
+    def terms(self):
+        return [(1, self)]
+
+    def __add__(self, other):
+        other = as_expression(other)
+        if other is None:
+            return NotImplemented
+        self.check_shape(other)
+        return LinearCombination(self.terms() + other.terms())
+
+    def __radd__(self, other):
+        other = as_expression(other)
+        if other is None:
+            return NotImplemented
+        return other.__add__(self)
+
+    def __sub__(self, other):
+        other = as_expression(other)
+        if other is None:
+            return NotImplemented
+        self.check_shape(other)
+        return LinearCombination(self.terms() + [(-coefficient, term) for coefficient, term in other.terms()])
+
+    def __rsub__(self, other):
+        other = as_expression(other)
+        if other is None:
+            return NotImplemented
+        return other.__sub__(self)
+
+    def __neg__(self):
+        return self.scaled(-1)
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return self.scaled(other)
+        other = as_expression(other)
+        if other is None:
+            return NotImplemented
+        return product(self, other)
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return self.scaled(other)
+        other = as_expression(other)
+        if other is None:
+            return NotImplemented
+        return product(other, self)
+
+    def scaled(self, scalar):
+        return LinearCombination([(scalar * coefficient, term) for coefficient, term in self.terms()])
+
+    def evaluate(self, out=None):
+        return Evaluator().evaluate(self, out)
+
+
+class Leaf(MatrixExpression):
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.m = matrix.m
+        self.n = matrix.n
+
+
+class LinearCombination(MatrixExpression):
+    def __init__(self, terms):
+        merged = {}
+        for coefficient, term in terms:
+            key = id(term.matrix) if isinstance(term, Leaf) else id(term)
+            if key in merged:
+                merged[key] = (merged[key][0] + coefficient, merged[key][1])
+            else:
+                merged[key] = (coefficient, term)
+        self.combination = [(coefficient, term) for coefficient, term in merged.values() if coefficient != 0] or \
+            [(0, terms[0][1])]
+        self.m = terms[0][1].m
+        self.n = terms[0][1].n
+
+    def terms(self):
+        return list(self.combination)
+
+
+class Product(MatrixExpression):
+    def __init__(self, factors):
+        self.factors = factors
+        self.m = factors[0].m
+        self.n = factors[-1].n
+
+    def dimensions(self):
+        return [self.factors[0].m] + [factor.n for factor in self.factors]
+
+    def cost(self):
+        return chain_order(self.dimensions())[0]
+
+
+def as_expression(value):
+    if isinstance(value, MatrixExpression):
+        return value
+    if isinstance(value, Matrix):
+        return Leaf(value)
+    return None
+
+
+def lazy(matrix):
+    return Leaf(matrix)
+
+
+def product(first, second):
+    if first.n != second.m:
+        raise ValueError('Cannot multiply a {0}x{1} matrix by a {2}x{3} matrix.'.format(
+            first.m, first.n, second.m, second.n))
+    scale = 1
+    factors = []
+    for operand in (first, second):
+        terms = operand.terms()
+        if isinstance(operand, LinearCombination) and len(terms) == 1:
+            coefficient, operand = terms[0]
+            scale = scale * coefficient
+        factors.extend(operand.factors if isinstance(operand, Product) else [operand])
+    result = Product(factors)
+    return result if scale == 1 else result.scaled(scale)
+
+
+def chain_order(dimensions):
+    count = len(dimensions) - 1
+    costs = [[0] * count for _ in range(count)]
+    splits = [[0] * count for _ in range(count)]
+    for length in range(1, count):
+        for i in range(count - length):
+            j = i + length
+            costs[i][j] = None
+            for k in range(i, j):
+                cost = costs[i][k] + costs[k + 1][j] + dimensions[i] * dimensions[k + 1] * dimensions[j + 1]
+                if costs[i][j] is None or cost < costs[i][j]:
+                    costs[i][j] = cost
+                    splits[i][j] = k
+    return costs[0][count - 1], splits
+
+
+def combination_function(coefficients):
+    terms = []
+    for i, coefficient in enumerate(coefficients):
+        if coefficient == 1:
+            terms.append('+ v{0}'.format(i))
+        elif coefficient == -1:
+            terms.append('- v{0}'.format(i))
+        else:
+            terms.append('+ c{0} * v{0}'.format(i))
+    source = 'lambda {0}: {1}'.format(', '.join('v{0}'.format(i) for i in range(len(coefficients))),
+                                      ' '.join(terms).lstrip('+ '))
+    return eval(source, {'c{0}'.format(i): coefficient for i, coefficient in enumerate(coefficients)})
+
+
+def magnitude(matrix):
+    values = matrix.data.buffer if is_packed(matrix.data) else (value for row in matrix.data for value in row)
+    return max(map(abs, values), default=0)
+
+
+def fits_int64(operands, coefficients):
+    return sum(abs(coefficient) * magnitude(operand) for coefficient, operand in zip(coefficients, operands)) <= \
+        INT64_LIMIT
+
+
+class Evaluator(object):
+    def __init__(self):
+        self.temporaries = set()
+        self.allocations = 0
+        self.reused = 0
+        self.multiplications = 0
+
+    def evaluate(self, expression, out=None):
+        result = self.compute(expression, out)
+        if out is None and id(result) not in self.temporaries:
+            return self.temporary(result.copy())
+        return result
+
+    def compute(self, expression, out=None):
+        if out is not None:
+            expression.check_shape(out)
+        if isinstance(expression, Leaf):
+            if out is None:
+                return expression.matrix
+            return expression.matrix.elementwise(combination_function([1]), [], out)
+        if isinstance(expression, Product):
+            result = self.evaluate_product(expression)
+            if out is None:
+                return result
+            return result.elementwise(combination_function([1]), [], out)
+        return self.evaluate_combination(expression, out)
+
+    def temporary(self, matrix):
+        self.temporaries.add(id(matrix))
+        self.allocations += 1
+        return matrix
+
+    def evaluate_product(self, expression):
+        operands = [self.compute(factor) for factor in expression.factors]
+        cost, splits = chain_order(expression.dimensions())
+        self.multiplications += cost
+        return self.multiply_chain(operands, splits, 0, len(operands) - 1)
+
+    def multiply_chain(self, operands, splits, i, j):
+        if i == j:
+            return operands[i]
+        k = splits[i][j]
+        return self.temporary(self.multiply_chain(operands, splits, i, k).multiply(
+            self.multiply_chain(operands, splits, k + 1, j)))
+
+    def evaluate_combination(self, expression, out=None):
+        coefficients = [coefficient for coefficient, _ in expression.combination]
+        operands = [self.compute(term) for _, term in expression.combination]
+        if out is None and coefficients == [1]:
+            return operands[0]
+        data_type = operands[0].data_type
+        for value in operands[1:] + coefficients:
+            data_type = promote(data_type, value.data_type if isinstance(value, Matrix) else type(value))
+        if out is None:
+            result = dispatch('linear_combination', expression.m * expression.n * len(operands), operands,
+                              coefficients)
+            if result is not NotImplemented:
+                return self.temporary(Matrix(result))
+            if data_type is int and not fits_int64(operands, coefficients):
+                data_type = None
+            out = self.output(operands, data_type, expression)
+        return operands[0].elementwise(combination_function(coefficients), operands[1:], out)
+
+    def output(self, operands, data_type, expression):
+        for operand in operands:
+            if id(operand) in self.temporaries and operand.data_type == data_type and \
+                    (data_type in PACKED_TYPECODES or data_type is None):
+                self.reused += 1
+                return operand
+        return self.temporary(empty_matrix(expression.m, expression.n, data_type))
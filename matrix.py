@@ -1,122 +1,395 @@
+import math
+import sys
+from functools import partial
+from operator import add, mul, sub
+
+from engines import check_engine, dispatch
+from factorization import LUFactorization, is_inexact
+from multiplication import multiply_rows
+from storage import PackedStorage, PACKED_TYPECODES, ViewStorage, is_packed, is_view, promote
+
+
+HASH_MODULUS = sys.hash_info.modulus
+
 
 class InvalidMatrixDeterminantException(Exception):
     pass
 
 
 def gcd(a, b):
-    if b == 0:
-        return a
-    return gcd(b, a % b)
+    return math.gcd(a, b)
 
 
 def mcm(a, b):
-    return a * b / gcd(a, b)
+    return a * b // math.gcd(a, b) if a and b else 0
 
 
 class Fraction(object):
-    numerator = None
-    denominator = None
-
-    def __init__(self, numerator, denominator):
-        self.numerator = numerator
-        self.denominator = denominator
+    __slots__ = ('numerator', 'denominator')
+
+    def __init__(self, numerator, denominator=1):
+        if isinstance(numerator, Fraction) or isinstance(denominator, Fraction):
+            numerator, denominator = as_ratio(numerator), as_ratio(denominator)
+            numerator, denominator = (numerator[0] * denominator[1], numerator[1] * denominator[0])
+        if denominator == 0:
+            raise ZeroDivisionError('Fraction({0}, 0)'.format(numerator))
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        divisor = math.gcd(numerator, denominator)
+        self.numerator = numerator // divisor
+        self.denominator = denominator // divisor
+
+    @staticmethod
+    def normalized(numerator, denominator):
+        result = object.__new__(Fraction)
+        result.numerator = numerator
+        result.denominator = denominator
+        return result
 
     def __pow__(self, power, modulo=None):
-        return Fraction(self.numerator ** power, self.denominator ** power).simplify()
+        if isinstance(power, float):
+            return float(self) ** power
+        if not isinstance(power, int):
+            return NotImplemented
+        if power < 0:
+            return Fraction(self.denominator ** -power, self.numerator ** -power)
+        return Fraction.normalized(self.numerator ** power, self.denominator ** power)
 
     def __add__(self, other):
-        if isinstance(other, (int,)):
-            other = Fraction(other, 1)
-        return self.add(other)
+        if isinstance(other, int):
+            return Fraction.normalized(self.numerator + other * self.denominator, self.denominator)
+        if isinstance(other, Fraction):
+            return self.add(other)
+        if isinstance(other, float):
+            return float(self) + other
+        return NotImplemented
+
+    __radd__ = __add__
 
     def __sub__(self, other):
-        if isinstance(other, (int,)):
-            other = Fraction(other, 1)
-        return self.subtract(other)
+        if isinstance(other, int):
+            return Fraction.normalized(self.numerator - other * self.denominator, self.denominator)
+        if isinstance(other, Fraction):
+            return self.subtract(other)
+        if isinstance(other, float):
+            return float(self) - other
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, int):
+            return Fraction.normalized(other * self.denominator - self.numerator, self.denominator)
+        if isinstance(other, float):
+            return other - float(self)
+        return NotImplemented
 
     def __mul__(self, other):
-        if isinstance(other, (int,)):
-            other = Fraction(other, 1)
-        return self.multiply(other)
+        if isinstance(other, int):
+            divisor = math.gcd(other, self.denominator)
+            return Fraction.normalized(self.numerator * (other // divisor), self.denominator // divisor)
+        if isinstance(other, Fraction):
+            return self.multiply(other)
+        if isinstance(other, float):
+            return float(self) * other
+        return NotImplemented
+
+    __rmul__ = __mul__
 
     def __truediv__(self, other):
-        if isinstance(other, (int,)):
-            other = Fraction(other, 1)
-        return self.divide(other)
+        if isinstance(other, int):
+            return Fraction(self.numerator, self.denominator * other)
+        if isinstance(other, Fraction):
+            return self.divide(other)
+        if isinstance(other, float):
+            return float(self) / other
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        if isinstance(other, int):
+            return Fraction(other * self.denominator, self.numerator)
+        if isinstance(other, float):
+            return other / float(self)
+        return NotImplemented
 
     def __neg__(self):
         return self.negate()
 
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Fraction.normalized(abs(self.numerator), self.denominator)
+
+    def __bool__(self):
+        return self.numerator != 0
+
     def __float__(self):
-        return float(self.numerator) / float(self.denominator)
+        return self.numerator / self.denominator
+
+    def __int__(self):
+        quotient = abs(self.numerator) // self.denominator
+        return quotient if self.numerator >= 0 else -quotient
+
+    def compare(self, other):
+        if isinstance(other, (int, Fraction)):
+            numerator, denominator = as_ratio(other)
+            return self.numerator * denominator - numerator * self.denominator
+        if isinstance(other, float):
+            return float(self) - other
+        return None
 
     def __lt__(self, other):
-        if isinstance(other, (int,)):
-            other = Fraction(other, 1)
-        return float(self) < float(other)
+        difference = self.compare(other)
+        return NotImplemented if difference is None else difference < 0
 
     def __le__(self, other):
-        if isinstance(other, (int,)):
-            other = Fraction(other, 1)
-        return float(self) <= float(other)
+        difference = self.compare(other)
+        return NotImplemented if difference is None else difference <= 0
 
     def __ge__(self, other):
-        if isinstance(other, (int,)):
-            other = Fraction(other, 1)
-        return float(self) >= float(other)
+        difference = self.compare(other)
+        return NotImplemented if difference is None else difference >= 0
 
     def __gt__(self, other):
-        if isinstance(other, (int,)):
-            other = Fraction(other, 1)
-        return float(self) > float(other)
+        difference = self.compare(other)
+        return NotImplemented if difference is None else difference > 0
+
+    def __eq__(self, other):
+        if isinstance(other, Fraction):
+            return self.numerator == other.numerator and self.denominator == other.denominator
+        if isinstance(other, int):
+            return self.denominator == 1 and self.numerator == other
+        if isinstance(other, float):
+            return float(self) == other
+        return NotImplemented
 
     def __ne__(self, other):
-        if isinstance(other, (int,)):
-            other = Fraction(other, 1)
-        return self.numerator != other.numerator or self.denominator != other.denominator
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
 
-    def __eq__(self, other):
-        if isinstance(other, (int,)):
-            other = Fraction(other, 1)
-        return self.numerator == other.numerator and self.denominator == other.denominator
+    def __hash__(self):
+        inverse = pow(self.denominator, -1, HASH_MODULUS) if self.denominator % HASH_MODULUS else None
+        result = sys.hash_info.inf if inverse is None else hash(hash(abs(self.numerator)) * inverse)
+        result = result if self.numerator >= 0 else -result
+        return -2 if result == -1 else result
+
+    def __repr__(self):
+        return 'Fraction({0}, {1})'.format(self.numerator, self.denominator)
+
+    def __str__(self):
+        return '{0}'.format(self.numerator) if self.denominator == 1 else \
+            '{0}/{1}'.format(self.numerator, self.denominator)
 
     def simplify(self):
-        divisor = gcd(self.numerator, self.denominator)
-        return Fraction(self.numerator/divisor, self.denominator/divisor)
+        divisor = math.gcd(self.numerator, self.denominator)
+        if divisor == 1:
+            return self
+        return Fraction.normalized(self.numerator // divisor, self.denominator // divisor)
 
     def add(self, other):
-        denominator = mcm(self.denominator, other.denominator)
-        numerator = denominator/self.denominator*self.numerator + denominator/other.denominator*other.numerator
-        return Fraction(numerator, denominator).simplify()
+        if self.denominator == other.denominator:
+            return Fraction(self.numerator + other.numerator, self.denominator)
+        divisor = math.gcd(self.denominator, other.denominator)
+        if divisor == 1:
+            return Fraction.normalized(self.numerator * other.denominator + other.numerator * self.denominator,
+                                       self.denominator * other.denominator)
+        numerator = self.numerator * (other.denominator // divisor) + other.numerator * (self.denominator // divisor)
+        common = math.gcd(numerator, divisor)
+        return Fraction.normalized(numerator // common,
+                                   (self.denominator // divisor) * (other.denominator // common))
 
     def negate(self):
-        return Fraction(-self.numerator, self.denominator).simplify()
+        return Fraction.normalized(-self.numerator, self.denominator)
 
     def subtract(self, other):
         return self.add(other.negate())
 
     def multiply(self, other):
-        return Fraction(self.numerator*other.numerator, self.denominator*other.denominator).simplify()
+        first = math.gcd(self.numerator, other.denominator)
+        second = math.gcd(other.numerator, self.denominator)
+        return Fraction.normalized((self.numerator // first) * (other.numerator // second),
+                                   (self.denominator // second) * (other.denominator // first))
 
     def divide(self, other):
-        return self.multiply(Fraction(other.denominator, other.numerator)).simplify()
+        if other.numerator == 0:
+            raise ZeroDivisionError('Fraction division by zero')
+        return self.multiply(Fraction.normalized(other.denominator, other.numerator) if other.numerator > 0
+                             else Fraction.normalized(-other.denominator, -other.numerator))
+
+
+def as_ratio(value):
+    if isinstance(value, Fraction):
+        return value.numerator, value.denominator
+    return value, 1
+
+
+def bareiss_determinant(rows):
+    n = len(rows)
+    sign = 1
+    previous = 1
+    for k in range(n - 1):
+        if rows[k][k] == 0:
+            pivot = k + 1
+            while pivot < n and rows[pivot][k] == 0:
+                pivot += 1
+            if pivot == n:
+                return 0
+            rows[k], rows[pivot] = rows[pivot], rows[k]
+            sign = -sign
+        pivot_row = rows[k]
+        pivot_value = pivot_row[k]
+        exact_int = isinstance(previous, int)
+        for i in range(k + 1, n):
+            row = rows[i]
+            factor = row[k]
+            for j in range(k + 1, n):
+                value = row[j] * pivot_value - factor * pivot_row[j]
+                row[j] = value // previous if exact_int and isinstance(value, int) else value / previous
+        previous = pivot_value
+    if n == 0:
+        return 1
+    return rows[n - 1][n - 1] if sign == 1 else -rows[n - 1][n - 1]
+
+
+def pivoted_determinant(rows):
+    n = len(rows)
+    result = 1.0
+    for k in range(n):
+        pivot = max(range(k, n), key=lambda r: abs(rows[r][k]))
+        if rows[pivot][k] == 0:
+            return 0.0
+        if pivot != k:
+            rows[k], rows[pivot] = rows[pivot], rows[k]
+            result = -result
+        pivot_row = rows[k]
+        pivot_value = pivot_row[k]
+        result *= pivot_value
+        for i in range(k + 1, n):
+            row = rows[i]
+            factor = row[k] / pivot_value
+            if factor != 0:
+                for j in range(k + 1, n):
+                    row[j] -= factor * pivot_row[j]
+    return result
+
+
+def fraction_free_reduction(rows, n):
+    m = len(rows)
+    pivot_columns = []
+    previous = 1
+    i = 0
+    for j in range(0, n):
+        if i == m:
+            break
+        pivot = next((k for k in range(i, m) if rows[k][j] != 0), None)
+        if pivot is None:
+            continue
+        rows[i], rows[pivot] = rows[pivot], rows[i]
+        pivot_row = rows[i]
+        current_pivot = pivot_row[j]
+        for k in range(0, m):
+            row = rows[k]
+            if k != i:
+                factor = row[j]
+                for l in range(0, n):
+                    row[l] = (current_pivot * row[l] - factor * pivot_row[l]) // previous
+        previous = current_pivot
+        pivot_columns.append(j)
+        i += 1
+    for k in range(0, m):
+        rows[k] = [value / previous for value in rows[k]]
+    return rows, pivot_columns
+
+
+def pivoted_reduction(rows, n):
+    m = len(rows)
+    inexact = is_inexact(rows)
+    tolerance = max(m, n) * sys.float_info.epsilon * max(
+        (abs(value) for row in rows for value in row), default=0) if inexact else 0
+    pivot_columns = []
+    i = 0
+    for j in range(0, n):
+        if i == m:
+            break
+        if inexact:
+            pivot = max(range(i, m), key=lambda k: abs(rows[k][j]))
+            if abs(rows[pivot][j]) <= tolerance:
+                for k in range(i, m):
+                    rows[k][j] = 0 * rows[k][j]
+                continue
+        else:
+            pivot = next((k for k in range(i, m) if rows[k][j] != 0), None)
+            if pivot is None:
+                continue
+        rows[i], rows[pivot] = rows[pivot], rows[i]
+        pivot_row = rows[i]
+        current_pivot = pivot_row[j]
+        if current_pivot != 1:
+            for l in range(j, n):
+                pivot_row[l] /= current_pivot
+        for k in range(0, m):
+            row = rows[k]
+            factor = row[j]
+            if k != i and factor != 0:
+                for l in range(j, n):
+                    row[l] -= factor * pivot_row[l]
+        pivot_columns.append(j)
+        i += 1
+    return rows, pivot_columns
+
+
+def index_range(size, key):
+    if isinstance(key, slice):
+        return range(size)[key]
+    index = range(size)[key]
+    return range(index, index + 1)
+
+
+def skip_index(size, index):
+    index = range(size)[index]
+    return tuple(range(index)) + tuple(range(index + 1, size))
+
+
+def empty_matrix(m, n, data_type=None, engine=None):
+    return Matrix(m=m, n=n, data_type=data_type if data_type in PACKED_TYPECODES else None, engine=engine)
 
 
 class Matrix(object):
     data = []
+    data_type = None
+    engine = None
+    factorization = None
+    factorization_source = None
 
-    def __init__(self, data=None, m=None, n=None, data_type=None):
+    def __init__(self, data=None, m=None, n=None, data_type=None, engine=None):
         n = 0 if n is None else n
         m = 0 if m is None else m
+        if is_packed(data) or is_view(data):
+            data_type = data.data_type
+        elif data_type in PACKED_TYPECODES:
+            try:
+                data = PackedStorage.from_rows(data, data_type) if data is not None \
+                    else PackedStorage(m, n, PACKED_TYPECODES[data_type])
+            except OverflowError:
+                data_type = None
+        self.data_type = data_type
+        self.engine = check_engine(engine) if engine is not None else None
         self.data = data if data is not None else [[0 for _ in range(n)] for _ in range(m)]
-        if data_type == Fraction:
+        if data_type == Fraction and not is_view(data):
             for i in range(0, self.m):
                 for j in range(0, self.n):
                     if isinstance(self.data[i][j], int):
                         self.data[i][j] = Fraction(self.data[i][j], 1)
 
-    def copy(self):
-        result = Matrix(m=self.m, n=self.n)
+    def _like(self, m, n, data_type=None):
+        return empty_matrix(m, n, self.data_type if data_type is None else data_type, self.engine)
+
+    def copy(self, data_type=None):
+        if is_view(self.data):
+            return Matrix(self.data.copy(data_type), data_type=self.data_type if data_type is None else data_type,
+                          engine=self.engine)
+        if is_packed(self.data) and (data_type is None or data_type in PACKED_TYPECODES):
+            return Matrix(self.data.copy(data_type), engine=self.engine)
+        result = self._like(self.m, self.n, data_type)
         for i in range(0, self.m):
             for j in range(0, self.n):
                 result.data[i][j] = self.data[i][j]
@@ -134,21 +407,109 @@ class Matrix(object):
             return 0
 
     def __add__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
         return self.add(other)
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
             return self.scalar_multiplication(other)
+        if not isinstance(other, Matrix):
+            return NotImplemented
         return self.multiply(other)
 
     def __sub__(self, other):
-        return self.add(-other)
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.subtract(other)
 
     def __neg__(self):
         return self.negate()
 
+    def __iadd__(self, other):
+        if self.holds(other.data_type):
+            return self.add(other, out=self)
+        return self.rebind(self.add(other))
+
+    def __isub__(self, other):
+        if self.holds(other.data_type):
+            return self.subtract(other, out=self)
+        return self.rebind(self.subtract(other))
+
+    def __imul__(self, other):
+        if isinstance(other, (int, float)):
+            if self.holds(type(other)):
+                return self.scalar_multiplication(other, out=self)
+            return self.rebind(self.scalar_multiplication(other))
+        return self.rebind(self.multiply(other))
+
+    def holds(self, data_type):
+        if self.data_type not in PACKED_TYPECODES:
+            return True
+        return data_type is not None and promote(self.data_type, data_type) == self.data_type
+
+    def promoted_copy(self, data_type):
+        if self.data_type not in PACKED_TYPECODES:
+            return self.copy()
+        if data_type in PACKED_TYPECODES:
+            return self.copy(data_type)
+        return Matrix([list(row) for row in self.data], engine=self.engine)
+
+    def rebind(self, result):
+        self.data = result.data
+        self.data_type = result.data_type
+        return self
+
+    def check_shape(self, *others):
+        for other in others:
+            if other.m != self.m or other.n != self.n:
+                raise ValueError('Matrix dimensions do not match: {0}x{1} and {2}x{3}.'.format(
+                    self.m, self.n, other.m, other.n))
+
+    def elementwise(self, function, others, out):
+        self.check_shape(out, *others)
+        out.materialize()
+        if is_packed(out.data) and is_packed(self.data) and all(is_packed(other.data) for other in others):
+            out.data.assign(map(function, self.data.buffer, *[other.data.buffer for other in others]))
+            return out
+        for i in range(0, self.m):
+            row = out.data[i]
+            for j, value in enumerate(map(function, self.data[i], *[other.data[i] for other in others])):
+                row[j] = value
+        return out
+
+    def view(self, rows, columns, transposed=False):
+        """Return a matrix that reads through to this matrix's current storage.
+
+        Element writes to this matrix stay visible through the view until the
+        view itself is written to. The first write to the view copies the
+        selected elements into the view's own storage, so writes never reach
+        this matrix.
+
+        Operations that replace this matrix's storage instead of writing to it
+        detach the view, which keeps the old values. Examples are an in-place
+        operation that promotes packed ints to floats and ``*=`` by a matrix.
+        A view of a view reads from the same storage as the view it was taken
+        from. Once that view is created, writes to the intermediate view do not
+        reach it.
+        """
+        return Matrix(ViewStorage.of(self.data, rows, columns, self.data_type, transposed), engine=self.engine)
+
+    def materialize(self):
+        if is_view(self.data):
+            self.data = self.data.materialize()
+        return self
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError('Matrix indices must be a pair of integers or slices.')
+        rows, columns = key
+        if isinstance(rows, int) and isinstance(columns, int):
+            return self.data[range(self.m)[rows]][range(self.n)[columns]]
+        return self.view(index_range(self.m, rows), index_range(self.n, columns))
+
     def remove_column(self, column):
-        result = Matrix(m=self.m, n=self.n - 1)
+        result = self._like(self.m, self.n - 1)
         for i in range(0, self.m):
             for j in range(0, self.n):
                 if j != column:
@@ -156,13 +517,16 @@ class Matrix(object):
         return result
 
     def remove_row(self, row):
-        result = Matrix(m=self.m - 1, n=self.n)
+        result = self._like(self.m - 1, self.n)
         for i in range(0, self.m):
             if i != row:
                 for j in range(0, self.n):
                     result.data[i if i < row else i - 1][j] = self.data[i][j]
         return result
 
+    def minor(self, row, column):
+        return self.view(skip_index(self.m, row), skip_index(self.n, column))
+
     def leading_zeros(self, row):
         j = 0
         while j < self.n and self.data[row][j] == 0:
@@ -173,75 +537,140 @@ class Matrix(object):
         for i in range(0, self.m):
             for k in range(i + 1, self.m):
                 if self.leading_zeros(i) > self.leading_zeros(k):
-                    aux = self.data[k]
-                    self.data[k] = self.data[i]
-                    self.data[i] = aux
+                    self.swap_rows(i, k)
 
-    def inverse(self):
-        result = Matrix(m=self.m, n=2*self.n)
-        for i in range(0, self.m):
-            result.data[i][i + self.n] = 1.0
-        for i in range(0, self.m):
-            for j in range(0, self.n):
-                result.data[i][j] = self.data[i][j]
-        complete = result.gauss_jordan_reduction()
-        result = Matrix(m=self.m, n=self.n)
-        for i in range(0, self.m):
-            for j in range(self.n, 2*self.n):
-                result.data[i][j - self.n] = complete.data[i][j]
-        return result
+    def swap_rows(self, i, k):
+        if is_packed(self.data) or is_view(self.data):
+            self.data.swap_rows(i, k)
+        else:
+            self.data[i], self.data[k] = self.data[k], self.data[i]
 
-    def scalar_multiplication(self, scalar):
-        result = self.copy()
+    def inverse(self):
+        result = dispatch('inverse', self.n ** 3, [self])
+        if result is not NotImplemented:
+            return Matrix(result, engine=self.engine)
+        zero, one = (Fraction(0, 1), Fraction(1, 1)) if self.data_type == Fraction else (0, 1)
+        augmented = Matrix([list(self.data[i]) + [one if k == i else zero for k in range(0, self.n)]
+                            for i in range(0, self.m)])
+        complete = augmented.gauss_jordan_reduction()
+        data_type = self.division_type()
+        return Matrix([row[self.n:] for row in complete.data],
+                      data_type=data_type if data_type in PACKED_TYPECODES else None, engine=self.engine)
+
+    def scalar_multiplication(self, scalar, out=None):
+        if out is not None:
+            return self.elementwise(partial(mul, scalar), [], out)
+        result = dispatch('scalar_multiplication', self.m * self.n, [self], scalar)
+        if result is not NotImplemented:
+            return Matrix(result, engine=self.engine)
+        if is_packed(self.data) and isinstance(scalar, (int, float)):
+            return Matrix(self.data.scaled(scalar), engine=self.engine)
+        result = self.promoted_copy(promote(self.data_type, type(scalar)))
         for i in range(0, self.m):
             for j in range(0, self.n):
                 result.data[i][j] = scalar * self.data[i][j]
         return result
 
-    def negate(self):
-        return self.scalar_multiplication(-1)
-
-    def transpose(self):
-        result = Matrix(m=self.n, n=self.m)
+    def negate(self, out=None):
+        return self.scalar_multiplication(-1, out=out)
+
+    def transpose(self, view=False):
+        if view:
+            return self.view(range(self.m), range(self.n), transposed=True)
+        result = dispatch('transpose', self.m * self.n, [self])
+        if result is not NotImplemented:
+            return Matrix(result, engine=self.engine)
+        if is_packed(self.data):
+            return Matrix(self.data.transposed(), engine=self.engine)
+        result = self._like(self.n, self.m)
         for i in range(0, self.m):
             for j in range(0, self.n):
                 result.data[j][i] = self.data[i][j]
         return result
 
-    def add(self, other):
-        result = self.copy()
+    def add(self, other, out=None):
+        if out is not None:
+            return self.elementwise(add, [other], out)
+        self.check_shape(other)
+        result = dispatch('add', self.m * self.n, [self, other])
+        if result is not NotImplemented:
+            return Matrix(result, engine=self.engine)
+        if is_packed(self.data) and is_packed(other.data):
+            return Matrix(self.data.added(other.data), engine=self.engine)
+        result = self.promoted_copy(promote(self.data_type, other.data_type))
         for i in range(0, self.m):
             for j in range(0, self.n):
                 result.data[i][j] += other.data[i][j]
         return result
 
-    def multiply(self, other):
-        result = Matrix(m=self.m, n=other.n)
-        for i in range(0, self.m):
-            for j in range(0, other.n):
-                value = 0
-                for k in range(0, self.n):
-                    value += self.data[i][k] * other.data[k][j]
-                result.data[i][j] = value
-        return result
+    def subtract(self, other, out=None):
+        if out is None:
+            self.check_shape(other)
+            result = dispatch('subtract', self.m * self.n, [self, other])
+            if result is not NotImplemented:
+                return Matrix(result, engine=self.engine)
+            out = empty_matrix(self.m, self.n, promote(self.data_type, other.data_type), self.engine)
+        return self.elementwise(sub, [other], out)
+
+    def axpy(self, scalar, other, out=None):
+        if out is None:
+            out = empty_matrix(self.m, self.n, promote(promote(self.data_type, type(scalar)), other.data_type),
+                               self.engine)
+        return self.elementwise(lambda x, y: scalar * x + y, [other], out)
+
+    def multiply(self, other, algorithm=None, out=None):
+        if out is self or out is other:
+            raise ValueError('The output of a matrix product cannot alias one of its operands.')
+        if out is not None:
+            product = self.multiply(other, algorithm)
+            out.check_shape(product)
+            for i in range(0, out.m):
+                row = out.data[i]
+                for j, value in enumerate(product.data[i]):
+                    row[j] = value
+            return out
+        if self.n != other.m:
+            raise ValueError('Cannot multiply a {0}x{1} matrix by a {2}x{3} matrix.'.format(
+                self.m, self.n, other.m, other.n))
+        if algorithm is None:
+            result = dispatch('multiply', self.m * self.n * other.n, [self, other])
+            if result is not NotImplemented:
+                return Matrix(result, engine=self.engine)
+        first = self.data.tolist() if is_packed(self.data) or is_view(self.data) else self.data
+        second = other.data.tolist() if is_packed(other.data) or is_view(other.data) else other.data
+        data_type = promote(self.data_type, other.data_type)
+        return Matrix(multiply_rows(first, second, algorithm),
+                      data_type=data_type if data_type in PACKED_TYPECODES else None, engine=self.engine)
+
+    def division_type(self):
+        return float if self.data_type == int else self.data_type
+
+    def reduce(self):
+        rows = [list(row) for row in self.data]
+        if all(isinstance(value, int) for row in rows for value in row):
+            rows, pivot_columns = fraction_free_reduction(rows, self.n)
+        else:
+            rows, pivot_columns = pivoted_reduction(rows, self.n)
+        data_type = self.division_type()
+        return Matrix(rows, data_type=data_type if data_type in PACKED_TYPECODES else None), pivot_columns
 
     def gauss_jordan_reduction(self):
-        result = self.copy()
-        result.order_rows()
-        j = 0
-        for i in range(0, result.m):
-            current_pivot = result.data[i][j]
-            if current_pivot != 1 and current_pivot != 0:
-                for k in range(j, result.n):
-                    result.data[i][k] /= current_pivot
-            for k in range(result.m):
-                if k != i:
-                    if result.data[i][j] != 0 and result.data[k][j] != 0:
-                        factor = result.data[k][j]/result.data[i][j]
-                        for l in range(j, result.n):
-                            result.data[k][l] -= factor * result.data[i][l]
-            j += 1
-        return result
+        return self.reduce()[0]
+
+    def rref(self):
+        return self.reduce()[0]
+
+    def rank(self):
+        return len(self.reduce()[1])
+
+    def factorize(self):
+        if self.factorization is None or self.factorization_source != self.data:
+            self.factorization_source = [list(row) for row in self.data]
+            self.factorization = LUFactorization(self.factorization_source)
+        return self.factorization
+
+    def solve(self, b):
+        return self.factorize().solve(b)
 
     def __str__(self):
         return '{0}'.format(self.data)
@@ -249,9 +678,10 @@ class Matrix(object):
     def det(self):
         if self.m != self.n:
             raise InvalidMatrixDeterminantException('The determinant operation is only valid for square matrices.')
-        if self.m == self.n and self.m == 2:
-            return self.data[0][0] * self.data[1][1] - self.data[1][0]*self.data[0][1]
-        result = 0
-        for i in range(self.n):
-            result += self.data[0][i] * self.remove_row(0).remove_column(i).det() * (1 if (i % 2) == 0 else -1)
-        return result
+        result = dispatch('det', self.n ** 3, [self])
+        if result is not NotImplemented:
+            return result
+        rows = [list(row) for row in self.data]
+        if any(isinstance(value, float) for row in rows for value in row):
+            return pivoted_determinant(rows)
+        return bareiss_determinant(rows)
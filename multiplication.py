@@ -0,0 +1,132 @@
+from operator import mul
+
+from parallel import ParallelMultiplier, get_multiplier
+
+
+ALGORITHMS = ('naive', 'blocked', 'strassen', 'parallel')
+BLOCK_SIZE = 64
+BLOCKED_THRESHOLD = 4096
+STRASSEN_THRESHOLD = 256
+
+
+def choose_algorithm(m, n, p):
+    multiplier = get_multiplier()
+    if multiplier is not None and multiplier.accepts(m, n, p):
+        return 'parallel'
+    if min(m, n, p) >= STRASSEN_THRESHOLD:
+        return 'strassen'
+    if m * n * p >= BLOCKED_THRESHOLD:
+        return 'blocked'
+    return 'naive'
+
+
+def multiply_rows(first, second, algorithm=None):
+    m, n = len(first), len(second)
+    p = len(second[0]) if n > 0 else 0
+    if m > 0 and len(first[0]) != n:
+        raise ValueError('Cannot multiply a {0}x{1} matrix by a {2}x{3} matrix.'.format(m, len(first[0]), n, p))
+    if algorithm is None:
+        algorithm = choose_algorithm(m, n, p)
+    if algorithm == 'naive':
+        return naive_multiply(first, second)
+    if algorithm == 'blocked':
+        return blocked_multiply(first, second)
+    if algorithm == 'strassen':
+        return strassen_multiply(first, second)
+    if algorithm == 'parallel':
+        result = parallel_multiply(first, second)
+        return result if result is not None else blocked_multiply(first, second)
+    raise ValueError('Unknown multiplication algorithm {0}, expected one of {1}.'.format(algorithm, ALGORITHMS))
+
+
+def parallel_multiply(first, second):
+    multiplier = get_multiplier()
+    if multiplier is not None:
+        return multiplier.multiply(first, second)
+    multiplier = ParallelMultiplier()
+    try:
+        return multiplier.multiply(first, second)
+    finally:
+        multiplier.close()
+
+
+def naive_multiply(first, second):
+    n = len(second)
+    p = len(second[0]) if n > 0 else 0
+    result = []
+    for row in first:
+        result_row = []
+        for j in range(p):
+            value = 0
+            for k in range(n):
+                value += row[k] * second[k][j]
+            result_row.append(value)
+        result.append(result_row)
+    return result
+
+
+def transpose_rows(rows, columns=None):
+    if columns is None:
+        columns = len(rows[0]) if rows else 0
+    return [list(column) for column in zip(*rows)] if rows else [[] for _ in range(columns)]
+
+
+def blocked_multiply(first, second, block_size=None):
+    block_size = BLOCK_SIZE if block_size is None else block_size
+    n = len(second)
+    p = len(second[0]) if n > 0 else 0
+    columns = transpose_rows(second, p)
+    result = [[0] * p for _ in first]
+    for j0 in range(0, p, block_size):
+        column_block = columns[j0:j0 + block_size]
+        for i0 in range(0, len(first), block_size):
+            for i in range(i0, min(i0 + block_size, len(first))):
+                row = first[i]
+                result[i][j0:j0 + len(column_block)] = [sum(map(mul, row, column)) for column in column_block]
+    return result
+
+
+def add_rows(first, second):
+    return [[a + b for a, b in zip(first_row, second_row)] for first_row, second_row in zip(first, second)]
+
+
+def subtract_rows(first, second):
+    return [[a - b for a, b in zip(first_row, second_row)] for first_row, second_row in zip(first, second)]
+
+
+def pad_rows(rows, m, n):
+    padded = [list(row) + [0] * (n - len(row)) for row in rows]
+    return padded + [[0] * n for _ in range(m - len(rows))]
+
+
+def strassen_multiply(first, second, threshold=None):
+    threshold = STRASSEN_THRESHOLD if threshold is None else threshold
+    m, n = len(first), len(second)
+    p = len(second[0]) if n > 0 else 0
+    if min(m, n, p) < max(threshold, 2):
+        return blocked_multiply(first, second)
+    half_m, half_n, half_p = (m + 1) // 2, (n + 1) // 2, (p + 1) // 2
+    a = pad_rows(first, 2 * half_m, 2 * half_n)
+    b = pad_rows(second, 2 * half_n, 2 * half_p)
+    a11 = [row[:half_n] for row in a[:half_m]]
+    a12 = [row[half_n:] for row in a[:half_m]]
+    a21 = [row[:half_n] for row in a[half_m:]]
+    a22 = [row[half_n:] for row in a[half_m:]]
+    b11 = [row[:half_p] for row in b[:half_n]]
+    b12 = [row[half_p:] for row in b[:half_n]]
+    b21 = [row[:half_p] for row in b[half_n:]]
+    b22 = [row[half_p:] for row in b[half_n:]]
+    m1 = strassen_multiply(add_rows(a11, a22), add_rows(b11, b22), threshold)
+    m2 = strassen_multiply(add_rows(a21, a22), b11, threshold)
+    m3 = strassen_multiply(a11, subtract_rows(b12, b22), threshold)
+    m4 = strassen_multiply(a22, subtract_rows(b21, b11), threshold)
+    m5 = strassen_multiply(add_rows(a11, a12), b22, threshold)
+    m6 = strassen_multiply(subtract_rows(a21, a11), add_rows(b11, b12), threshold)
+    m7 = strassen_multiply(subtract_rows(a12, a22), add_rows(b21, b22), threshold)
+    c11 = add_rows(subtract_rows(add_rows(m1, m4), m5), m7)
+    c12 = add_rows(m3, m5)
+    c21 = add_rows(m2, m4)
+    c22 = add_rows(add_rows(subtract_rows(m1, m2), m3), m6)
+    top = [left + right for left, right in zip(c11, c12)]
+    bottom = [left + right for left, right in zip(c21, c22)]
+    return [row[:p] for row in (top + bottom)[:m]]
@@ -0,0 +1,92 @@
+import math
+from array import array
+
+from matrix import Matrix
+from serialization import close_matrix, create_matrix_file, load_matrix
+from storage import promote
+
+
+DEFAULT_MEMORY_BUDGET = 64 * 2 ** 20
+ELEMENT_BYTES = 32
+TILES_IN_FLIGHT = 5
+
+
+def tile_size(memory_budget, m, n, p):
+    size = int(math.sqrt(memory_budget / float(TILES_IN_FLIGHT * ELEMENT_BYTES)))
+    if size < 1:
+        raise ValueError('A memory budget of {0} bytes cannot hold a single tile.'.format(memory_budget))
+    return min(size, max(m, n, p, 1))
+
+
+class OutOfCoreMultiplication(object):
+    def __init__(self, first_path, second_path, output_path, memory_budget=None):
+        self.first = load_matrix(first_path, 'r')
+        try:
+            self.second = load_matrix(second_path, 'r')
+        except Exception:
+            close_matrix(self.first)
+            raise
+        if self.first.n != self.second.m:
+            self.close()
+            raise ValueError('Cannot multiply a {0}x{1} matrix by a {2}x{3} matrix.'.format(
+                self.first.m, self.first.n, self.second.m, self.second.n))
+        self.output_path = output_path
+        self.memory_budget = DEFAULT_MEMORY_BUDGET if memory_budget is None else memory_budget
+        self.tile = tile_size(self.memory_budget, self.first.m, self.first.n, self.second.n)
+        self.data_type = promote(self.first.data_type, self.second.data_type)
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.tiles = 0
+
+    def read_tile(self, matrix, i0, i1, j0, j1):
+        buffer, n = matrix.data.buffer, matrix.n
+        self.bytes_read += (i1 - i0) * (j1 - j0) * buffer.itemsize
+        return Matrix([buffer[i * n + j0:i * n + j1].tolist() for i in range(i0, i1)], data_type=matrix.data_type)
+
+    def write_tile(self, output, rows, i0, j0):
+        buffer, n, typecode = output.data.buffer, output.n, output.data.typecode
+        for i, row in enumerate(rows, i0):
+            buffer[i * n + j0:i * n + j0 + len(row)] = array(typecode, map(self.data_type, row))
+            self.bytes_written += len(row) * buffer.itemsize
+
+    def run(self):
+        m, n, p = self.first.m, self.first.n, self.second.n
+        create_matrix_file(self.output_path, m, p, self.data_type)
+        output = load_matrix(self.output_path, 'r+')
+        tile = self.tile
+        try:
+            for i0 in range(0, m, tile):
+                i1 = min(i0 + tile, m)
+                for j0 in range(0, p, tile):
+                    j1 = min(j0 + tile, p)
+                    accumulator = [[0] * (j1 - j0) for _ in range(i0, i1)]
+                    for k0 in range(0, n, tile):
+                        product = self.read_tile(self.first, i0, i1, k0, min(k0 + tile, n)).multiply(
+                            self.read_tile(self.second, k0, min(k0 + tile, n), j0, j1), algorithm='blocked')
+                        for row, product_row in zip(accumulator, product.data):
+                            row[:] = map(sum, zip(row, product_row))
+                        self.tiles += 1
+                    self.write_tile(output, accumulator, i0, j0)
+        finally:
+            close_matrix(output)
+        return self.report()
+
+    def close(self):
+        close_matrix(self.first)
+        close_matrix(self.second)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+    def report(self):
+        return {'bytes_read': self.bytes_read, 'bytes_written': self.bytes_written, 'tile_size': self.tile,
+                'tiles': self.tiles, 'memory_budget': self.memory_budget,
+                'tile_bytes': TILES_IN_FLIGHT * self.tile * self.tile * ELEMENT_BYTES}
+
+
+def multiply_files(first_path, second_path, output_path, memory_budget=None):
+    with OutOfCoreMultiplication(first_path, second_path, output_path, memory_budget) as multiplication:
+        return multiplication.run()
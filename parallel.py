@@ -0,0 +1,117 @@
+import atexit
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from operator import mul
+
+
+PARALLEL_THRESHOLD = 128
+INT64_LIMIT = 2 ** 63 - 1
+
+
+def multiply_block(task):
+    first_name, columns_name, result_name, typecode, n, p, start, stop = task
+    segments = [SharedMemory(name=name) for name in (first_name, columns_name, result_name)]
+    try:
+        first, columns, result = [segment.buf.cast(typecode) for segment in segments]
+        column_lists = [columns[j * n:(j + 1) * n].tolist() for j in range(p)]
+        for i in range(start, stop):
+            row = first[i * n:(i + 1) * n].tolist()
+            result[i * p:(i + 1) * p] = array(typecode, [sum(map(mul, row, column)) for column in column_lists])
+        for view in (first, columns, result):
+            view.release()
+    finally:
+        for segment in segments:
+            segment.close()
+    return stop - start
+
+
+def packed_typecode(first, second):
+    typecode = 'q'
+    for rows in (first, second):
+        for row in rows:
+            for value in row:
+                if isinstance(value, float):
+                    typecode = 'd'
+                elif not isinstance(value, int) or isinstance(value, bool):
+                    return None
+    if typecode == 'q':
+        first_magnitude = max(abs(value) for row in first for value in row)
+        second_magnitude = max(abs(value) for row in second for value in row)
+        if first_magnitude * second_magnitude * len(second) > INT64_LIMIT:
+            return None
+    return typecode
+
+
+def shared_buffer(values, typecode):
+    buffer = array(typecode, values)
+    shared = SharedMemory(create=True, size=len(buffer) * buffer.itemsize)
+    shared.buf[:len(buffer) * buffer.itemsize] = buffer.tobytes()
+    return shared
+
+
+class ParallelMultiplier(object):
+    def __init__(self, workers=None, threshold=None):
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.threshold = PARALLEL_THRESHOLD if threshold is None else threshold
+        self.executor = None
+
+    def pool(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self.executor
+
+    def accepts(self, m, n, p):
+        return min(m, n, p) >= self.threshold
+
+    def multiply(self, first, second):
+        m, n = len(first), len(second)
+        p = len(second[0]) if n > 0 else 0
+        typecode = packed_typecode(first, second)
+        if typecode is None or m == 0 or n == 0 or p == 0:
+            return None
+        segments = [shared_buffer((value for row in first for value in row), typecode),
+                    shared_buffer((value for column in zip(*second) for value in column), typecode),
+                    SharedMemory(create=True, size=m * p * array(typecode).itemsize)]
+        try:
+            chunk = max(1, -(-m // self.workers))
+            tasks = [(segments[0].name, segments[1].name, segments[2].name, typecode, n, p, start,
+                      min(start + chunk, m)) for start in range(0, m, chunk)]
+            list(self.pool().map(multiply_block, tasks))
+            values = array(typecode)
+            values.frombytes(bytes(segments[2].buf[:m * p * values.itemsize]))
+            return [values[i * p:(i + 1) * p].tolist() for i in range(m)]
+        finally:
+            for segment in segments:
+                segment.close()
+                segment.unlink()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+_multiplier = None
+
+
+def enable_parallel(workers=None, threshold=None):
+    global _multiplier
+    disable_parallel()
+    _multiplier = ParallelMultiplier(workers, threshold)
+    return _multiplier
+
+
+def disable_parallel():
+    global _multiplier
+    if _multiplier is not None:
+        _multiplier.close()
+        _multiplier = None
+
+
+def get_multiplier():
+    return _multiplier
+
+
+atexit.register(disable_parallel)
@@ -0,0 +1,295 @@
+from functions import Variable, Constant, Sum, Product, Power, Exponential
+
+
+KARATSUBA_THRESHOLD = 32
+SPARSE_DENSITY = 0.25
+
+
+class NotAPolynomialException(Exception):
+    pass
+
+
+def add_coefficients(first, second):
+    if len(first) < len(second):
+        first, second = second, first
+    result = list(first)
+    for i, value in enumerate(second):
+        result[i] = result[i] + value
+    return result
+
+
+def subtract_coefficients(first, second):
+    result = list(first) + [0] * (len(second) - len(first))
+    for i, value in enumerate(second):
+        result[i] = result[i] - value
+    return result
+
+
+def naive_convolve(first, second):
+    if not first or not second:
+        return []
+    result = [0] * (len(first) + len(second) - 1)
+    for i, a in enumerate(first):
+        if a == 0:
+            continue
+        for j, b in enumerate(second):
+            result[i + j] = result[i + j] + a * b
+    return result
+
+
+def shift_add(result, values, shift):
+    for i, value in enumerate(values):
+        result[i + shift] = result[i + shift] + value
+
+
+def karatsuba_convolve(first, second, threshold=None):
+    threshold = KARATSUBA_THRESHOLD if threshold is None else threshold
+    if len(first) < len(second):
+        first, second = second, first
+    if len(second) < max(threshold, 2):
+        return naive_convolve(first, second)
+    half = len(first) // 2
+    result = [0] * (len(first) + len(second) - 1)
+    low, high = first[:half], first[half:]
+    if len(second) <= half:
+        shift_add(result, karatsuba_convolve(low, second, threshold), 0)
+        shift_add(result, karatsuba_convolve(high, second, threshold), half)
+        return result
+    second_low, second_high = second[:half], second[half:]
+    z0 = karatsuba_convolve(low, second_low, threshold)
+    z2 = karatsuba_convolve(high, second_high, threshold)
+    z1 = karatsuba_convolve(add_coefficients(low, high), add_coefficients(second_low, second_high), threshold)
+    z1 = subtract_coefficients(subtract_coefficients(z1, z0), z2)
+    shift_add(result, z0, 0)
+    shift_add(result, z1[:len(result) - half], half)
+    shift_add(result, z2, 2 * half)
+    return result
+
+
+class Polynomial(object):
+    coefficients = None
+    variable = 'x'
+
+    def __init__(self, coefficients=None, variable='x'):
+        self.variable = variable
+        if isinstance(coefficients, dict):
+            self.coefficients = {exponent: value for exponent, value in coefficients.items() if value != 0}
+            if any(not isinstance(exponent, int) or exponent < 0 for exponent in self.coefficients):
+                raise ValueError('Exponents must be non-negative integers.')
+        else:
+            self.coefficients = list(coefficients) if coefficients is not None else []
+            while self.coefficients and self.coefficients[-1] == 0:
+                self.coefficients.pop()
+
+    @property
+    def is_sparse(self):
+        return isinstance(self.coefficients, dict)
+
+    @property
+    def degree(self):
+        if self.is_sparse:
+            return max(self.coefficients) if self.coefficients else -1
+        return len(self.coefficients) - 1
+
+    def terms(self):
+        if self.is_sparse:
+            return sorted(self.coefficients.items())
+        return [(exponent, value) for exponent, value in enumerate(self.coefficients) if value != 0]
+
+    def coefficient(self, exponent):
+        if self.is_sparse:
+            return self.coefficients.get(exponent, 0)
+        return self.coefficients[exponent] if 0 <= exponent < len(self.coefficients) else 0
+
+    def to_dense(self):
+        if not self.is_sparse:
+            return self
+        coefficients = [0] * (self.degree + 1)
+        for exponent, value in self.coefficients.items():
+            coefficients[exponent] = value
+        return Polynomial(coefficients, self.variable)
+
+    def to_sparse(self):
+        return self if self.is_sparse else Polynomial(dict(self.terms()), self.variable)
+
+    def compact(self):
+        terms = self.terms()
+        if len(terms) < SPARSE_DENSITY * (self.degree + 1):
+            return self.to_sparse()
+        return self.to_dense()
+
+    def check_variable(self, other):
+        if self.variable != other.variable and self.degree > 0 and other.degree > 0:
+            raise ValueError('Polynomials in {0} and {1} cannot be combined.'.format(self.variable, other.variable))
+        return self.variable if self.degree > 0 else other.variable
+
+    def as_polynomial(self, other):
+        if isinstance(other, Polynomial):
+            return other
+        return Polynomial({0: other} if self.is_sparse else [other], self.variable)
+
+    def evaluate(self, value):
+        if self.is_sparse:
+            result = 0
+            previous = None
+            for exponent, coefficient in sorted(self.coefficients.items(), reverse=True):
+                if previous is not None:
+                    result = result * value ** (previous - exponent)
+                result = result + coefficient
+                previous = exponent
+            return result * value ** previous if previous else result
+        result = 0
+        for coefficient in reversed(self.coefficients):
+            result = result * value + coefficient
+        return result
+
+    def add(self, other):
+        other = self.as_polynomial(other)
+        variable = self.check_variable(other)
+        if self.is_sparse or other.is_sparse:
+            result = dict(self.terms())
+            for exponent, value in other.terms():
+                result[exponent] = result[exponent] + value if exponent in result else value
+            return Polynomial(result, variable)
+        return Polynomial(add_coefficients(self.coefficients, other.coefficients), variable)
+
+    def subtract(self, other):
+        return self.add(self.as_polynomial(other).scalar_multiplication(-1))
+
+    def scalar_multiplication(self, scalar):
+        if self.is_sparse:
+            return Polynomial({exponent: scalar * value for exponent, value in self.coefficients.items()},
+                              self.variable)
+        return Polynomial([scalar * value for value in self.coefficients], self.variable)
+
+    def multiply(self, other, threshold=None):
+        other = self.as_polynomial(other)
+        variable = self.check_variable(other)
+        if self.is_sparse or other.is_sparse:
+            result = {}
+            for exponent, value in self.terms():
+                for other_exponent, other_value in other.terms():
+                    product = value * other_value
+                    key = exponent + other_exponent
+                    result[key] = result[key] + product if key in result else product
+            return Polynomial(result, variable)
+        return Polynomial(karatsuba_convolve(self.coefficients, other.coefficients, threshold), variable)
+
+    def power(self, exponent):
+        if not isinstance(exponent, int) or exponent < 0:
+            raise ValueError('Polynomials can only be raised to non-negative integer powers.')
+        result = Polynomial({0: 1} if self.is_sparse else [1], self.variable)
+        base = self
+        while exponent:
+            if exponent & 1:
+                result = result.multiply(base)
+            exponent >>= 1
+            if exponent:
+                base = base.multiply(base)
+        return result
+
+    def derivative(self):
+        if self.is_sparse:
+            return Polynomial({exponent - 1: exponent * value for exponent, value in self.coefficients.items()
+                               if exponent > 0}, self.variable)
+        return Polynomial([exponent * value for exponent, value in enumerate(self.coefficients)][1:], self.variable)
+
+    def to_function(self):
+        variable = Variable(self.variable)
+        summands = []
+        for exponent, value in self.terms():
+            if exponent == 0:
+                summands.append(Constant(value))
+            elif exponent == 1:
+                summands.append(Product([Constant(value), variable]) if value != 1 else variable)
+            else:
+                power = Power(variable, exponent)
+                summands.append(Product([Constant(value), power]) if value != 1 else power)
+        if not summands:
+            return Constant(0)
+        return summands[0] if len(summands) == 1 else Sum(summands)
+
+    @staticmethod
+    def from_function(function, variable=None, sparse=False):
+        if variable is None:
+            names = function.variables()
+            if len(names) > 1:
+                raise NotAPolynomialException('{0} depends on more than one variable.'.format(function))
+            variable = names[0] if names else 'x'
+        converted = {}
+        for node in function.nodes():
+            converted[id(node)] = Polynomial.from_node(node, [converted[id(child)] for child in node.children()],
+                                                       variable, sparse)
+        return converted[id(function)]
+
+    @staticmethod
+    def from_node(node, arguments, variable, sparse):
+        if isinstance(node, Constant):
+            return Polynomial({0: node.constant} if sparse else [node.constant], variable)
+        if isinstance(node, Variable):
+            if node.name != variable:
+                raise NotAPolynomialException('{0} is not a polynomial in {1}.'.format(node, variable))
+            return Polynomial({1: 1} if sparse else [0, 1], variable)
+        if isinstance(node, Sum):
+            result = Polynomial({} if sparse else [], variable)
+            for argument in arguments:
+                result = result.add(argument)
+            return result
+        if isinstance(node, Product):
+            result = Polynomial({0: 1} if sparse else [1], variable)
+            for argument in arguments:
+                result = result.multiply(argument)
+            return result
+        if isinstance(node, Power) and isinstance(node.power, int) and node.power >= 0:
+            return arguments[0].power(node.power)
+        if isinstance(node, Exponential) and arguments[1].degree <= 0:
+            exponent = arguments[1].coefficient(0)
+            if exponent == int(exponent) and exponent >= 0:
+                return arguments[0].power(int(exponent))
+        raise NotAPolynomialException('{0} is not a polynomial in {1}.'.format(node, variable))
+
+    def __add__(self, other):
+        return self.add(other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self.subtract(other)
+
+    def __rsub__(self, other):
+        return self.as_polynomial(other).subtract(self)
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return self.scalar_multiplication(-1)
+
+    def __pow__(self, exponent, modulo=None):
+        return self.power(exponent)
+
+    def __eq__(self, other):
+        if not isinstance(other, Polynomial):
+            return self.degree <= 0 and self.coefficient(0) == other
+        return self.terms() == other.terms() and (self.variable == other.variable or self.degree <= 0)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        if self.degree <= 0:
+            return hash(self.coefficient(0))
+        return hash((self.variable, tuple(self.terms())))
+
+    def __str__(self):
+        terms = []
+        for exponent, value in reversed(self.terms()):
+            if exponent == 0:
+                terms.append('{0}'.format(value))
+            elif exponent == 1:
+                terms.append('{0}*{1}'.format(value, self.variable))
+            else:
+                terms.append('{0}*{1}^{2}'.format(value, self.variable, exponent))
+        return ' + '.join(terms) if terms else '0'
@@ -0,0 +1,195 @@
+import math
+import weakref
+
+from functions import Function, Constant, Sum, Product, Power, Logarithm, Exponential
+
+
+NUMBERS = (int, float, complex)
+
+
+def is_number(value, number):
+    return isinstance(value, Constant) and value.constant == number
+
+
+def split_coefficient(function):
+    if isinstance(function, Product) and isinstance(function.multiplicands[0], Constant):
+        rest = function.multiplicands[1:]
+        return function.multiplicands[0].constant, rest[0] if len(rest) == 1 else Product(rest)
+    return 1, function
+
+
+def split_power(function):
+    if isinstance(function, Power) and isinstance(function.power, NUMBERS):
+        return function.function, function.power
+    return function, 1
+
+
+def flatten(function, arguments):
+    result = []
+    for argument in arguments:
+        if type(argument) is type(function):
+            result.extend(argument.children())
+        else:
+            result.append(argument)
+    return result
+
+
+def rewrite_sum(function):
+    constant = None
+    coefficients = {}
+    for summand in flatten(function, function.summands):
+        if isinstance(summand, Constant):
+            constant = summand.constant if constant is None else constant + summand.constant
+            continue
+        coefficient, term = split_coefficient(summand)
+        coefficients[term] = coefficients[term] + coefficient if term in coefficients else coefficient
+    summands = [Constant(constant)] if constant is not None and constant != 0 else []
+    for term, coefficient in coefficients.items():
+        if coefficient == 0:
+            continue
+        if coefficient == 1:
+            summands.append(term)
+        else:
+            factors = list(term.multiplicands) if isinstance(term, Product) else [term]
+            summands.append(Product([Constant(coefficient)] + factors))
+    if not summands:
+        return Constant(0 if constant is None else constant)
+    if len(summands) == 1:
+        return summands[0]
+    return None if tuple(summands) == function.summands else Sum(summands)
+
+
+def rewrite_product(function):
+    constant = None
+    exponents = {}
+    for multiplicand in flatten(function, function.multiplicands):
+        if isinstance(multiplicand, Constant):
+            constant = multiplicand.constant if constant is None else constant * multiplicand.constant
+            continue
+        base, exponent = split_power(multiplicand)
+        exponents[base] = exponents[base] + exponent if base in exponents else exponent
+    if constant is not None and constant == 0:
+        return Constant(constant)
+    multiplicands = [Constant(constant)] if constant is not None and constant != 1 else []
+    for base, exponent in exponents.items():
+        if exponent != 0:
+            multiplicands.append(base if exponent == 1 else Power(base, exponent))
+    if not multiplicands:
+        return Constant(1 if constant is None else constant)
+    if len(multiplicands) == 1:
+        return multiplicands[0]
+    return None if tuple(multiplicands) == function.multiplicands else Product(multiplicands)
+
+
+def rewrite_power(function):
+    if function.power == 0:
+        return Constant(1)
+    if function.power == 1:
+        return function.function
+    if isinstance(function.function, Constant):
+        try:
+            return Constant(function.function.constant ** function.power)
+        except (ArithmeticError, ValueError):
+            return None
+    inner = function.function
+    if isinstance(inner, Power) and isinstance(inner.power, int) and isinstance(function.power, int):
+        return Power(inner.function, inner.power * function.power)
+    if isinstance(inner, Product) and isinstance(function.power, int):
+        return Product([Power(factor, function.power) for factor in inner.multiplicands])
+    return None
+
+
+def rewrite_logarithm(function):
+    inner = function.function
+    if isinstance(inner, Constant):
+        try:
+            return Constant(math.log(inner.constant, function.base))
+        except (ArithmeticError, ValueError):
+            return None
+    if isinstance(inner, Exponential) and isinstance(inner.base, Constant):
+        if inner.base.constant == function.base:
+            return inner.power
+        try:
+            return Product([Constant(math.log(inner.base.constant, function.base)), inner.power])
+        except (ArithmeticError, ValueError):
+            return None
+    return None
+
+
+def rewrite_exponential(function):
+    if isinstance(function.power, Constant):
+        return Power(function.base, function.power.constant)
+    if is_number(function.base, 1):
+        return Constant(1)
+    return None
+
+
+STANDARD_RULES = {
+    Sum: [rewrite_sum],
+    Product: [rewrite_product],
+    Power: [rewrite_power],
+    Logarithm: [rewrite_logarithm],
+    Exponential: [rewrite_exponential],
+}
+
+
+class RewriteEngine(object):
+    def __init__(self, rules=None):
+        self.rules = {}
+        for node_type, node_rules in (rules or {}).items():
+            for rule in node_rules:
+                self.register(node_type, rule)
+        self.reset()
+
+    def register(self, node_type, rule):
+        self.rules.setdefault(node_type, []).append(rule)
+        self.reset()
+
+    def reset(self):
+        self.normal = weakref.WeakSet()
+        self.normal_forms = weakref.WeakKeyDictionary()
+        self.rewrites = 0
+
+    def is_normal(self, function):
+        return function in self.normal
+
+    def lookup(self, function):
+        if function in self.normal:
+            return function
+        return self.normal_forms.get(function)
+
+    def normalize(self, function):
+        result = self.lookup(function)
+        if result is not None:
+            return result
+        for node in function.nodes():
+            if self.lookup(node) is None:
+                self.rewrite(node.rebuild([self.lookup(child) for child in node.children()]), node)
+        return self.lookup(function)
+
+    def rewrite(self, function, original=None):
+        result = self.lookup(function)
+        if result is None:
+            for rule in self.rules.get(type(function), ()):
+                rewritten = rule(function)
+                if rewritten is not None and rewritten is not function:
+                    self.rewrites += 1
+                    result = self.normalize(rewritten)
+                    break
+            else:
+                result = function
+                self.normal.add(function)
+            if result is not function:
+                self.normal_forms[function] = result
+        if original is not None and result is not original:
+            self.normal_forms[original] = result
+        return result
+
+
+DEFAULT_ENGINE = RewriteEngine(STANDARD_RULES)
+
+
+def normalize(function):
+    if not isinstance(function, Function):
+        raise TypeError('Cannot normalize {0!r}.'.format(function))
+    return DEFAULT_ENGINE.normalize(function)
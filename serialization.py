@@ -0,0 +1,167 @@
+import csv
+import mmap
+import struct
+import sys
+from array import array
+
+from matrix import Matrix
+from storage import PackedStorage, PACKED_TYPECODES, PACKED_TYPES, is_packed
+
+
+MAGIC = b'MTRX'
+VERSION = 1
+HEADER = struct.Struct('<4sBc2xQQ8x')
+CHUNK_ROWS = 1024
+MMAP_MODES = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}
+SWAP_BYTES = sys.byteorder != 'little'
+
+
+class MatrixFormatException(Exception):
+    pass
+
+
+def infer_data_type(rows):
+    data_type = int
+    for row in rows:
+        for value in row:
+            if isinstance(value, float):
+                data_type = float
+            elif not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError('Only int and float matrices can be stored in the binary format, found {0!r}.'.format(
+                    value))
+    return data_type
+
+
+def read_header(source):
+    header = source.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise MatrixFormatException('File is too short to contain a matrix header.')
+    magic, version, typecode, m, n = HEADER.unpack(header)
+    typecode = typecode.decode('ascii')
+    if magic != MAGIC or version != VERSION or typecode not in PACKED_TYPES:
+        raise MatrixFormatException('Unrecognised matrix file header.')
+    return m, n, typecode
+
+
+class MatrixWriter(object):
+    def __init__(self, path, n, data_type=float):
+        self.path = path
+        self.n = n
+        self.m = 0
+        self.data_type = data_type
+        self.typecode = PACKED_TYPECODES[data_type]
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.typecode.encode('ascii'), 0, n))
+
+    def write_row(self, row):
+        values = array(self.typecode, map(self.data_type, row))
+        if len(values) != self.n:
+            raise ValueError('Row length {0} does not match the number of columns {1}.'.format(len(values), self.n))
+        if SWAP_BYTES:
+            values.byteswap()
+        values.tofile(self.file)
+        self.m += 1
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.write_row(row)
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.typecode.encode('ascii'), self.m, self.n))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+
+def create_matrix_file(path, m, n, data_type=float):
+    typecode = PACKED_TYPECODES[data_type]
+    with open(path, 'wb') as output:
+        output.write(HEADER.pack(MAGIC, VERSION, typecode.encode('ascii'), m, n))
+        output.truncate(HEADER.size + m * n * array(typecode).itemsize)
+    return path
+
+
+def save_matrix(matrix, path, data_type=None):
+    if data_type is None:
+        data_type = matrix.data.data_type if is_packed(matrix.data) else infer_data_type(matrix.data)
+    with MatrixWriter(path, matrix.n, data_type) as writer:
+        if is_packed(matrix.data) and matrix.data.data_type == data_type and not SWAP_BYTES:
+            view = matrix.data.view
+            for start in range(0, matrix.m, CHUNK_ROWS):
+                writer.file.write(view[start * matrix.n:min(start + CHUNK_ROWS, matrix.m) * matrix.n])
+            writer.m = matrix.m
+        else:
+            writer.write_rows(matrix.data)
+    return path
+
+
+def load_matrix(path, mmap_mode=None):
+    if mmap_mode is not None and mmap_mode not in MMAP_MODES:
+        raise ValueError('Unknown mmap mode {0}, expected one of {1}.'.format(mmap_mode, sorted(MMAP_MODES)))
+    with open(path, 'r+b' if mmap_mode == 'r+' else 'rb') as source:
+        m, n, typecode = read_header(source)
+        itemsize = array(typecode).itemsize
+        size = HEADER.size + m * n * itemsize
+        if source.seek(0, 2) < size:
+            raise MatrixFormatException('File is truncated: expected {0} bytes.'.format(size))
+        if mmap_mode is None or SWAP_BYTES:
+            source.seek(HEADER.size)
+            buffer = array(typecode)
+            buffer.fromfile(source, m * n)
+            if SWAP_BYTES:
+                buffer.byteswap()
+        else:
+            mapped = mmap.mmap(source.fileno(), size, access=MMAP_MODES[mmap_mode])
+            buffer = memoryview(mapped)[HEADER.size:size].cast(typecode)
+    return Matrix(PackedStorage(m, n, typecode, buffer))
+
+
+def close_matrix(matrix):
+    data = matrix.data
+    if not is_packed(data) or not isinstance(data.buffer, memoryview) or not isinstance(data.buffer.obj, mmap.mmap):
+        return
+    mapped = data.buffer.obj
+    if mapped.closed:
+        return
+    typecode, size = data.typecode, data.nbytes
+    mapped.flush()
+    data.view.release()
+    data.buffer.release()
+    try:
+        mapped.close()
+    except BufferError:
+        data.buffer = memoryview(mapped)[HEADER.size:HEADER.size + size].cast(typecode)
+        data.view = memoryview(data.buffer)
+        raise
+
+
+def iterate_rows(source, data_type=float, delimiter=',', skip_header=False):
+    if isinstance(source, str):
+        with open(source, newline='') as stream:
+            for row in iterate_rows(stream, data_type, delimiter, skip_header):
+                yield row
+        return
+    reader = csv.reader(source, delimiter=delimiter) if delimiter is not None else (
+        line.split() for line in source)
+    if skip_header:
+        next(reader, None)
+    for row in reader:
+        if row:
+            yield [data_type(value) for value in row]
+
+
+def convert_csv(source, path, data_type=float, delimiter=',', skip_header=False):
+    rows = iterate_rows(source, data_type, delimiter, skip_header)
+    first = next(rows, None)
+    with MatrixWriter(path, len(first) if first is not None else 0, data_type) as writer:
+        if first is not None:
+            writer.write_row(first)
+            writer.write_rows(rows)
+    return writer.m, writer.n
@@ -0,0 +1,250 @@
+from array import array
+
+from matrix import Matrix
+from storage import is_packed, promote
+
+
+class SparseMatrix(object):
+    m = 0
+    n = 0
+
+    def check_shape(self, other):
+        if other.m != self.m or other.n != self.n:
+            raise ValueError('Matrix dimensions do not match: {0}x{1} and {2}x{3}.'.format(
+                self.m, self.n, other.m, other.n))
+
+    def density(self):
+        return float(self.nnz) / (self.m * self.n) if self.m * self.n > 0 else 0.0
+
+    def __add__(self, other):
+        return self.add(other)
+
+    __radd__ = __add__
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return self.scalar_multiplication(other)
+        return self.multiply(other)
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return self.scalar_multiplication(other)
+        return self.rmultiply(other)
+
+    def __eq__(self, other):
+        if not isinstance(other, SparseMatrix):
+            return False
+        return (self.m, self.n) == (other.m, other.n) and self.to_matrix().data == other.to_matrix().data
+
+    def __str__(self):
+        return '{0}'.format(self.to_matrix())
+
+
+class COOMatrix(SparseMatrix):
+    def __init__(self, m, n, rows=None, columns=None, values=None):
+        self.m = m
+        self.n = n
+        self.rows = array('q', rows if rows is not None else [])
+        self.columns = array('q', columns if columns is not None else [])
+        self.values = list(values) if values is not None else []
+        if not len(self.rows) == len(self.columns) == len(self.values):
+            raise ValueError('rows, columns and values must have the same length.')
+
+    @staticmethod
+    def from_matrix(matrix):
+        result = COOMatrix(matrix.m, matrix.n)
+        for i, row in enumerate(matrix.data):
+            for j, value in enumerate(row):
+                if value != 0:
+                    result.rows.append(i)
+                    result.columns.append(j)
+                    result.values.append(value)
+        return result
+
+    @property
+    def nnz(self):
+        return len(self.values)
+
+    def to_matrix(self):
+        result = Matrix(m=self.m, n=self.n)
+        for i, j, value in zip(self.rows, self.columns, self.values):
+            result.data[i][j] += value
+        return result
+
+    def to_csr(self):
+        return CSRMatrix.from_coo(self)
+
+    def to_coo(self):
+        return self
+
+    def transpose(self):
+        return COOMatrix(self.n, self.m, self.columns, self.rows, self.values)
+
+    def scalar_multiplication(self, scalar):
+        return COOMatrix(self.m, self.n, self.rows, self.columns, [scalar * value for value in self.values])
+
+    def add(self, other):
+        return self.to_csr().add(other)
+
+    def multiply(self, other):
+        return self.to_csr().multiply(other)
+
+    def rmultiply(self, other):
+        return self.to_csr().rmultiply(other)
+
+
+class CSRMatrix(SparseMatrix):
+    def __init__(self, m, n, indptr=None, indices=None, values=None):
+        self.m = m
+        self.n = n
+        self.indptr = array('q', indptr if indptr is not None else [0] * (m + 1))
+        self.indices = array('q', indices if indices is not None else [])
+        self.values = list(values) if values is not None else []
+        if len(self.indptr) != m + 1 or len(self.indices) != len(self.values):
+            raise ValueError('indptr must have m + 1 entries and indices must match values.')
+
+    @staticmethod
+    def from_matrix(matrix):
+        indptr = array('q', [0])
+        indices = array('q')
+        values = []
+        for row in (matrix.data.tolist() if is_packed(matrix.data) else matrix.data):
+            for j, value in enumerate(row):
+                if value != 0:
+                    indices.append(j)
+                    values.append(value)
+            indptr.append(len(values))
+        return CSRMatrix(matrix.m, matrix.n, indptr, indices, values)
+
+    @staticmethod
+    def from_coo(coo):
+        counts = [0] * (coo.m + 1)
+        for i in coo.rows:
+            counts[i + 1] += 1
+        for i in range(coo.m):
+            counts[i + 1] += counts[i]
+        position = counts[:-1]
+        indices = array('q', bytes(8 * coo.nnz))
+        values = [0] * coo.nnz
+        for i, j, value in zip(coo.rows, coo.columns, coo.values):
+            indices[position[i]] = j
+            values[position[i]] = value
+            position[i] += 1
+        return CSRMatrix(coo.m, coo.n, counts, indices, values).sum_duplicates()
+
+    @property
+    def nnz(self):
+        return len(self.values)
+
+    def row(self, i):
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:stop], self.values[start:stop]
+
+    def sum_duplicates(self):
+        indptr = array('q', [0])
+        indices = array('q')
+        values = []
+        for i in range(self.m):
+            accumulator = {}
+            for j, value in zip(*self.row(i)):
+                accumulator[j] = accumulator[j] + value if j in accumulator else value
+            for j in sorted(accumulator):
+                if accumulator[j] != 0:
+                    indices.append(j)
+                    values.append(accumulator[j])
+            indptr.append(len(values))
+        return CSRMatrix(self.m, self.n, indptr, indices, values)
+
+    def to_matrix(self):
+        result = Matrix(m=self.m, n=self.n)
+        for i in range(self.m):
+            row = result.data[i]
+            for j, value in zip(*self.row(i)):
+                row[j] = value
+        return result
+
+    def to_coo(self):
+        rows = array('q')
+        for i in range(self.m):
+            rows.extend([i] * (self.indptr[i + 1] - self.indptr[i]))
+        return COOMatrix(self.m, self.n, rows, self.indices, self.values)
+
+    def to_csr(self):
+        return self
+
+    def transpose(self):
+        return CSRMatrix.from_coo(self.to_coo().transpose())
+
+    def scalar_multiplication(self, scalar):
+        return CSRMatrix(self.m, self.n, self.indptr, self.indices, [scalar * value for value in self.values])
+
+    def add(self, other):
+        self.check_shape(other)
+        if isinstance(other, SparseMatrix):
+            other = other.to_csr()
+            indptr = array('q', [0])
+            indices = array('q')
+            values = []
+            for i in range(self.m):
+                accumulator = dict(zip(*self.row(i)))
+                for j, value in zip(*other.row(i)):
+                    accumulator[j] = accumulator[j] + value if j in accumulator else value
+                for j in sorted(accumulator):
+                    if accumulator[j] != 0:
+                        indices.append(j)
+                        values.append(accumulator[j])
+                indptr.append(len(values))
+            return CSRMatrix(self.m, self.n, indptr, indices, values)
+        data_type = other.data_type
+        for value_type in set(map(type, self.values)):
+            data_type = promote(data_type, value_type)
+        result = other.promoted_copy(data_type)
+        for i in range(self.m):
+            row = result.data[i]
+            for j, value in zip(*self.row(i)):
+                row[j] = value + row[j]
+        return result
+
+    def multiply(self, other):
+        if self.n != other.m:
+            raise ValueError('Cannot multiply a {0}x{1} matrix by a {2}x{3} matrix.'.format(
+                self.m, self.n, other.m, other.n))
+        if isinstance(other, SparseMatrix):
+            other = other.to_csr()
+            indptr = array('q', [0])
+            indices = array('q')
+            values = []
+            for i in range(self.m):
+                accumulator = {}
+                for k, value in zip(*self.row(i)):
+                    for j, other_value in zip(*other.row(k)):
+                        product = value * other_value
+                        accumulator[j] = accumulator[j] + product if j in accumulator else product
+                for j in sorted(accumulator):
+                    if accumulator[j] != 0:
+                        indices.append(j)
+                        values.append(accumulator[j])
+                indptr.append(len(values))
+            return CSRMatrix(self.m, other.n, indptr, indices, values)
+        dense = other.data.tolist() if is_packed(other.data) else other.data
+        result = Matrix(m=self.m, n=other.n)
+        for i in range(self.m):
+            row = result.data[i]
+            for k, value in zip(*self.row(i)):
+                for j, other_value in enumerate(dense[k]):
+                    row[j] += value * other_value
+        return result
+
+    def rmultiply(self, other):
+        if other.n != self.m:
+            raise ValueError('Cannot multiply a {0}x{1} matrix by a {2}x{3} matrix.'.format(
+                other.m, other.n, self.m, self.n))
+        dense = other.data.tolist() if is_packed(other.data) else other.data
+        result = Matrix(m=other.m, n=self.n)
+        for i, dense_row in enumerate(dense):
+            row = result.data[i]
+            for k, dense_value in enumerate(dense_row):
+                if dense_value != 0:
+                    for j, value in zip(*self.row(k)):
+                        row[j] += dense_value * value
+        return result
@@ -0,0 +1,345 @@
+from array import array
+from itertools import islice, repeat
+import operator
+
+
+PACKED_TYPECODES = {float: 'd', int: 'q'}
+PACKED_TYPES = {'d': float, 'q': int}
+ASSIGN_CHUNK = 4096
+
+
+def is_packed(data):
+    return isinstance(data, PackedStorage)
+
+
+def promote(first_type, second_type):
+    if first_type == second_type:
+        return first_type
+    if {first_type, second_type} == {int, float}:
+        return float
+    return None
+
+
+class PackedRow(object):
+    __slots__ = ('values',)
+
+    def __init__(self, values):
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return self.values[j].tolist()
+        return self.values[j]
+
+    def __setitem__(self, j, value):
+        self.values[j] = value
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __eq__(self, other):
+        return self.values.tolist() == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def tolist(self):
+        return self.values.tolist()
+
+    def __str__(self):
+        return '{0}'.format(self.values.tolist())
+
+    __repr__ = __str__
+
+
+class PackedStorage(object):
+    __slots__ = ('m', 'n', 'buffer', 'view')
+
+    def __init__(self, m, n, typecode, buffer=None):
+        self.m = m
+        self.n = n
+        self.buffer = buffer if buffer is not None else array(typecode, bytes(m * n * array(typecode).itemsize))
+        self.view = memoryview(self.buffer)
+
+    @staticmethod
+    def from_rows(rows, data_type):
+        typecode = PACKED_TYPECODES[data_type]
+        rows = list(rows)
+        m = len(rows)
+        n = len(rows[0]) if m > 0 else 0
+        buffer = array(typecode)
+        for row in rows:
+            if len(row) != n:
+                raise ValueError('All rows must have the same length.')
+            values = [data_type(value) for value in row]
+            if data_type is int and values != list(row):
+                raise ValueError('Cannot store non-integral values in a packed int matrix.')
+            buffer.extend(values)
+        return PackedStorage(m, n, typecode, buffer)
+
+    @property
+    def typecode(self):
+        return self.buffer.typecode if isinstance(self.buffer, array) else self.buffer.format
+
+    @property
+    def data_type(self):
+        return PACKED_TYPES[self.typecode]
+
+    @property
+    def nbytes(self):
+        return self.buffer.itemsize * len(self.buffer)
+
+    def __len__(self):
+        return self.m
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.m
+        if not 0 <= i < self.m:
+            raise IndexError('row index out of range')
+        return PackedRow(self.view[i * self.n:(i + 1) * self.n])
+
+    def __setitem__(self, i, row):
+        if i < 0:
+            i += self.m
+        if not 0 <= i < self.m:
+            raise IndexError('row index out of range')
+        values = [self.data_type(value) for value in row]
+        if len(values) != self.n:
+            raise ValueError('Row length does not match the number of columns.')
+        self.buffer[i * self.n:(i + 1) * self.n] = array(self.typecode, values)
+
+    def __iter__(self):
+        for i in range(self.m):
+            yield PackedRow(self.view[i * self.n:(i + 1) * self.n])
+
+    def __eq__(self, other):
+        if isinstance(other, PackedStorage):
+            return self.m == other.m and self.n == other.n and self.buffer == other.buffer
+        return self.tolist() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __str__(self):
+        return '{0}'.format(self.tolist())
+
+    __repr__ = __str__
+
+    def tolist(self):
+        n = self.n
+        return [self.buffer[i * n:(i + 1) * n].tolist() for i in range(self.m)]
+
+    def copy(self, data_type=None):
+        if data_type is None or PACKED_TYPECODES[data_type] == self.typecode:
+            return PackedStorage(self.m, self.n, self.typecode, array(self.typecode, self.buffer))
+        return PackedStorage(self.m, self.n, PACKED_TYPECODES[data_type],
+                             array(PACKED_TYPECODES[data_type], map(data_type, self.buffer)))
+
+    def assign(self, values):
+        values = iter(values)
+        for start in range(0, len(self.buffer), ASSIGN_CHUNK):
+            chunk = array(self.typecode, islice(values, ASSIGN_CHUNK))
+            self.buffer[start:start + len(chunk)] = chunk
+
+    def swap_rows(self, i, k):
+        if i == k:
+            return
+        n = self.n
+        row = array(self.typecode, self.buffer[i * n:(i + 1) * n])
+        self.buffer[i * n:(i + 1) * n] = self.buffer[k * n:(k + 1) * n]
+        self.buffer[k * n:(k + 1) * n] = row
+
+    def transposed(self):
+        buffer = array(self.typecode)
+        for j in range(self.n):
+            buffer.extend(self.buffer[j::self.n])
+        return PackedStorage(self.n, self.m, self.typecode, buffer)
+
+    def scaled(self, scalar):
+        data_type = promote(self.data_type, type(scalar)) or float
+        typecode = PACKED_TYPECODES[data_type]
+        try:
+            buffer = array(typecode, map(operator.mul, repeat(scalar), self.buffer))
+        except OverflowError:
+            return [[scalar * value for value in row] for row in self.tolist()]
+        return PackedStorage(self.m, self.n, typecode, buffer)
+
+    def added(self, other):
+        data_type = promote(self.data_type, other.data_type)
+        typecode = PACKED_TYPECODES[data_type]
+        try:
+            buffer = array(typecode, map(operator.add, self.buffer, other.buffer))
+        except OverflowError:
+            return [list(map(operator.add, row, other_row)) for row, other_row in zip(self.tolist(), other.tolist())]
+        return PackedStorage(self.m, self.n, typecode, buffer)
+
+
+def is_view(data):
+    return isinstance(data, ViewStorage)
+
+
+def compose(outer, inner):
+    if isinstance(outer, range) and isinstance(inner, range):
+        return range(outer.start + inner.start * outer.step, outer.start + inner.stop * outer.step,
+                     outer.step * inner.step)
+    return tuple(map(outer.__getitem__, inner))
+
+
+class ViewRow(object):
+    __slots__ = ('storage', 'i')
+
+    def __init__(self, storage, i):
+        self.storage = storage
+        self.i = i
+
+    def __len__(self):
+        return self.storage.n
+
+    def __getitem__(self, j):
+        return self.storage.get(self.i, j)
+
+    def __setitem__(self, j, value):
+        self.storage.set(self.i, j, value)
+
+    def __iter__(self):
+        return iter(self.storage.row_values(self.i))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __str__(self):
+        return '{0}'.format(list(self))
+
+    __repr__ = __str__
+
+
+class ViewStorage(object):
+    __slots__ = ('source', 'rows', 'columns', 'transposed', 'data_type', 'materialized')
+
+    def __init__(self, source, rows, columns, data_type=None, transposed=False):
+        self.source = source
+        self.rows = rows
+        self.columns = columns
+        self.transposed = transposed
+        self.data_type = data_type
+        self.materialized = None
+
+    @staticmethod
+    def of(data, rows, columns, data_type=None, transposed=False):
+        if is_view(data) and data.materialized is not None:
+            data = data.materialized
+        if not is_view(data):
+            return ViewStorage(data, rows, columns, data_type, transposed)
+        if data.transposed:
+            return ViewStorage(data.source, compose(data.rows, columns), compose(data.columns, rows), data_type,
+                               not transposed)
+        return ViewStorage(data.source, compose(data.rows, rows), compose(data.columns, columns), data_type,
+                           transposed)
+
+    @property
+    def m(self):
+        if self.materialized is not None:
+            return len(self.materialized)
+        return len(self.columns) if self.transposed else len(self.rows)
+
+    @property
+    def n(self):
+        if self.materialized is not None:
+            return len(self.materialized[0]) if len(self.materialized) > 0 else 0
+        return len(self.rows) if self.transposed else len(self.columns)
+
+    def get(self, i, j):
+        if self.materialized is not None:
+            return self.materialized[i][j]
+        if self.transposed:
+            i, j = j, i
+        if is_packed(self.source):
+            return self.source.buffer[self.rows[i] * self.source.n + self.columns[j]]
+        return self.source[self.rows[i]][self.columns[j]]
+
+    def set(self, i, j, value):
+        self.materialize()[i][j] = value
+
+    def row_values(self, i):
+        if self.materialized is not None:
+            return list(self.materialized[i])
+        if self.transposed:
+            column = self.columns[i]
+            return [self.source[row][column] for row in self.rows]
+        row = self.source[self.rows[i]]
+        return [row[column] for column in self.columns]
+
+    def materialize(self):
+        if self.materialized is None:
+            rows = self.tolist()
+            self.materialized = PackedStorage.from_rows(rows, self.data_type) \
+                if self.data_type in PACKED_TYPECODES else rows
+            self.source = self.rows = self.columns = None
+        return self.materialized
+
+    def __len__(self):
+        return self.m
+
+    def __getitem__(self, i):
+        if self.materialized is not None:
+            return self.materialized[i]
+        if i < 0:
+            i += self.m
+        if not 0 <= i < self.m:
+            raise IndexError('row index out of range')
+        return ViewRow(self, i)
+
+    def __setitem__(self, i, row):
+        self.materialize()[i] = row
+
+    def __iter__(self):
+        for i in range(self.m):
+            yield self[i]
+
+    def __eq__(self, other):
+        if is_view(other) or is_packed(other):
+            other = other.tolist()
+        return self.tolist() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __str__(self):
+        return '{0}'.format(self.tolist())
+
+    __repr__ = __str__
+
+    def tolist(self):
+        if is_packed(self.materialized):
+            return self.materialized.tolist()
+        return [list(self.row_values(i)) for i in range(self.m)]
+
+    def copy(self, data_type=None):
+        data_type = self.data_type if data_type is None else data_type
+        if data_type in PACKED_TYPECODES:
+            return PackedStorage.from_rows(self.tolist(), data_type)
+        return self.tolist()
+
+    def swap_rows(self, i, k):
+        if self.materialized is not None:
+            if is_packed(self.materialized):
+                self.materialized.swap_rows(i, k)
+            else:
+                self.materialized[i], self.materialized[k] = self.materialized[k], self.materialized[i]
+        elif self.transposed:
+            self.columns = swapped(self.columns, i, k)
+        else:
+            self.rows = swapped(self.rows, i, k)
+
+
+def swapped(indices, i, k):
+    indices = list(indices)
+    indices[i], indices[k] = indices[k], indices[i]
+    return tuple(indices)
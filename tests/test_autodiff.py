@@ -0,0 +1,81 @@
+import math
+from unittest import skipIf
+from unittest.case import TestCase
+
+from autodiff import Dual, Tape, derivative_many, forward_derivative, reverse_derivative
+from functions import Variable, Constant, Sum, Product, Power, Logarithm, Exponential, numpy
+
+
+class AutodiffTest(TestCase):
+    evaluate_values = [0.5, 1, 2, 3.7, math.pi, 7.25]
+
+    def setUp(self):
+        x = Variable('x')
+        self.functions = [
+            x,
+            Constant(3.5),
+            Sum([x, Constant(2), Product([Constant(3), x])]),
+            Product([Sum([x, Constant(1)]), Power(x, 3), Constant(-2)]),
+            Product([x, Constant(0), Power(x, 2)]),
+            Power(Sum([Product([x, x]), Constant(1)]), 0.5),
+            Exponential(Constant(2), Product([x, Constant(0.1)])),
+            Exponential(x, x),
+            Logarithm(Sum([Power(x, 2), Constant(1)]), math.e),
+            Product([Sum([x, Constant(1)]), Power(x, 3), Exponential(math.e, x), Logarithm(x, 10)]),
+        ]
+
+    def tearDown(self):
+        pass
+
+    def test_matches_symbolic_derivative(self):
+        for function in self.functions:
+            derivative = function.derivative()
+            for value in self.evaluate_values:
+                expected = (function.evaluate(value), derivative.evaluate(value))
+                for differentiate in (forward_derivative, reverse_derivative):
+                    result = differentiate(function, value)
+                    self.assertAlmostEqual(result[0], expected[0], delta=1e-9 * max(1.0, abs(expected[0])))
+                    self.assertAlmostEqual(result[1], expected[1], delta=1e-9 * max(1.0, abs(expected[1])))
+
+    def test_dual(self):
+        x = Dual(2.0, 1.0)
+        result = 3 * x * x + 1
+        self.assertEqual((result.value, result.derivative), (13.0, 12.0))
+        result = x ** 3
+        self.assertEqual((result.value, result.derivative), (8.0, 12.0))
+        result = x.log(2)
+        self.assertAlmostEqual(result.value, 1.0)
+        self.assertAlmostEqual(result.derivative, 1.0 / (2.0 * math.log(2)))
+
+    def test_tape_records_each_node_once(self):
+        x = Variable('x')
+        shared = Sum([x, Constant(1)])
+        function = Product([shared, shared, shared])
+        tape = Tape(function, 2.0)
+        self.assertEqual(len(tape.entries), len(function.nodes()))
+        self.assertEqual(tape.value, 27.0)
+        self.assertEqual(tape.backward(), 27.0)
+
+    def test_derivative_many_lists(self):
+        function = self.functions[3]
+        for mode in ('forward', 'reverse'):
+            values, derivatives = derivative_many(function, self.evaluate_values, mode)
+            self.assertEqual(len(values), len(self.evaluate_values))
+            for value, result, derivative in zip(self.evaluate_values, values, derivatives):
+                self.assertAlmostEqual(result, function.evaluate(value))
+                self.assertAlmostEqual(derivative, function.derivative().evaluate(value))
+        with self.assertRaises(ValueError):
+            derivative_many(function, [1.0], 'sideways')
+
+    @skipIf(numpy is None, 'numpy is not installed')
+    def test_derivative_many_arrays(self):
+        points = numpy.array(self.evaluate_values)
+        for function in self.functions:
+            for mode in ('forward', 'reverse'):
+                values, derivatives = derivative_many(function, points, mode)
+                self.assertEqual(values.shape, points.shape)
+                self.assertEqual(derivatives.shape, points.shape)
+                for value, result, derivative in zip(self.evaluate_values, values, derivatives):
+                    expected = forward_derivative(function, value)
+                    self.assertAlmostEqual(result, expected[0], delta=1e-9 * max(1.0, abs(expected[0])))
+                    self.assertAlmostEqual(derivative, expected[1], delta=1e-9 * max(1.0, abs(expected[1])))
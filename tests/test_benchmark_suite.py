@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+from unittest.case import TestCase
+
+from benchmarks.suite import case_key, compare, load, run, save
+
+
+class BenchmarkSuiteTest(TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_case_key(self):
+        self.assertEqual(case_key('matrix.det', {'type': 'int', 'n': 8}), 'matrix.det[n=8,type=int]')
+
+    def test_run_and_round_trip(self):
+        report = run(sizes=[2], depths=[1], data_types=['int'], repeat=1, minimum=0.001)
+        names = set(result['name'] for result in report['results'])
+        self.assertEqual(names, {'matrix.multiply', 'matrix.det', 'matrix.inverse', 'matrix.gauss_jordan_reduction',
+                                 'matrix.transpose', 'function.evaluate', 'function.simplify',
+                                 'function.derivative'})
+        for result in report['results']:
+            self.assertGreater(result['seconds'], 0)
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'results.json')
+        try:
+            save(report, path)
+            self.assertEqual(load(path), json.loads(json.dumps(report)))
+        finally:
+            os.remove(path)
+            os.rmdir(directory)
+
+    def test_compare(self):
+        baseline = {'results': [{'key': 'a', 'seconds': 1.0}, {'key': 'b', 'seconds': 1.0},
+                                {'key': 'c', 'seconds': 1.0}]}
+        report = {'results': [{'key': 'a', 'seconds': 1.1}, {'key': 'b', 'seconds': 1.5},
+                              {'key': 'd', 'seconds': 9.0}]}
+        comparisons = compare(report, baseline, threshold=0.2)
+        self.assertEqual([comparison['key'] for comparison in comparisons], ['a', 'b'])
+        self.assertEqual([comparison['regression'] for comparison in comparisons], [False, True])
+        self.assertEqual([comparison['regression'] for comparison in compare(report, baseline, 0.6)], [False, False])
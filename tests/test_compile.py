@@ -0,0 +1,59 @@
+import math
+from unittest.case import TestCase
+from functions import Variable, Constant, Product, Sum, Power, Exponential, Logarithm
+
+
+class CompileTest(TestCase):
+    evaluate_values = [1, 2, 3, 4, 5, 6, 7, 8,
+                       1.9, 2.9, 29.209992, 100, -11, -12, 0.5,
+                       -12.092, math.pi, math.e]
+
+    def setUp(self):
+        x = Variable('x')
+        self.functions = [
+            x,
+            Constant(3.5),
+            Sum([x, Constant(2), Product([Constant(3), x])]),
+            Product([Sum([x, Constant(1)]), Power(x, 3), Constant(-2)]),
+            Power(Sum([Product([x, x]), Constant(1)]), 0.5),
+            Exponential(Constant(2), Product([x, Constant(0.1)])),
+            Logarithm(Sum([Power(x, 2), Constant(1)]), math.e),
+            Sum([Product([Constant(2), Constant(3)]), Power(Constant(2), 10), x]),
+        ]
+
+    def tearDown(self):
+        pass
+
+    def test_compiled_matches_tree_walk(self):
+        for function in self.functions:
+            compiled = function.compile()
+            for value in self.evaluate_values:
+                self.assertEqual(function.evaluate(value), compiled(value))
+
+    def test_constants_are_folded(self):
+        function = Sum([Product([Constant(2), Constant(3)]), Power(Constant(2), 10), Variable('x')])
+        compiled = function.compile()
+        self.assertEqual(compiled.source.count(' = '), 1)
+        self.assertEqual(compiled(1), 1031.0)
+        folded = Product([Constant(2), Constant(3)]).compile()
+        self.assertEqual(folded.source.count(' = '), 0)
+        self.assertEqual(folded(0), 6.0)
+
+    def test_deep_expressions_compile(self):
+        function = Variable('x')
+        for _ in range(300):
+            function = Sum([function, Constant(1)])
+        self.assertEqual(function.compile()(1), function.evaluate(1))
+
+    def test_shared_subexpressions_are_computed_once(self):
+        shared = Sum([Variable('x'), Constant(1)])
+        compiled = Product([shared, shared]).compile()
+        self.assertEqual(compiled.source.count(' = '), 2)
+        self.assertEqual(compiled(2), 9.0)
+
+    def test_compiled_errors_match_tree_walk(self):
+        function = Logarithm(Variable('x'), 10)
+        with self.assertRaises(ValueError):
+            function.compile()(-1)
+        with self.assertRaises(ValueError):
+            Logarithm(Constant(-1), 10).compile()(1)
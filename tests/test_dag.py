@@ -0,0 +1,56 @@
+import math
+from unittest.case import TestCase
+
+from autodiff import forward_derivative, reverse_derivative
+from functions import Variable, Constant, Sum, Product, Power, Logarithm, Exponential, cache_info, clear_cache
+from polynomial import Polynomial
+
+
+class DAGTest(TestCase):
+    evaluate_values = [0.5, 1, 2, 3.7, math.pi]
+
+    def setUp(self):
+        x = Variable('x')
+        self.function = Product([Sum([x, Constant(1)]), Power(x, 3), Exponential(math.e, x),
+                                 Logarithm(Sum([x, Constant(2)]), math.e)])
+
+    def tearDown(self):
+        pass
+
+    def test_nodes_are_unique_and_topological(self):
+        function = self.function.derivative().derivative()
+        nodes = function.nodes()
+        self.assertEqual(len(set(map(id, nodes))), len(nodes))
+        self.assertIs(nodes[-1], function)
+        positions = {id(node): index for index, node in enumerate(nodes)}
+        for index, node in enumerate(nodes):
+            for child in node.children():
+                self.assertLess(positions[id(child)], index)
+
+    def test_evaluate_shared(self):
+        function = self.function
+        for _ in range(4):
+            function = function.derivative()
+            for value in self.evaluate_values:
+                self.assertAlmostEqual(function.evaluate_shared(value), function.evaluate(value))
+
+    def test_derivative_size_is_polynomial(self):
+        function = self.function
+        sizes = []
+        for _ in range(8):
+            function = function.derivative()
+            sizes.append(len(function.nodes()))
+        self.assertLess(sizes[-1], 400)
+        for previous, current in zip(sizes, sizes[1:]):
+            self.assertLess(current - previous, 2 * sizes[0] + 20)
+
+    def test_mixed_numeric_constants(self):
+        x = Variable('x')
+        clear_cache()
+        self.assertEqual(len(Sum([x, Constant(1)]).nodes()), 3)
+        self.assertEqual(cache_info()['entries'], 0)
+        self.assertEqual(Sum([x, Constant(1.0)]).evaluate_shared(2), 3)
+        function = Product([x, Sum([x, Constant(1.0)])])
+        self.assertEqual(forward_derivative(function, 2.0), (6.0, 5.0))
+        self.assertEqual(reverse_derivative(function, 2.0), (6.0, 5.0))
+        self.assertEqual(Polynomial.from_function(function).evaluate(3), 12)
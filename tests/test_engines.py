@@ -0,0 +1,113 @@
+from unittest import skipUnless
+from unittest.case import TestCase
+from engines import numpy_available, set_engine, get_engine, EngineNotAvailableException
+from lazy import lazy
+from matrix import Matrix, Fraction
+
+
+class EngineConformanceTest(TestCase):
+    int_rows = [[3, 7, 8, 2], [4, 5, 3, 4], [3, 2, 1, 7], [1, 9, 4, 6]]
+    float_rows = [[3.5, 7.0, 8.0, 2.25], [4.0, 5.5, 3.0, 4.0], [3.0, 2.0, 1.75, 7.0], [1.0, 9.0, 4.0, 6.5]]
+
+    def setUp(self):
+        self.previous_engine = get_engine()
+
+    def tearDown(self):
+        set_engine(self.previous_engine)
+
+    def build(self, rows, data_type, engine):
+        return Matrix([list(row) for row in rows], data_type=data_type, engine=engine)
+
+    def assertSameData(self, expected, actual, exact_types=True):
+        expected = expected.data if isinstance(expected, Matrix) else expected
+        actual = actual.data if isinstance(actual, Matrix) else actual
+        if not isinstance(expected, list) and not hasattr(expected, 'tolist'):
+            self.assertAlmostEqual(expected, actual)
+            self.assertEqual(type(expected), type(actual))
+            return
+        self.assertEqual(type(expected), type(actual))
+        self.assertEqual(len(expected), len(actual))
+        for expected_row, actual_row in zip(expected, actual):
+            for expected_value, actual_value in zip(expected_row, actual_row):
+                if exact_types:
+                    self.assertEqual(type(expected_value), type(actual_value))
+                if isinstance(expected_value, float) or isinstance(actual_value, float):
+                    self.assertAlmostEqual(expected_value, actual_value)
+                else:
+                    self.assertEqual(expected_value, actual_value)
+
+    def operations(self, engine, rows, data_type):
+        a = self.build(rows, data_type, engine)
+        b = self.build([row[::-1] for row in rows], data_type, engine)
+        return [a.multiply(b), a.add(b), a.scalar_multiplication(3), a.scalar_multiplication(0.5),
+                a.transpose(), a.det(), (a * b - b).transpose(),
+                (lazy(a) * b + lazy(b) * 0.5 - a).evaluate(), (lazy(a) * 2 - b).evaluate()]
+
+    @skipUnless(numpy_available(), 'numpy is not installed')
+    def test_engines_produce_identical_results(self):
+        for rows in (self.int_rows, self.float_rows):
+            for data_type in (None, float, int if rows is self.int_rows else float):
+                python_results = self.operations('python', rows, data_type)
+                numpy_results = self.operations('numpy', rows, data_type)
+                for expected, actual in zip(python_results, numpy_results):
+                    self.assertSameData(expected, actual)
+                python_inverse = self.build(rows, data_type, 'python').inverse()
+                numpy_inverse = self.build(rows, data_type, 'numpy').inverse()
+                self.assertSameData(python_inverse, numpy_inverse, exact_types=False)
+
+    @skipUnless(numpy_available(), 'numpy is not installed')
+    def test_global_engine_selection(self):
+        set_engine('numpy')
+        a = Matrix([list(row) for row in self.float_rows])
+        self.assertSameData(Matrix([list(row) for row in self.float_rows], engine='python').multiply(a),
+                            a.multiply(a))
+
+    def test_fraction_entries_fall_back_to_python(self):
+        rows = [[Fraction(1, 2), Fraction(1, 3)], [Fraction(1, 4), Fraction(1, 5)]]
+        for engine in ('python', 'numpy') if numpy_available() else ('python',):
+            m = Matrix([list(row) for row in rows], engine=engine)
+            self.assertEqual(m.add(m).data[0], [Fraction(1, 1), Fraction(2, 3)])
+            self.assertEqual(m.transpose().data[0], [Fraction(1, 2), Fraction(1, 4)])
+            self.assertEqual(m.det(), Fraction(1, 10) - Fraction(1, 12))
+
+    @skipUnless(numpy_available(), 'numpy is not installed')
+    def test_int_overflow_falls_back_to_python(self):
+        big = 2 ** 40
+        m = Matrix([[big, big], [big, big]], engine='numpy')
+        self.assertEqual(m.multiply(m).data, [[2 * big * big, 2 * big * big], [2 * big * big, 2 * big * big]])
+
+    def test_results_keep_the_operand_engine(self):
+        for engine in ('python', 'numpy') if numpy_available() else ('python',):
+            for data_type in (None, int, float):
+                a = self.build(self.float_rows if data_type is float else self.int_rows, data_type, engine)
+                results = [a.multiply(a), a.multiply(a).multiply(a), a.add(a), a.subtract(a),
+                           a.scalar_multiplication(2), a.transpose(), a.inverse(), a.copy(), a.axpy(2, a)]
+                for result in results:
+                    self.assertEqual(result.engine, engine)
+
+    def test_shape_mismatch_is_rejected_by_every_engine(self):
+        for engine in ('python', 'numpy') if numpy_available() else ('python',):
+            a = Matrix([[1, 2], [3, 4]], engine=engine)
+            b = Matrix([[1, 2]], engine=engine)
+            for operation in (a.add, a.subtract, b.multiply(a).multiply):
+                with self.assertRaises(ValueError):
+                    operation(b)
+
+    @skipUnless(numpy_available(), 'numpy is not installed')
+    def test_mixed_rows_match_across_engines(self):
+        rows = [[1, 2.5, 3], [4, 5, 6.5], [7.5, 8, 9]]
+        python_results = self.operations('python', rows, None)
+        numpy_results = self.operations('numpy', rows, None)
+        for expected, actual in zip(python_results, numpy_results):
+            self.assertSameData(expected, actual)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(EngineNotAvailableException):
+            set_engine('fortran')
+        with self.assertRaises(EngineNotAvailableException):
+            Matrix([[1]], engine='fortran')
+
+    @skipUnless(not numpy_available(), 'numpy is installed')
+    def test_numpy_engine_requires_numpy(self):
+        with self.assertRaises(EngineNotAvailableException):
+            set_engine('numpy')
@@ -0,0 +1,55 @@
+import math
+from array import array
+from unittest import skipUnless
+from unittest.case import TestCase
+from functions import Variable, Constant, Product, Sum, Power, Exponential, Logarithm, numpy
+
+
+class EvaluateManyTest(TestCase):
+    evaluate_values = [1, 2, 3, 4, 5, 6, 7, 8,
+                       1.9, 2.9, 29.209992, 100, 0.5, math.pi, math.e]
+
+    def setUp(self):
+        x = Variable('x')
+        self.functions = [
+            x,
+            Constant(3.5),
+            Sum([x, Constant(2), Product([Constant(3), x])]),
+            Product([Sum([x, Constant(1)]), Power(x, 3), Constant(-2)]),
+            Power(Sum([Product([x, x]), Constant(1)]), 0.5),
+            Exponential(Constant(2), Product([x, Constant(0.1)])),
+            Exponential(x, Constant(2)),
+            Logarithm(Sum([Power(x, 2), Constant(1)]), math.e),
+        ]
+
+    def tearDown(self):
+        pass
+
+    def test_evaluate_many_matches_evaluate(self):
+        for function in self.functions:
+            for values in (self.evaluate_values, tuple(self.evaluate_values), array('d', self.evaluate_values)):
+                result = function.evaluate_many(values)
+                self.assertIsInstance(result, array)
+                self.assertEqual(len(result), len(values))
+                for value, batch_value in zip(values, result):
+                    self.assertAlmostEqual(function.evaluate(value), batch_value)
+
+    def test_evaluate_many_empty(self):
+        self.assertEqual(len(Sum([Variable('x'), Constant(1)]).evaluate_many([])), 0)
+
+    def test_evaluate_many_complex_results(self):
+        result = Power(Variable('x'), 0.5).evaluate_many([-4.0, 4.0])
+        self.assertAlmostEqual(result[0], (-4.0) ** 0.5)
+        self.assertAlmostEqual(result[1], 2.0)
+
+    @skipUnless(numpy is not None, 'numpy is not installed')
+    def test_evaluate_many_numpy(self):
+        values = numpy.array(self.evaluate_values)
+        for function in self.functions:
+            result = function.evaluate_many(values)
+            self.assertIsInstance(result, numpy.ndarray)
+            self.assertEqual(result.shape, values.shape)
+            self.assertIsNot(result, values)
+            for value, batch_value in zip(self.evaluate_values, result):
+                self.assertAlmostEqual(function.evaluate(value), batch_value)
+        self.assertEqual(Power(Variable('x'), -1).evaluate_many(numpy.array([1, 2])).tolist(), [1.0, 0.5])
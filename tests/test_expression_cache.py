@@ -0,0 +1,81 @@
+import math
+from unittest.case import TestCase
+
+from functions import Variable, Constant, Sum, Product, Power, Logarithm, Exponential, ExpressionCache, \
+    DEFAULT_CACHE_SIZE, cache_info, clear_cache, set_cache_size
+
+
+class ExpressionCacheTest(TestCase):
+    def setUp(self):
+        clear_cache()
+
+    def tearDown(self):
+        set_cache_size(DEFAULT_CACHE_SIZE)
+        clear_cache()
+
+    def test_repeated_calls_hit_the_cache(self):
+        x = Variable('x')
+        function = Product([Sum([x, Constant(1)]), Power(x, 3), Exponential(math.e, x)])
+        first = function.derivative()
+        misses = cache_info()['misses']
+        second = function.derivative()
+        self.assertIs(first, second)
+        self.assertEqual(cache_info()['misses'], misses)
+        self.assertGreater(cache_info()['hits'], 0)
+
+    def test_results_match_uncached(self):
+        x = Variable('x')
+        functions = [Product([Sum([x, Constant(1)]), Power(x, 3), Constant(-2)]),
+                     Logarithm(Sum([Power(x, 2), Constant(1)]), math.e),
+                     Exponential(Constant(2), Product([x, Constant(0.1)]))]
+        cached = [function.derivative().derivative() for function in functions]
+        set_cache_size(0)
+        clear_cache()
+        uncached = [function.derivative().derivative() for function in functions]
+        self.assertEqual(cache_info()['entries'], 0)
+        for first, second in zip(cached, uncached):
+            self.assertIs(first, second)
+            self.assertAlmostEqual(first.evaluate(0.7), second.evaluate(0.7))
+
+    def test_lru_eviction(self):
+        cache = ExpressionCache(2)
+        x = Variable('x')
+        calls = []
+
+        def compute(function):
+            calls.append(function)
+            return function
+
+        for power in (2, 3, 2, 4, 3):
+            cache.lookup('simplify', Power(x, power), compute)
+        self.assertEqual([function.power for function in calls], [2, 3, 4, 3])
+        self.assertEqual(cache.info(), {'hits': 1, 'misses': 4, 'size': 2, 'entries': 2})
+        cache.resize(1)
+        self.assertEqual(cache.info()['entries'], 1)
+
+    def test_logarithm_simplify(self):
+        x = Variable('x')
+        self.assertEqual(Logarithm(Sum([x]), 2).simplify(), Logarithm(x, 2))
+        self.assertAlmostEqual(Logarithm(Constant(8), 2).simplify().constant, 3.0)
+
+    def test_keyword_arguments_share_entries(self):
+        x, y = Variable('x'), Variable('y')
+        functions = [Sum([x, y]), Product([x, y]), Power(x, 3), Logarithm(x, math.e), Exponential(math.e, x)]
+        for function in functions:
+            first = function.derivative('x')
+            misses = cache_info()['misses']
+            self.assertIs(function.derivative(variable='x'), first)
+            self.assertEqual(cache_info()['misses'], misses)
+
+    def test_nodes_memoize_without_the_global_cache(self):
+        set_cache_size(0)
+        x = Variable('x')
+        function = Product([Sum([x, Constant(1)]), Power(x, 3), Exponential(math.e, x)])
+        first = function.derivative()
+        misses = cache_info()['misses']
+        self.assertIs(function.derivative(), first)
+        self.assertEqual(cache_info()['misses'], misses)
+        self.assertEqual(cache_info()['entries'], 0)
+        clear_cache()
+        self.assertIs(function.derivative(), first)
+        self.assertGreater(cache_info()['misses'], 0)
@@ -0,0 +1,65 @@
+from unittest.case import TestCase
+from factorization import LUFactorization, SingularMatrixException
+from matrix import Matrix, Fraction
+
+
+class LUFactorizationTest(TestCase):
+    def setUp(self):
+        self.matrix = Matrix([[2, 1, 1], [4, -6, 0], [-2, 7, 2]])
+
+    def tearDown(self):
+        pass
+
+    def test_solve_vector(self):
+        solution = self.matrix.factorize().solve([5, -2, 9])
+        for expected, value in zip([1, 1, 2], solution):
+            self.assertAlmostEqual(expected, value)
+
+    def test_solve_many_right_hand_sides(self):
+        factorization = self.matrix.factorize()
+        b = Matrix([[5, 1], [-2, 0], [9, 0]])
+        x = factorization.solve(b)
+        self.assertIsInstance(x, Matrix)
+        product = self.matrix.multiply(x)
+        for i in range(b.m):
+            for j in range(b.n):
+                self.assertAlmostEqual(b.data[i][j], product.data[i][j])
+
+    def test_solutions_keep_type_and_engine(self):
+        factorization = self.matrix.factorize()
+        x = factorization.solve(Matrix([[5, 1], [-2, 0], [9, 0]], data_type=int, engine='python'))
+        self.assertEqual(x.data_type, float)
+        self.assertEqual(x.engine, 'python')
+        m = Matrix([[2, 1], [1, 3]], data_type=Fraction)
+        x = m.solve(Matrix([[3], [5]], data_type=Fraction))
+        self.assertEqual(x.data_type, Fraction)
+        self.assertEqual(x.data, [[Fraction(4, 5)], [Fraction(7, 5)]])
+
+    def test_det_and_rank(self):
+        factorization = self.matrix.factorize()
+        self.assertAlmostEqual(factorization.det(), self.matrix.det())
+        self.assertEqual(factorization.rank, 3)
+        self.assertEqual(Matrix([[1, 2, 3], [2, 4, 6], [1, 0, 1]]).factorize().rank, 2)
+        self.assertEqual(Matrix([[1, 2], [3, 4], [5, 6]]).factorize().rank, 2)
+        self.assertEqual(Matrix([[1, 2], [2, 4]]).factorize().det(), 0)
+
+    def test_exact_fraction_factorization(self):
+        m = Matrix([[2, 1], [1, 3]], data_type=Fraction)
+        self.assertEqual(m.solve([Fraction(3, 1), Fraction(5, 1)]), [Fraction(4, 5), Fraction(7, 5)])
+        self.assertEqual(m.factorize().det(), Fraction(5, 1))
+
+    def test_factorization_is_cached(self):
+        factorization = self.matrix.factorize()
+        self.assertIs(factorization, self.matrix.factorize())
+        self.matrix.data[0][0] = 3
+        self.assertIsNot(factorization, self.matrix.factorize())
+        packed = Matrix([[2, 1], [1, 3]], data_type=float)
+        self.assertIs(packed.factorize(), packed.factorize())
+
+    def test_singular_solve(self):
+        with self.assertRaises(SingularMatrixException):
+            Matrix([[1, 2], [2, 4]]).solve([1, 2])
+        with self.assertRaises(SingularMatrixException):
+            LUFactorization([[1, 2, 3]]).solve([1])
+        with self.assertRaises(ValueError):
+            self.matrix.solve([1, 2])
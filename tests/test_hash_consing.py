@@ -0,0 +1,77 @@
+import copy
+import math
+import pickle
+from unittest.case import TestCase
+
+from functions import Variable, Constant, Sum, Product, Power, Logarithm, Exponential
+
+
+class HashConsingTest(TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_equal_nodes_are_shared(self):
+        x = Variable('x')
+        first = Sum([Product([Constant(2), x]), Power(x, 2)])
+        second = Sum((Product([Constant(2), Variable('x')]), Power(Variable('x'), 2)))
+        self.assertIs(first, second)
+        self.assertIs(Exponential(math.e, x), Exponential(Constant(math.e), x))
+        self.assertIs(Logarithm(2, x), Logarithm(2, x))
+
+    def test_distinct_nodes(self):
+        x = Variable('x')
+        self.assertIsNot(Power(x, 2), Power(x, 3))
+        self.assertNotEqual(Power(x, 2), Power(x, 3))
+        self.assertNotEqual(Sum([x, Constant(1)]), Product([x, Constant(1)]))
+        self.assertNotEqual(Variable('x'), Variable('y'))
+
+    def test_equal_numeric_constants_keep_their_type(self):
+        x = Variable('x')
+        self.assertIsNot(Constant(1), Constant(1.0))
+        self.assertEqual(Constant(1), Constant(1.0))
+        self.assertEqual(Sum([x, Constant(2)]), Sum([x, Constant(2.0)]))
+        self.assertEqual(hash(Power(x, 2.0)), hash(Power(x, 2)))
+        self.assertIsInstance(Constant(2.0).evaluate(0), float)
+        self.assertEqual(str(Constant(1.0)), '1.0')
+        self.assertEqual(Constant.zero().constant, 0.0)
+        self.assertIsInstance(Constant.zero().constant, float)
+        self.assertNotEqual(Constant(1), Constant(1.5))
+        self.assertIsInstance(Sum([x, Constant(2)]).derivative(), Constant)
+
+    def test_keyword_construction_and_copies(self):
+        x = Variable(name='x')
+        self.assertIs(x, Variable('x'))
+        self.assertIs(Power(function=x, power=2), Power(x, 2))
+        function = Sum([Product([Constant(2), x]), Exponential(math.e, x)])
+        self.assertIs(copy.deepcopy(function), function)
+        self.assertIs(pickle.loads(pickle.dumps(function)), function)
+        with self.assertRaises(TypeError):
+            Variable(label='x')
+
+    def test_dictionary_keys(self):
+        x = Variable('x')
+        table = {Power(x, 2): 'square', Exponential(math.e, x): 'exp'}
+        self.assertEqual(table[Power(Variable('x'), 2)], 'square')
+        self.assertEqual(table[Exponential(math.e, Variable('x'))], 'exp')
+
+    def test_nodes_are_immutable(self):
+        x = Variable('x')
+        with self.assertRaises(AttributeError):
+            x.name = 'y'
+        with self.assertRaises(AttributeError):
+            Sum([x]).summands = ()
+
+    def test_repeated_derivatives_share_subexpressions(self):
+        x = Variable('x')
+        function = Product([Power(x, 3), Exponential(math.e, x)])
+        first = function
+        for _ in range(4):
+            first = first.derivative()
+        second = function
+        for _ in range(4):
+            second = second.derivative()
+        self.assertIs(first, second)
+        self.assertAlmostEqual(first.evaluate(0.5), second.evaluate(0.5))
@@ -0,0 +1,64 @@
+import math
+from unittest.case import TestCase
+
+from functions import Variable, Constant, Sum, Product, Power, Exponential, clear_cache
+from instrumentation import Profiler, derivative_statistics, expression_statistics
+
+
+class InstrumentationTest(TestCase):
+    def setUp(self):
+        self.x = Variable('x')
+        clear_cache()
+
+    def tearDown(self):
+        clear_cache()
+
+    def test_expression_statistics(self):
+        x = self.x
+        shared = Sum([x, Constant(1)])
+        function = Product([shared, Power(shared, 2), Constant(3)])
+        statistics = expression_statistics(function)
+        self.assertEqual(statistics['unique_nodes'], 6)
+        self.assertEqual(statistics['tree_nodes'], 9)
+        self.assertEqual(statistics['shared_nodes'], 1)
+        self.assertEqual(statistics['depth'], 4)
+        self.assertEqual(statistics['node_types'], {'Variable': 1, 'Constant': 2, 'Sum': 1, 'Power': 1,
+                                                    'Product': 1})
+        self.assertGreater(statistics['tree_cost'], statistics['dag_cost'])
+
+    def test_statistics_of_large_derivatives(self):
+        function = Product([Power(self.x, 3), Exponential(math.e, self.x)])
+        for _ in range(12):
+            function = function.derivative()
+        statistics = expression_statistics(function)
+        self.assertGreater(statistics['tree_nodes'], 100 * statistics['unique_nodes'])
+        growth = derivative_statistics(Product([Power(self.x, 3), Exponential(math.e, self.x)]))
+        self.assertEqual(set(growth), {'function', 'derivative', 'growth'})
+        self.assertGreater(growth['growth'], 1.0)
+
+    def test_profiler(self):
+        function = Product([Power(self.x, 3), Exponential(math.e, self.x)])
+        original = Product.__dict__['evaluate']
+        with Profiler() as profiler:
+            function.derivative().evaluate(0.5)
+        self.assertIs(Product.__dict__['evaluate'], original)
+        counters = profiler.as_dict()
+        self.assertIn('derivative', counters['Product'])
+        self.assertEqual(counters['Variable']['evaluate']['calls'], 4)
+        for operations in counters.values():
+            for counter in operations.values():
+                self.assertGreaterEqual(counter['total'], counter['self'])
+        calls = counters['Product']['evaluate']['calls']
+        function.evaluate(0.5)
+        self.assertEqual(profiler.as_dict()['Product']['evaluate']['calls'], calls)
+        profiler.reset()
+        self.assertEqual(profiler.as_dict(), {})
+
+    def test_profiler_selected_operations(self):
+        profiler = Profiler(['evaluate']).enable()
+        try:
+            Sum([self.x, Constant(2)]).simplify().evaluate(1.0)
+        finally:
+            profiler.disable()
+        self.assertEqual(set(operation for operations in profiler.as_dict().values() for operation in operations),
+                         {'evaluate'})
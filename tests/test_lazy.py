@@ -0,0 +1,108 @@
+import random
+from unittest.case import TestCase
+
+from lazy import Evaluator, LinearCombination, Product, chain_order, lazy
+from matrix import Fraction, Matrix
+
+
+class LazyTest(TestCase):
+    def setUp(self):
+        random.seed(0)
+
+    def tearDown(self):
+        pass
+
+    def random_matrix(self, m, n, data_type=int, engine=None):
+        return Matrix([[random.randint(-9, 9) for _ in range(n)] for _ in range(m)], data_type=data_type,
+                      engine=engine)
+
+    def test_operators_build_a_graph(self):
+        a, b, c = [self.random_matrix(3, 3) for _ in range(3)]
+        expression = lazy(a) * b + lazy(c) * 2 - a
+        self.assertIsInstance(expression, LinearCombination)
+        self.assertEqual([coefficient for coefficient, _ in expression.terms()], [1, 2, -1])
+        self.assertIsInstance(expression.terms()[0][1], Product)
+
+    def test_fused_combination_matches_eager(self):
+        for engine in ('python', None):
+            a, b, c, d = [self.random_matrix(4, 4, engine=engine) for _ in range(4)]
+            expected = a.multiply(b).add(c.scalar_multiplication(2)).subtract(d)
+            result = (lazy(a) * b + 2 * lazy(c) - d).evaluate()
+            self.assertEqual(result.data, expected.data)
+
+    def test_repeated_terms_are_merged(self):
+        a, b = self.random_matrix(2, 3), self.random_matrix(2, 3)
+        expression = lazy(a) + b + a - lazy(b) * 3
+        self.assertEqual(len(expression.terms()), 2)
+        self.assertEqual(expression.evaluate().data, a.scalar_multiplication(2).subtract(
+            b.scalar_multiplication(2)).data)
+
+    def test_chain_order_picks_cheapest_parenthesization(self):
+        cost, splits = chain_order([10, 100, 5, 50])
+        self.assertEqual(cost, 7500)
+        self.assertEqual(splits[0][2], 1)
+        self.assertEqual(chain_order([40, 20, 30, 10, 30])[0], 26000)
+
+    def test_chain_product_is_reordered(self):
+        a, b, c = self.random_matrix(10, 30), self.random_matrix(30, 5), self.random_matrix(5, 60)
+        d = self.random_matrix(60, 2)
+        expression = lazy(a) * b * c * d
+        self.assertEqual(len(expression.factors), 4)
+        self.assertLess(expression.cost(), 10 * 30 * 5 + 10 * 5 * 60 + 10 * 60 * 2)
+        evaluator = Evaluator()
+        result = evaluator.evaluate(expression)
+        self.assertEqual(evaluator.multiplications, expression.cost())
+        self.assertEqual(result.data, a.multiply(b).multiply(c).multiply(d).data)
+
+    def test_scalars_are_pulled_out_of_products(self):
+        a, b = self.random_matrix(3, 2), self.random_matrix(2, 3)
+        expression = (lazy(a) * 2) * (-lazy(b))
+        self.assertEqual(expression.terms()[0][0], -2)
+        self.assertEqual(expression.evaluate().data, a.multiply(b).scalar_multiplication(-2).data)
+
+    def test_temporary_buffers_are_reused(self):
+        a, b, c = [self.random_matrix(3, 3, engine='python') for _ in range(3)]
+        evaluator = Evaluator()
+        result = evaluator.evaluate(lazy(a) * b - c)
+        self.assertEqual(evaluator.allocations, 1)
+        self.assertEqual(evaluator.reused, 1)
+        self.assertEqual(result.data, a.multiply(b).subtract(c).data)
+
+    def test_evaluate_into_output(self):
+        a, b = self.random_matrix(2, 2, float), self.random_matrix(2, 2, float)
+        out = Matrix(m=2, n=2, data_type=float)
+        result = (lazy(a) * 0.5 + b).evaluate(out)
+        self.assertIs(result, out)
+        self.assertEqual(out.data, a.scalar_multiplication(0.5).add(b).data)
+        self.assertIs((lazy(a) * b).evaluate(out), out)
+        self.assertEqual(out.data, a.multiply(b).data)
+
+    def test_fraction_matrices(self):
+        a = Matrix([[Fraction(1, 2), Fraction(1, 3)], [Fraction(1, 4), Fraction(1, 5)]], data_type=Fraction)
+        b = Matrix([[1, 2], [3, 4]], data_type=Fraction)
+        result = (lazy(a) * b - lazy(b) * 3).evaluate()
+        self.assertEqual(result.data, a.multiply(b).subtract(b.scalar_multiplication(3)).data)
+
+    def test_shape_mismatch(self):
+        a, b = self.random_matrix(2, 3), self.random_matrix(3, 2)
+        with self.assertRaises(ValueError):
+            lazy(a) + b
+        with self.assertRaises(ValueError):
+            lazy(a) * a
+        self.assertEqual((lazy(a) * b).m, 2)
+
+    def test_results_never_alias_operands(self):
+        a, b = self.random_matrix(2, 2), self.random_matrix(2, 2)
+        for expression in (lazy(a), lazy(a) + lazy(b) - lazy(b)):
+            result = expression.evaluate()
+            self.assertIsNot(result, a)
+            result.data[0][0] = 100
+            self.assertNotEqual(a.data[0][0], 100)
+
+    def test_int_overflow_falls_back_to_lists(self):
+        a = Matrix([[2 ** 62, 1], [1, 2 ** 62]], data_type=int, engine='python')
+        b = Matrix([[1, 2], [3, 4]], data_type=int, engine='python')
+        for expression, expected in ((lazy(a) + a, a + a), (lazy(a) * 3 - b, a * 3 - b)):
+            result = expression.evaluate()
+            self.assertEqual(result.data, expected.data)
+            self.assertIsNone(result.data_type)
@@ -1,5 +1,5 @@
 from unittest.case import TestCase
-from matrix import Matrix, Fraction
+from matrix import Matrix, Fraction, InvalidMatrixDeterminantException
 
 
 class MatrixTest(TestCase):
@@ -21,6 +21,35 @@ class MatrixTest(TestCase):
         m = Matrix([[1, 2, 3, 4], [4, 5, 8, 3], [7, 9, 1, 2], [7, 4, 2, 1]])
         self.assertEqual(m.det(), 727)
 
+    def test_determinant_1dimensional_matrix(self):
+        self.assertEqual(Matrix([[7]]).det(), 7)
+
+    def test_determinant_requires_row_exchange(self):
+        m = Matrix([[0, 2, 1], [3, 0, 4], [1, 5, 0]])
+        self.assertEqual(m.det(), 23)
+        m = Matrix([[0.0, 2.0, 1.0], [3.0, 0.0, 4.0], [1.0, 5.0, 0.0]])
+        self.assertAlmostEqual(m.det(), 23.0)
+
+    def test_determinant_float_matrix(self):
+        m = Matrix([[1.5, 2, 3, 4], [4, 5, 8, 3], [7, 9, 1, 2], [7, 4, 2, 1]])
+        self.assertAlmostEqual(m.det(), 736.5)
+
+    def test_determinant_fraction_matrix(self):
+        m = Matrix([[2, 3, 4], [7, 8, 3], [4, 7, 8]], data_type=Fraction)
+        self.assertEqual(m.det(), Fraction(22, 1))
+
+    def test_determinant_large_matrix(self):
+        size = 30
+        data = [[(i * 7 + j * 3) % 11 - 5 + (10 if i == j else 0) for j in range(size)] for i in range(size)]
+        exact = Matrix(data).det()
+        self.assertIsInstance(exact, int)
+        approximate = Matrix([[float(value) for value in row] for row in data]).det()
+        self.assertAlmostEqual(approximate / exact, 1.0)
+
+    def test_determinant_non_square_matrix(self):
+        with self.assertRaises(InvalidMatrixDeterminantException):
+            Matrix([[1, 2, 3], [4, 5, 6]]).det()
+
     def test_zero_determinant_matrix(self):
         m = Matrix([[1, 2], [8, 16]])
         self.assertEqual(m.det(), 0)
@@ -99,5 +128,128 @@ class MatrixTest(TestCase):
         m = Matrix([[1, 2, 3, 4], [2, 3, 4, 5]]).scalar_multiplication(10)
         self.assertEqual(m.data, [[10, 20, 30, 40], [20, 30, 40, 50]])
 
-
-
+    def test_subtract_matrices(self):
+        m = Matrix([[1, 3], [2, 7]]) - Matrix([[2, 5], [4, 3]])
+        self.assertEqual(m.data, [[-1, -2], [-2, 4]])
+        self.assertEqual(Matrix([[1, 3], [2, 7]]).subtract(Matrix([[2, 5], [4, 3]])).data, m.data)
+
+    def test_in_place_operations(self):
+        for data_type in (None, int):
+            m = Matrix([[1, 3], [2, 7]], data_type=data_type)
+            data = m.data
+            m += Matrix([[2, 5], [4, 3]], data_type=data_type)
+            self.assertEqual(m.data, [[3, 8], [6, 10]])
+            m -= Matrix([[1, 1], [1, 1]], data_type=data_type)
+            self.assertEqual(m.data, [[2, 7], [5, 9]])
+            m *= 2
+            self.assertEqual(m.data, [[4, 14], [10, 18]])
+            self.assertIs(m.data, data)
+            m *= Matrix([[1, 0], [0, 1]], data_type=data_type)
+            self.assertEqual(m.data, [[4, 14], [10, 18]])
+
+    def test_in_place_operations_promote_packed_ints(self):
+        m = Matrix([[1, 3], [2, 7]], data_type=int)
+        data = m.data
+        m += Matrix([[1, 1], [1, 1]], data_type=int)
+        self.assertIs(m.data, data)
+        m *= 0.5
+        self.assertEqual(m.data_type, float)
+        self.assertEqual(m.data, [[1.0, 2.0], [1.5, 4.0]])
+        m = Matrix([[1, 3], [2, 7]], data_type=int)
+        m += Matrix([[0.5, 0.5], [0.5, 0.5]], data_type=float)
+        self.assertEqual(m.data_type, float)
+        self.assertEqual(m.data, [[1.5, 3.5], [2.5, 7.5]])
+        m = Matrix([[1, 3], [2, 7]], data_type=int)
+        m -= Matrix([[0.5, 0.5], [0.5, 0.5]], data_type=float)
+        self.assertEqual(m.data, [[0.5, 2.5], [1.5, 6.5]])
+
+    def test_packed_ints_mix_with_untyped_operands(self):
+        m = Matrix([[1, 3], [2, 7]], data_type=int, engine='python')
+        mixed = Matrix([[0.5, 1], [1, 1]], engine='python')
+        self.assertEqual((m + mixed).data, [[1.5, 4], [3, 8]])
+        self.assertEqual(m.scalar_multiplication(Fraction(1, 2)).data,
+                         [[Fraction(1, 2), Fraction(3, 2)], [Fraction(1), Fraction(7, 2)]])
+        self.assertEqual((m * m * 2 - m + mixed).data, [[13.5, 46], [31, 104]])
+        m += mixed
+        self.assertEqual(m.data, [[1.5, 4], [3, 8]])
+
+    def test_out_parameter(self):
+        a = Matrix([[1, 3], [2, 7]])
+        b = Matrix([[2, 5], [4, 3]])
+        out = Matrix(m=2, n=2)
+        self.assertIs(a.add(b, out=out), out)
+        self.assertEqual(out.data, [[3, 8], [6, 10]])
+        self.assertIs(a.subtract(b, out=out), out)
+        self.assertEqual(out.data, [[-1, -2], [-2, 4]])
+        self.assertIs(a.scalar_multiplication(3, out=out), out)
+        self.assertEqual(out.data, [[3, 9], [6, 21]])
+        self.assertIs(a.negate(out=out), out)
+        self.assertEqual(out.data, [[-1, -3], [-2, -7]])
+        self.assertIs(a.multiply(b, out=out), out)
+        self.assertEqual(out.data, [[14, 14], [32, 31]])
+        with self.assertRaises(ValueError):
+            a.multiply(b, out=a)
+        with self.assertRaises(ValueError):
+            a.add(b, out=Matrix(m=3, n=2))
+
+    def test_axpy(self):
+        x = Matrix([[1, 3], [2, 7]])
+        y = Matrix([[2, 5], [4, 3]])
+        self.assertEqual(x.axpy(2, y).data, [[4, 11], [8, 17]])
+        self.assertIs(x.axpy(2, y, out=y), y)
+        self.assertEqual(y.data, [[4, 11], [8, 17]])
+        packed = Matrix([[1, 3], [2, 7]], data_type=int).axpy(0.5, Matrix([[2, 5], [4, 3]], data_type=int))
+        self.assertEqual(packed.data_type, float)
+        self.assertEqual(packed.data, [[2.5, 6.5], [5, 6.5]])
+
+    def test_rref_and_rank(self):
+        m = Matrix([[1, 2, 1, 4], [2, 4, 0, 6], [3, 6, 1, 10]])
+        self.assertEqual(m.rref().data, [[1, 2, 0, 3], [0, 0, 1, 1], [0, 0, 0, 0]])
+        self.assertEqual(m.rank(), 2)
+        self.assertEqual(Matrix([[1, 2], [3, 4], [5, 6]]).rank(), 2)
+        self.assertEqual(Matrix([[1.0, 2.0], [2.0, 4.0]]).rank(), 1)
+        self.assertEqual(Matrix([[0, 0], [0, 0]]).rank(), 0)
+        self.assertEqual(Matrix(data=[[2, 4], [1, 2]], data_type=Fraction).rank(), 1)
+
+    def test_gauss_jordan_partial_pivoting(self):
+        m = Matrix([[1e-20, 1.0, 1.0], [1.0, 1.0, 2.0]])
+        result = m.gauss_jordan_reduction().data
+        self.assertAlmostEqual(result[0][2], 1.0)
+        self.assertAlmostEqual(result[1][2], 1.0)
+        inverse = Matrix([[1e-20, 1.0], [1.0, 1.0]]).inverse().data
+        self.assertAlmostEqual(inverse[0][0], -1.0)
+        self.assertAlmostEqual(inverse[1][0], 1.0)
+
+    def test_fraction_normalization_and_hash(self):
+        self.assertEqual(Fraction(2, -4), Fraction(-1, 2))
+        self.assertEqual(Fraction(2, -4).numerator, -1)
+        self.assertEqual(Fraction(2, -4).denominator, 2)
+        self.assertIsInstance(Fraction(1020, 20).numerator, int)
+        self.assertEqual(hash(Fraction(6, 3)), hash(2))
+        self.assertEqual(hash(Fraction(1, 2)), hash(0.5))
+        self.assertEqual(len({Fraction(1, 2), Fraction(2, 4), Fraction(3, 6)}), 1)
+        self.assertFalse(hasattr(Fraction(1, 2), '__dict__'))
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(1, 0)
+
+    def test_fraction_mixed_operations(self):
+        self.assertEqual(1 + Fraction(1, 2), Fraction(3, 2))
+        self.assertEqual(1 - Fraction(1, 2), Fraction(1, 2))
+        self.assertEqual(3 * Fraction(1, 6), Fraction(1, 2))
+        self.assertEqual(1 / Fraction(2, 3), Fraction(3, 2))
+        self.assertEqual(Fraction(2, 3) / 4, Fraction(1, 6))
+        self.assertEqual(Fraction(1, 2) ** -2, Fraction(4, 1))
+        self.assertEqual(Fraction(4) ** 0.5, 2.0)
+        self.assertIsInstance(Fraction(4) ** 0.5, float)
+        with self.assertRaises(TypeError):
+            Fraction(4) ** '2'
+        self.assertEqual(Fraction(1, 2) + 0.25, 0.75)
+        self.assertTrue(Fraction(1, 3) < Fraction(1, 2) < 1)
+        self.assertEqual(abs(Fraction(-1, 3)), Fraction(1, 3))
+        self.assertEqual(sum([Fraction(1, 2), Fraction(1, 3), Fraction(1, 6)]), 1)
+
+    def test_fraction_matrix_operations(self):
+        m = Matrix([[1, 2], [3, 4]], data_type=Fraction)
+        self.assertEqual(m.multiply(m).data, [[7, 10], [15, 22]])
+        self.assertEqual(m.det(), -2)
+        self.assertEqual(m.inverse().data, [[-2, 1], [Fraction(3, 2), Fraction(-1, 2)]])
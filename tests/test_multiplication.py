@@ -0,0 +1,59 @@
+import random
+from unittest.case import TestCase
+from matrix import Matrix
+from multiplication import naive_multiply, blocked_multiply, strassen_multiply, choose_algorithm, multiply_rows
+
+
+class MultiplicationTest(TestCase):
+    def setUp(self):
+        self.random = random.Random(7)
+
+    def tearDown(self):
+        pass
+
+    def random_rows(self, m, n):
+        return [[self.random.randint(-9, 9) for _ in range(n)] for _ in range(m)]
+
+    def test_algorithms_agree_on_integers(self):
+        for m, n, p in [(1, 1, 1), (3, 5, 2), (7, 7, 7), (9, 4, 11), (16, 16, 16), (17, 13, 19)]:
+            first = self.random_rows(m, n)
+            second = self.random_rows(n, p)
+            expected = naive_multiply(first, second)
+            self.assertEqual(expected, blocked_multiply(first, second, block_size=4))
+            self.assertEqual(expected, strassen_multiply(first, second, threshold=2))
+
+    def test_algorithms_agree_on_floats(self):
+        first = [[self.random.uniform(-1, 1) for _ in range(13)] for _ in range(10)]
+        second = [[self.random.uniform(-1, 1) for _ in range(9)] for _ in range(13)]
+        expected = naive_multiply(first, second)
+        for result in (blocked_multiply(first, second, block_size=3), strassen_multiply(first, second, threshold=2)):
+            for expected_row, row in zip(expected, result):
+                for expected_value, value in zip(expected_row, row):
+                    self.assertAlmostEqual(expected_value, value)
+
+    def test_choose_algorithm(self):
+        self.assertEqual(choose_algorithm(2, 2, 2), 'naive')
+        self.assertEqual(choose_algorithm(64, 64, 64), 'blocked')
+        self.assertEqual(choose_algorithm(1000, 1000, 1000), 'strassen')
+        self.assertEqual(choose_algorithm(1000, 3, 1000), 'blocked')
+
+    def test_matrix_multiply_algorithm(self):
+        first = Matrix(self.random_rows(6, 5))
+        second = Matrix(self.random_rows(5, 4))
+        expected = first.multiply(second, algorithm='naive').data
+        self.assertEqual(expected, first.multiply(second, algorithm='blocked').data)
+        self.assertEqual(expected, first.multiply(second, algorithm='strassen').data)
+        packed = Matrix(first.data, data_type=int).multiply(Matrix(second.data, data_type=int), algorithm='strassen')
+        self.assertEqual(packed.data_type, int)
+        self.assertEqual(expected, packed.data)
+
+    def test_inner_dimension_mismatch(self):
+        for algorithm in ('naive', 'blocked', 'strassen', None):
+            with self.assertRaises(ValueError):
+                multiply_rows([[1, 2, 3]], [[1], [2]], algorithm=algorithm)
+        with self.assertRaises(ValueError):
+            Matrix([[1, 2, 3]]).multiply(Matrix([[1], [2]]))
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            multiply_rows([[1]], [[1]], algorithm='winograd')
@@ -0,0 +1,96 @@
+import math
+from unittest import skipIf
+from unittest.case import TestCase
+
+from autodiff import forward_derivative, reverse_derivative, Tape
+from functions import Variable, Constant, Sum, Product, Power, Logarithm, Exponential, compile_functions, numpy
+from jacobian import Jacobian, gradient
+from matrix import Matrix
+
+
+class MultivariateTest(TestCase):
+    points = [(1.0, 2.0), (0.5, -1.5), (3.0, 0.25)]
+
+    def setUp(self):
+        x = Variable('x')
+        y = Variable('y')
+        self.x, self.y = x, y
+        self.function = Sum([Product([x, x, y]), Exponential(math.e, y), Logarithm(Sum([Power(x, 2), Constant(1)]),
+                                                                                  math.e)])
+
+    def tearDown(self):
+        pass
+
+    def expected(self, x, y):
+        return x * x * y + math.exp(y) + math.log(x * x + 1)
+
+    def test_evaluate_with_bindings(self):
+        for x, y in self.points:
+            expected = self.expected(x, y)
+            self.assertAlmostEqual(self.function.evaluate({'x': x, 'y': y}), expected)
+            self.assertAlmostEqual(self.function.evaluate_at([x, y]), expected)
+            self.assertAlmostEqual(self.function.evaluate_at([y, x], ['y', 'x']), expected)
+            self.assertAlmostEqual(self.function.evaluate_shared({'x': x, 'y': y}), expected)
+            self.assertAlmostEqual(self.function.compile(['x', 'y'])(x, y), expected)
+        self.assertEqual(self.function.variables(), ('x', 'y'))
+        with self.assertRaises(ValueError):
+            self.function.evaluate_at([1.0])
+        with self.assertRaises(ValueError):
+            self.function.compile(['x'])
+
+    def test_evaluate_many_with_bindings(self):
+        xs = [point[0] for point in self.points]
+        ys = [point[1] for point in self.points]
+        results = self.function.evaluate_many({'x': xs, 'y': ys})
+        for x, y, result in zip(xs, ys, results):
+            self.assertAlmostEqual(result, self.expected(x, y))
+
+    @skipIf(numpy is None, 'numpy is not installed')
+    def test_evaluate_many_with_array_bindings(self):
+        xs = numpy.array([point[0] for point in self.points])
+        ys = numpy.array([point[1] for point in self.points])
+        results = self.function.evaluate_many({'x': xs, 'y': ys})
+        for x, y, result in zip(xs, ys, results):
+            self.assertAlmostEqual(result, self.expected(x, y))
+
+    def test_partial_derivatives(self):
+        partial_x = self.function.derivative('x')
+        partial_y = self.function.derivative('y')
+        for x, y in self.points:
+            point = {'x': x, 'y': y}
+            self.assertAlmostEqual(partial_x.evaluate(point), 2 * x * y + 2 * x / (x * x + 1))
+            self.assertAlmostEqual(partial_y.evaluate(point), x * x + math.exp(y))
+            self.assertAlmostEqual(forward_derivative(self.function, point, 'y')[1], x * x + math.exp(y))
+            self.assertAlmostEqual(reverse_derivative(self.function, point, 'x')[1], partial_x.evaluate(point))
+            gradient_values = Tape(self.function, point).gradient()
+            self.assertAlmostEqual(gradient_values['y'], partial_y.evaluate(point))
+        self.assertEqual(self.function.derivative('z'), Constant.zero())
+        self.assertEqual(Product([self.x, self.y]).derivative('x'), self.y)
+
+    def test_jacobian(self):
+        product = Product([self.x, self.y])
+        jacobian = Jacobian([self.function, product])
+        self.assertEqual((jacobian.m, jacobian.n), (2, 2))
+        for x, y in self.points:
+            result = jacobian.evaluate([x, y])
+            self.assertIsInstance(result, Matrix)
+            self.assertEqual((result.m, result.n), (2, 2))
+            self.assertAlmostEqual(result.data[0][0], 2 * x * y + 2 * x / (x * x + 1))
+            self.assertAlmostEqual(result.data[0][1], x * x + math.exp(y))
+            self.assertEqual(result.data[1], [y, x])
+            self.assertEqual(jacobian.evaluate({'x': x, 'y': y}).data, result.data)
+        self.assertEqual(len(jacobian.evaluate_many(self.points)), len(self.points))
+
+    def test_gradient(self):
+        result = gradient(self.function, self.points)
+        self.assertEqual((result.m, result.n), (len(self.points), 2))
+        for (x, y), row in zip(self.points, result.data):
+            self.assertAlmostEqual(row[1], x * x + math.exp(y))
+        result = gradient(Product([self.y, self.y]), [(2.0,)], ['y'])
+        self.assertEqual(result.data, [[4.0]])
+
+    def test_compile_functions_shares_subexpressions(self):
+        shared = Power(Sum([self.x, self.y]), 2)
+        compiled = compile_functions([Product([shared, self.x]), Sum([shared, self.y])], ['x', 'y'])
+        self.assertEqual(compiled.source.count('** c'), 1)
+        self.assertEqual(compiled(1.0, 2.0), (9.0, 11.0))
@@ -0,0 +1,83 @@
+import os
+import random
+import shutil
+import tempfile
+from unittest.case import TestCase
+
+from matrix import Matrix
+from outofcore import ELEMENT_BYTES, TILES_IN_FLIGHT, OutOfCoreMultiplication, multiply_files, tile_size
+from serialization import close_matrix, load_matrix, save_matrix
+
+
+class OutOfCoreTest(TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.directory = tempfile.mkdtemp()
+        self.paths = [os.path.join(self.directory, name) for name in ('a.bin', 'b.bin', 'c.bin')]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def save(self, first, second):
+        save_matrix(first, self.paths[0])
+        save_matrix(second, self.paths[1])
+
+    def test_integer_product_matches_in_memory(self):
+        first = Matrix([[random.randint(-9, 9) for _ in range(23)] for _ in range(17)], data_type=int)
+        second = Matrix([[random.randint(-9, 9) for _ in range(11)] for _ in range(23)], data_type=int)
+        self.save(first, second)
+        for budget in (TILES_IN_FLIGHT * ELEMENT_BYTES, TILES_IN_FLIGHT * ELEMENT_BYTES * 25, None):
+            report = multiply_files(self.paths[0], self.paths[1], self.paths[2], budget)
+            result = load_matrix(self.paths[2])
+            self.assertEqual(result.data_type, int)
+            self.assertEqual(result.data, first.multiply(second).data)
+            self.assertEqual(report['bytes_written'], 17 * 11 * 8)
+            self.assertLessEqual(report['tile_bytes'], report['memory_budget'])
+
+    def test_float_product_and_byte_counts(self):
+        first = Matrix([[random.random() for _ in range(12)] for _ in range(12)], data_type=float)
+        second = Matrix([[random.random() for _ in range(12)] for _ in range(12)], data_type=float)
+        self.save(first, second)
+        report = multiply_files(self.paths[0], self.paths[1], self.paths[2], TILES_IN_FLIGHT * ELEMENT_BYTES * 16)
+        self.assertEqual(report['tile_size'], 4)
+        self.assertEqual(report['tiles'], 27)
+        self.assertEqual(report['bytes_read'], 2 * 27 * 16 * 8)
+        expected = first.multiply(second).data.tolist()
+        for row, expected_row in zip(load_matrix(self.paths[2], 'r').data.tolist(), expected):
+            for value, expected_value in zip(row, expected_row):
+                self.assertAlmostEqual(value, expected_value)
+
+    def test_maps_are_closed(self):
+        matrix = Matrix([[1, 2], [3, 4]], data_type=int)
+        self.save(matrix, matrix)
+        with OutOfCoreMultiplication(self.paths[0], self.paths[1], self.paths[2]) as multiplication:
+            maps = [multiplication.first.data.buffer.obj, multiplication.second.data.buffer.obj]
+            multiplication.run()
+            self.assertFalse(any(mapped.closed for mapped in maps))
+        self.assertTrue(all(mapped.closed for mapped in maps))
+        result = load_matrix(self.paths[2], 'r')
+        mapped = result.data.buffer.obj
+        self.assertEqual(result.data.tolist(), [[7, 10], [15, 22]])
+        close_matrix(result)
+        self.assertTrue(mapped.closed)
+
+    def test_close_with_exported_rows_keeps_the_matrix(self):
+        self.save(Matrix([[1, 2], [3, 4]], data_type=int), Matrix([[1]], data_type=int))
+        matrix = load_matrix(self.paths[0], 'r')
+        mapped = matrix.data.buffer.obj
+        row = matrix.data[1]
+        with self.assertRaises(BufferError):
+            close_matrix(matrix)
+        self.assertFalse(mapped.closed)
+        self.assertEqual(matrix.data.tolist(), [[1, 2], [3, 4]])
+        self.assertEqual(row, [3, 4])
+        del row
+        close_matrix(matrix)
+        self.assertTrue(mapped.closed)
+
+    def test_invalid_operands(self):
+        self.save(Matrix([[1, 2]], data_type=int), Matrix([[1, 2]], data_type=int))
+        with self.assertRaises(ValueError):
+            OutOfCoreMultiplication(self.paths[0], self.paths[1], self.paths[2])
+        with self.assertRaises(ValueError):
+            tile_size(1, 10, 10, 10)
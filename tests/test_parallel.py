@@ -0,0 +1,53 @@
+import random
+from unittest.case import TestCase
+from matrix import Matrix
+from multiplication import naive_multiply, choose_algorithm
+from parallel import ParallelMultiplier, enable_parallel, disable_parallel, get_multiplier
+
+
+class ParallelMultiplierTest(TestCase):
+    def setUp(self):
+        self.random = random.Random(11)
+        self.multiplier = ParallelMultiplier(workers=2, threshold=4)
+
+    def tearDown(self):
+        self.multiplier.close()
+        disable_parallel()
+
+    def test_parallel_matches_serial(self):
+        first = [[self.random.randint(-9, 9) for _ in range(9)] for _ in range(7)]
+        second = [[self.random.randint(-9, 9) for _ in range(5)] for _ in range(9)]
+        self.assertEqual(naive_multiply(first, second), self.multiplier.multiply(first, second))
+        first = [[self.random.uniform(-1, 1) for _ in range(6)] for _ in range(6)]
+        expected = naive_multiply(first, first)
+        for expected_row, row in zip(expected, self.multiplier.multiply(first, first)):
+            for expected_value, value in zip(expected_row, row):
+                self.assertAlmostEqual(expected_value, value)
+
+    def test_pool_is_reused(self):
+        first = [[1, 2], [3, 4]]
+        self.multiplier.multiply(first, first)
+        executor = self.multiplier.executor
+        self.multiplier.multiply(first, first)
+        self.assertIs(executor, self.multiplier.executor)
+
+    def test_unsupported_entries_are_declined(self):
+        self.assertIsNone(self.multiplier.multiply([[1j, 2]], [[1], [2]]))
+        self.assertIsNone(self.multiplier.multiply([[2 ** 40]], [[2 ** 40]]))
+
+    def test_opt_in_matrix_multiply(self):
+        self.assertNotEqual(choose_algorithm(8, 8, 8), 'parallel')
+        multiplier = enable_parallel(workers=2, threshold=4)
+        self.assertIs(get_multiplier(), multiplier)
+        self.assertEqual(choose_algorithm(8, 8, 8), 'parallel')
+        first = Matrix([[self.random.randint(-9, 9) for _ in range(8)] for _ in range(8)], engine='python')
+        self.assertEqual(first.multiply(first).data, first.multiply(first, algorithm='naive').data)
+        complex_matrix = Matrix([[1j] * 8 for _ in range(8)], engine='python')
+        self.assertEqual(complex_matrix.multiply(complex_matrix).data[0][0], -8)
+
+    def test_forced_parallel_stays_opt_in(self):
+        first = Matrix([[self.random.randint(-9, 9) for _ in range(4)] for _ in range(4)], engine='python')
+        self.assertEqual(first.multiply(first, algorithm='parallel').data,
+                         first.multiply(first, algorithm='naive').data)
+        self.assertIsNone(get_multiplier())
+        self.assertNotEqual(choose_algorithm(256, 256, 256), 'parallel')
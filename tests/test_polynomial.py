@@ -0,0 +1,86 @@
+import math
+import random
+from unittest.case import TestCase
+
+from functions import Variable, Constant, Sum, Product, Power, Logarithm, Exponential
+from matrix import Fraction
+from polynomial import Polynomial, NotAPolynomialException, karatsuba_convolve, naive_convolve
+
+
+class PolynomialTest(TestCase):
+    evaluate_values = [-2, -0.5, 0, 1, 1.5, 3]
+
+    def setUp(self):
+        random.seed(0)
+
+    def tearDown(self):
+        pass
+
+    def test_from_function_combines_terms(self):
+        x = Variable('x')
+        polynomial = Polynomial.from_function(Sum([Product([x, x]), Power(x, 2), Constant(1)]))
+        self.assertEqual(polynomial.coefficients, [1, 0, 2])
+        self.assertEqual(polynomial.variable, 'x')
+        function = Product([Sum([x, Constant(1)]), Power(Sum([x, Constant(-2)]), 3), Exponential(x, 2)])
+        for sparse in (False, True):
+            polynomial = Polynomial.from_function(function, sparse=sparse)
+            self.assertEqual(polynomial.is_sparse, sparse)
+            self.assertEqual(polynomial.degree, 6)
+            for value in self.evaluate_values:
+                self.assertAlmostEqual(polynomial.evaluate(value), function.evaluate(value))
+                self.assertAlmostEqual(polynomial.to_function().evaluate(value), function.evaluate(value))
+
+    def test_from_function_rejects_non_polynomials(self):
+        x = Variable('x')
+        for function in (Power(x, -1), Power(x, 0.5), Logarithm(x, math.e), Exponential(2, x),
+                         Product([x, Variable('y')])):
+            with self.assertRaises(NotAPolynomialException):
+                Polynomial.from_function(function)
+
+    def test_karatsuba_matches_naive(self):
+        for n, m in [(100, 100), (100, 37), (7, 90), (65, 64), (200, 3), (1, 1)]:
+            first = [random.randint(-9, 9) for _ in range(n)]
+            second = [random.randint(-9, 9) for _ in range(m)]
+            expected = naive_convolve(first, second)
+            self.assertEqual(karatsuba_convolve(first, second), expected)
+            self.assertEqual(karatsuba_convolve(first, second, 4), expected)
+
+    def test_arithmetic(self):
+        p = Polynomial([1, 2, 3])
+        q = Polynomial({0: -1, 5: 2})
+        self.assertEqual(p + q, Polynomial([0, 2, 3, 0, 0, 2]))
+        self.assertEqual(p - p, Polynomial([]))
+        self.assertEqual(p * q, Polynomial([-1, -2, -3, 0, 0, 2, 4, 6]))
+        self.assertEqual(p * 2, Polynomial([2, 4, 6]))
+        self.assertEqual(1 - p, Polynomial([0, -2, -3]))
+        self.assertEqual(p ** 3, p * p * p)
+        self.assertEqual(p.derivative(), Polynomial([2, 6]))
+        self.assertEqual(q.derivative(), Polynomial({4: 10}))
+        self.assertEqual(Polynomial([0, 0, 0]).degree, -1)
+        self.assertEqual(str(q), '2*x^5 + -1')
+        with self.assertRaises(ValueError):
+            p.add(Polynomial([0, 1], 'y'))
+
+    def test_dense_and_sparse_agree(self):
+        coefficients = {0: 3, 7: -1, 20: 2}
+        sparse = Polynomial(coefficients)
+        dense = sparse.to_dense()
+        self.assertEqual(len(dense.coefficients), 21)
+        self.assertEqual(sparse, dense)
+        self.assertTrue(dense.compact().is_sparse)
+        for value in self.evaluate_values:
+            self.assertAlmostEqual(sparse.evaluate(value), dense.evaluate(value))
+        self.assertEqual((sparse * sparse).to_dense(), dense * dense)
+        self.assertEqual(hash(sparse), hash(dense))
+        self.assertEqual(len({sparse, dense, Polynomial([1, 2]), Polynomial({0: 1, 1: 2})}), 2)
+        self.assertEqual(hash(Polynomial([3], variable='y')), hash(3))
+
+    def test_fraction_coefficients(self):
+        p = Polynomial([Fraction(1, 2), Fraction(1, 3)])
+        result = p ** 5
+        self.assertEqual(result.coefficient(0), Fraction(1, 32))
+        self.assertEqual(result.coefficient(5), Fraction(1, 243))
+        self.assertEqual(result.evaluate(Fraction(1, 1)), Fraction(3125, 7776))
+        self.assertEqual(result.evaluate(1), Fraction(5, 6) ** 5)
+        self.assertEqual(Polynomial([Fraction(1, 2)] * 40).multiply(Polynomial([Fraction(2, 3)] * 40)).coefficient(39),
+                         Fraction(40, 3))
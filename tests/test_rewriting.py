@@ -0,0 +1,70 @@
+import math
+from unittest.case import TestCase
+
+from functions import Variable, Constant, Sum, Product, Power, Logarithm, Exponential
+from rewriting import RewriteEngine, STANDARD_RULES, normalize
+
+
+class RewritingTest(TestCase):
+    evaluate_values = [0.5, 1, 2, 3.7, math.pi]
+
+    def setUp(self):
+        self.x = Variable('x')
+        self.y = Variable('y')
+
+    def tearDown(self):
+        pass
+
+    def test_normal_forms(self):
+        x, y = self.x, self.y
+        cases = [
+            (Sum([Product([x, x]), Power(x, 2)]), Product([Constant(2), Power(x, 2)])),
+            (Sum([x, Product([Constant(-1), x])]), Constant(0)),
+            (Sum([Product([Constant(2), x]), Product([x, Constant(3)])]), Product([Constant(5), x])),
+            (Product([Constant(2), x, Sum([x, x]), Power(Product([Constant(3), y]), 2)]),
+             Product([Constant(36), Power(x, 2), Power(y, 2)])),
+            (Power(Power(x, 2), 3), Power(x, 6)),
+            (Product([x, Power(x, -1)]), Constant(1)),
+            (Logarithm(Exponential(math.e, Product([Constant(2), x])), math.e), Product([Constant(2), x])),
+            (Logarithm(Constant(8), 2), Constant(3.0)),
+            (Logarithm(x, 2), Logarithm(x, 2)),
+            (Exponential(x, Constant(3)), Power(x, 3)),
+            (Exponential(Constant(1), x), Constant(1)),
+            (Logarithm(Exponential(Constant(-2), x), math.e), Logarithm(Exponential(Constant(-2), x), math.e)),
+            (Logarithm(Exponential(Constant(0), x), 2), Logarithm(Exponential(Constant(0), x), 2)),
+        ]
+        for function, expected in cases:
+            self.assertEqual(normalize(function), expected)
+
+    def test_values_are_preserved(self):
+        function = Product([Power(self.x, 3), Exponential(math.e, self.x), Logarithm(Sum([self.x, Constant(1)]), 2)])
+        for _ in range(3):
+            function = function.derivative()
+            normal = normalize(function)
+            for value in self.evaluate_values:
+                self.assertAlmostEqual(normal.evaluate(value), function.evaluate(value),
+                                       delta=1e-9 * max(1.0, abs(function.evaluate(value))))
+
+    def test_normal_forms_are_not_revisited(self):
+        engine = RewriteEngine(STANDARD_RULES)
+        function = Sum([Product([self.x, self.x]), Power(self.x, 2), Product([Constant(2), self.y])])
+        normal = engine.normalize(function)
+        self.assertTrue(engine.is_normal(normal))
+        rewrites = engine.rewrites
+        self.assertIs(engine.normalize(function), normal)
+        self.assertIs(engine.normalize(normal), normal)
+        self.assertIs(engine.normalize(Sum([normal, Constant(0)])), normal)
+        self.assertEqual(engine.rewrites, rewrites + 1)
+
+    def test_rules_are_indexed_by_type(self):
+        calls = []
+
+        def double_constant(function):
+            calls.append(function)
+            return None
+
+        engine = RewriteEngine({Logarithm: [double_constant]})
+        engine.normalize(Sum([self.x, Logarithm(Product([self.x, self.y]), 2)]))
+        self.assertEqual(calls, [Logarithm(Product([self.x, self.y]), 2)])
+        engine.register(Sum, lambda function: function.summands[0] if len(function.summands) == 2 else None)
+        self.assertEqual(engine.normalize(Sum([self.x, self.y])), self.x)
@@ -0,0 +1,93 @@
+import io
+import os
+import shutil
+import tempfile
+from unittest.case import TestCase
+
+from matrix import Matrix, Fraction
+from serialization import MatrixFormatException, MatrixWriter, convert_csv, iterate_rows, load_matrix, save_matrix
+from storage import is_packed
+
+
+class SerializationTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'matrix.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        matrices = [Matrix([[1.5, -2.0, 3.25], [4.0, 5.0, 6.0]], data_type=float),
+                    Matrix([[1, 2], [3, 4], [-5, 2 ** 40]], data_type=int),
+                    Matrix([[1, 2], [3, 4]]),
+                    Matrix([[1, 2.5]])]
+        for matrix in matrices:
+            save_matrix(matrix, self.path)
+            for mode in (None, 'r', 'c', 'r+'):
+                loaded = load_matrix(self.path, mode)
+                self.assertTrue(is_packed(loaded.data))
+                self.assertEqual((loaded.m, loaded.n), (matrix.m, matrix.n))
+                self.assertEqual(loaded.data.tolist(), [list(row) for row in matrix.data])
+                del loaded
+
+    def test_memory_mapped_matrices_support_operations(self):
+        matrix = Matrix([[2.0, 1.0], [1.0, 3.0]], data_type=float)
+        save_matrix(matrix, self.path)
+        loaded = load_matrix(self.path, 'r')
+        self.assertAlmostEqual(loaded.det(), 5.0)
+        self.assertEqual(loaded.transpose().data, matrix.transpose().data)
+        self.assertEqual(loaded.multiply(matrix).data, matrix.multiply(matrix).data)
+        self.assertEqual(loaded.copy().data, matrix.data)
+        with self.assertRaises(TypeError):
+            loaded.data[0] = [0.0, 0.0]
+        del loaded
+
+    def test_memory_map_modes(self):
+        save_matrix(Matrix([[1, 2], [3, 4]], data_type=int), self.path)
+        copied = load_matrix(self.path, 'c')
+        copied.data[0] = [9, 9]
+        del copied
+        self.assertEqual(load_matrix(self.path).data.tolist(), [[1, 2], [3, 4]])
+        written = load_matrix(self.path, 'r+')
+        written.data[0] = [7, 8]
+        written.data.swap_rows(0, 1)
+        del written
+        self.assertEqual(load_matrix(self.path).data.tolist(), [[3, 4], [7, 8]])
+        with self.assertRaises(ValueError):
+            load_matrix(self.path, 'w')
+
+    def test_invalid_files(self):
+        with open(self.path, 'wb') as output:
+            output.write(b'not a matrix')
+        with self.assertRaises(MatrixFormatException):
+            load_matrix(self.path)
+        save_matrix(Matrix([[1.0, 2.0]], data_type=float), self.path)
+        with open(self.path, 'r+b') as output:
+            output.truncate(os.path.getsize(self.path) - 4)
+        with self.assertRaises(MatrixFormatException):
+            load_matrix(self.path)
+        with self.assertRaises(ValueError):
+            save_matrix(Matrix([[1, 2]], data_type=Fraction), self.path)
+
+    def test_writer_streams_rows(self):
+        with MatrixWriter(self.path, 3, int) as writer:
+            for i in range(5):
+                writer.write_row([i, i + 1, i + 2])
+            with self.assertRaises(ValueError):
+                writer.write_row([1, 2])
+        self.assertEqual(load_matrix(self.path, 'r').data.tolist(), [[i, i + 1, i + 2] for i in range(5)])
+
+    def test_iterate_rows(self):
+        source = io.StringIO('a,b\n1,2\n3,4\n\n5,6\n')
+        self.assertEqual(list(iterate_rows(source, int, skip_header=True)), [[1, 2], [3, 4], [5, 6]])
+        self.assertEqual(list(iterate_rows(io.StringIO('1.5 2\n3  4\n'), delimiter=None)), [[1.5, 2.0], [3.0, 4.0]])
+        rows = iterate_rows(io.StringIO('1,2\n'))
+        self.assertEqual(next(rows), [1.0, 2.0])
+
+    def test_convert_csv(self):
+        csv_path = os.path.join(self.directory, 'matrix.csv')
+        with open(csv_path, 'w') as output:
+            output.write('x,y\n1,2\n3,4\n5,6\n')
+        self.assertEqual(convert_csv(csv_path, self.path, skip_header=True), (3, 2))
+        self.assertEqual(load_matrix(self.path).data.tolist(), [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
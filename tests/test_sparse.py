@@ -0,0 +1,71 @@
+from unittest.case import TestCase
+from matrix import Matrix
+from sparse import COOMatrix, CSRMatrix
+
+
+class SparseMatrixTest(TestCase):
+    def setUp(self):
+        self.dense = Matrix([[1, 0, 0, 2], [0, 0, 3, 0], [0, 0, 0, 0], [4, 0, 5, 0]])
+        self.other = Matrix([[0, 1, 0, 0], [2, 0, 0, 0], [0, 0, 0, 6], [0, 7, 0, 0]])
+
+    def tearDown(self):
+        pass
+
+    def test_conversions(self):
+        csr = CSRMatrix.from_matrix(self.dense)
+        self.assertEqual(csr.nnz, 5)
+        self.assertEqual(list(csr.indptr), [0, 2, 3, 3, 5])
+        self.assertEqual(csr.to_matrix().data, self.dense.data)
+        coo = COOMatrix.from_matrix(self.dense)
+        self.assertEqual(coo.nnz, 5)
+        self.assertEqual(coo.to_matrix().data, self.dense.data)
+        self.assertEqual(coo.to_csr().to_matrix().data, self.dense.data)
+        self.assertEqual(csr.to_coo().to_matrix().data, self.dense.data)
+        packed = CSRMatrix.from_matrix(Matrix(self.dense.data, data_type=float))
+        self.assertEqual(packed.to_matrix().data, self.dense.data)
+
+    def test_coo_duplicates_are_summed(self):
+        coo = COOMatrix(2, 2, [0, 0, 1], [1, 1, 0], [2, 3, 4])
+        self.assertEqual(coo.to_matrix().data, [[0, 5], [4, 0]])
+        self.assertEqual(coo.to_csr().nnz, 2)
+        self.assertEqual(coo.to_csr().to_matrix().data, [[0, 5], [4, 0]])
+
+    def test_transpose(self):
+        self.assertEqual(CSRMatrix.from_matrix(self.dense).transpose().to_matrix().data,
+                         self.dense.transpose().data)
+        self.assertEqual(COOMatrix.from_matrix(self.dense).transpose().to_matrix().data,
+                         self.dense.transpose().data)
+
+    def test_products(self):
+        expected = self.dense.multiply(self.other).data
+        csr = CSRMatrix.from_matrix(self.dense)
+        other_csr = CSRMatrix.from_matrix(self.other)
+        self.assertEqual((csr * self.other).data, expected)
+        self.assertEqual((csr * other_csr).to_matrix().data, expected)
+        self.assertEqual((self.dense * other_csr).data, expected)
+        self.assertEqual((COOMatrix.from_matrix(self.dense) * other_csr).to_matrix().data, expected)
+        self.assertEqual((csr * 2).to_matrix().data, self.dense.scalar_multiplication(2).data)
+
+    def test_sums(self):
+        expected = self.dense.add(self.other).data
+        csr = CSRMatrix.from_matrix(self.dense)
+        self.assertEqual((csr + self.other).data, expected)
+        self.assertEqual((self.other + csr).data, expected)
+        self.assertEqual((csr + CSRMatrix.from_matrix(self.other)).to_matrix().data, expected)
+        cancelled = csr + CSRMatrix.from_matrix(self.dense.negate())
+        self.assertEqual(cancelled.nnz, 0)
+
+    def test_sums_promote_packed_operands(self):
+        csr = CSRMatrix.from_matrix(self.dense.scalar_multiplication(0.5))
+        packed = Matrix(self.other.data, data_type=int)
+        result = csr + packed
+        self.assertEqual(result.data_type, float)
+        self.assertEqual(result.data, self.dense.scalar_multiplication(0.5).add(self.other).data)
+        self.assertEqual(packed.data, self.other.data)
+
+    def test_dimension_mismatch(self):
+        csr = CSRMatrix.from_matrix(self.dense)
+        with self.assertRaises(ValueError):
+            csr.multiply(Matrix([[1, 2]]))
+        with self.assertRaises(ValueError):
+            csr.add(Matrix([[1, 2]]))
@@ -0,0 +1,74 @@
+from unittest.case import TestCase
+from matrix import Matrix
+from storage import PackedStorage
+
+
+class PackedStorageTest(TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_packed_matrix_semantics(self):
+        m = Matrix([[1, 2, 3], [4, 5, 6]], data_type=float)
+        self.assertIsInstance(m.data, PackedStorage)
+        self.assertEqual(m.data.typecode, 'd')
+        self.assertEqual((m.m, m.n), (2, 3))
+        self.assertEqual(m.data[1][2], 6.0)
+        self.assertEqual(m.data[1], [4, 5, 6])
+        self.assertEqual(m.data[1][1:], [5, 6])
+        m.data[1][2] = 9.5
+        self.assertEqual(m.data, [[1, 2, 3], [4, 5, 9.5]])
+        self.assertEqual('{0}'.format(m), '[[1.0, 2.0, 3.0], [4.0, 5.0, 9.5]]')
+
+    def test_packed_zero_matrix(self):
+        m = Matrix(m=2, n=3, data_type=int)
+        self.assertEqual(m.data.typecode, 'q')
+        self.assertEqual(m.data, [[0, 0, 0], [0, 0, 0]])
+        self.assertEqual(m.data.nbytes, 6 * 8)
+
+    def test_packed_operations(self):
+        a = Matrix([[1, 3], [2, 7]], data_type=int)
+        b = Matrix([[2, 5], [4, 3]], data_type=int)
+        self.assertEqual(a.add(b).data, [[3, 8], [6, 10]])
+        self.assertEqual((a - b).data, [[-1, -2], [-2, 4]])
+        self.assertEqual(a.transpose().data, [[1, 2], [3, 7]])
+        self.assertEqual(a.scalar_multiplication(10).data, [[10, 30], [20, 70]])
+        self.assertEqual(a.multiply(Matrix([[2, 5, 8], [4, 3, 2]], data_type=int)).data,
+                         [[14, 14, 14], [32, 31, 30]])
+        self.assertEqual(a.copy().data, a.data)
+        self.assertIsNot(a.copy().data.buffer, a.data.buffer)
+        self.assertEqual(a.det(), 1)
+        for result in (a.add(b), a.transpose(), a.multiply(b), a.copy(), a.remove_row(0)):
+            self.assertEqual(result.data_type, int)
+
+    def test_packed_int_values(self):
+        self.assertEqual(Matrix([[2.0, 3]], data_type=int).data, [[2, 3]])
+        with self.assertRaises(ValueError):
+            Matrix([[1.7]], data_type=int)
+        big = Matrix([[2 ** 70]], data_type=int)
+        self.assertEqual(big.data, [[2 ** 70]])
+        self.assertNotIsInstance(big.data, PackedStorage)
+        near = Matrix([[2 ** 62, 1], [3, -2 ** 62]], data_type=int, engine='python')
+        self.assertEqual(near.add(near).data, [[2 ** 63, 2], [6, -2 ** 63]])
+        self.assertEqual(near.scalar_multiplication(4).data, [[2 ** 64, 4], [12, -2 ** 64]])
+
+    def test_packed_type_promotion(self):
+        a = Matrix([[1, 2], [3, 5]], data_type=int)
+        b = Matrix([[0.5, 0], [0, 0.5]], data_type=float)
+        self.assertEqual(a.add(b).data_type, float)
+        self.assertEqual(a.multiply(b).data, [[0.5, 1], [1.5, 2.5]])
+        self.assertEqual(a.scalar_multiplication(0.5).data_type, float)
+        self.assertEqual(a.inverse().data, [[-5, 2], [3, -1]])
+        self.assertEqual(a.gauss_jordan_reduction().data, [[1, 0], [0, 1]])
+
+    def test_packed_swap_rows(self):
+        m = Matrix([[0, 0, 1, 2], [1, 0, 0, 3], [0, 1, 0, 2]], data_type=float)
+        self.assertEqual(m.gauss_jordan_reduction().data, [[1, 0, 0, 3], [0, 1, 0, 2], [0, 0, 1, 2]])
+        m.swap_rows(0, 2)
+        self.assertEqual(m.data, [[0, 1, 0, 2], [1, 0, 0, 3], [0, 0, 1, 2]])
+
+    def test_packed_rows_must_be_rectangular(self):
+        with self.assertRaises(ValueError):
+            Matrix([[1, 2], [3]], data_type=float)
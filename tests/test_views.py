@@ -0,0 +1,120 @@
+import json
+from unittest import skipUnless
+from unittest.case import TestCase
+
+from engines import numpy_available
+from matrix import Fraction, Matrix
+from storage import PackedStorage, ViewStorage
+
+
+class ViewTest(TestCase):
+    rows = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]]
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def matrices(self):
+        return [Matrix([list(row) for row in self.rows]), Matrix([list(row) for row in self.rows], data_type=int),
+                Matrix([list(row) for row in self.rows], data_type=Fraction)]
+
+    def test_views_share_storage(self):
+        for matrix in self.matrices():
+            for view in (matrix.transpose(view=True), matrix[0:2, 1:3], matrix.minor(0, 0)):
+                self.assertIsInstance(view.data, ViewStorage)
+                self.assertIs(view.data.source, matrix.data)
+                self.assertEqual(view.data_type, matrix.data_type)
+
+    def test_transpose_and_slices(self):
+        for matrix in self.matrices():
+            self.assertEqual(matrix.transpose(view=True).data, [[1, 5, 9], [2, 6, 10], [3, 7, 11], [4, 8, 12]])
+            self.assertEqual(matrix[1:, 1:3].data, [[6, 7], [10, 11]])
+            self.assertEqual(matrix[::2, ::-2].data, [[4, 2], [12, 10]])
+            self.assertEqual(matrix[1, :].data, [[5, 6, 7, 8]])
+            self.assertEqual(matrix[-1, -1], 12)
+            self.assertEqual(matrix.remove_column(2).data, [[1, 2, 4], [5, 6, 8], [9, 10, 12]])
+            self.assertEqual(matrix.minor(1, 0).data, [[2, 3, 4], [10, 11, 12]])
+
+    def test_nested_views_compose(self):
+        matrix = Matrix([list(row) for row in self.rows], data_type=int)
+        view = matrix.transpose(view=True)[1:3, :].transpose(view=True)[:, 1:]
+        self.assertIs(view.data.source, matrix.data)
+        self.assertEqual(view.data, [[3], [7], [11]])
+        self.assertEqual(view.transpose(view=True).data, [[3, 7, 11]])
+
+    def test_writes_copy_on_write(self):
+        for matrix in self.matrices():
+            view = matrix[0:2, 0:2]
+            view.data[0][0] = 100
+            view += Matrix([[1, 1], [1, 1]])
+            self.assertEqual(view.data, [[101, 3], [6, 7]])
+            self.assertEqual(matrix.data, self.rows)
+            self.assertIsNot(view.data, matrix.data)
+
+    def test_parent_writes_are_visible_until_materialized(self):
+        matrix = Matrix([list(row) for row in self.rows], data_type=int)
+        view = matrix.transpose(view=True)
+        matrix.data[0] = [0, 0, 0, 0]
+        self.assertEqual(view.data[1], [0, 6, 10])
+        copy = view.copy()
+        self.assertIsInstance(copy.data, PackedStorage)
+        matrix.data[0] = [1, 1, 1, 1]
+        self.assertEqual(copy.data[1].tolist(), [0, 6, 10])
+
+    def test_replaced_storage_detaches_views(self):
+        matrix = Matrix([list(row) for row in self.rows], data_type=int)
+        view = matrix[0:2, 0:2]
+        matrix *= 0.5
+        self.assertEqual(matrix.data_type, float)
+        self.assertEqual(view.data, [[1, 2], [5, 6]])
+        inner = matrix[0:2, 0:2]
+        nested = inner[0:1, :]
+        inner.data[0][0] = 99
+        self.assertEqual(nested.data, [[0.5, 1.0]])
+
+    def test_copying_methods_are_independent(self):
+        for matrix in self.matrices():
+            results = [matrix.transpose(), matrix.remove_row(1), matrix.remove_column(2)]
+            matrix.data[0][1] = 99
+            matrix.order_rows()
+            self.assertEqual(results[0].data[1][0], 2)
+            self.assertEqual(results[1].data[0][1], 2)
+            self.assertEqual(results[2].data[0][1], 2)
+            for result in results:
+                self.assertNotIsInstance(result.data, ViewStorage)
+        transposed = Matrix([list(row) for row in self.rows]).transpose()
+        self.assertEqual(transposed.data[0] + [5], [1, 5, 9, 5])
+        self.assertEqual(json.loads(json.dumps(transposed.data)), [list(row) for row in zip(*self.rows)])
+
+    def test_row_swaps_permute_the_view(self):
+        matrix = Matrix([list(row) for row in self.rows], data_type=int)
+        view = matrix.transpose(view=True)
+        view.swap_rows(0, 3)
+        self.assertEqual(view.data[0], [4, 8, 12])
+        self.assertIsNone(view.data.materialized)
+        self.assertEqual(matrix.data, self.rows)
+
+    def test_operations_on_views(self):
+        for matrix in self.matrices():
+            square = matrix[:, 1:]
+            self.assertEqual(square.det(), Matrix([row[1:] for row in self.rows]).det())
+            self.assertEqual(square.multiply(matrix.transpose(view=True)[1:, :]).data,
+                             Matrix([row[1:] for row in self.rows]).multiply(
+                                 Matrix([list(row) for row in zip(*self.rows)][1:])).data)
+            self.assertEqual(matrix.transpose(view=True).add(matrix.transpose(view=True)).data,
+                             [[2 * value for value in row] for row in zip(*self.rows)])
+            self.assertEqual(str(matrix[0:1, 0:2]), str(Matrix([self.rows[0][:2]], data_type=matrix.data_type)))
+
+    @skipUnless(numpy_available(), 'numpy is not installed')
+    def test_numpy_engine_reads_views(self):
+        for data_type in (None, int, float):
+            rows = [[float(value) for value in row] for row in self.rows] if data_type == float else self.rows
+            python = Matrix([list(row) for row in rows], data_type=data_type, engine='python')
+            numpy = Matrix([list(row) for row in rows], data_type=data_type, engine='numpy')
+            for view in (lambda m: m.transpose(view=True), lambda m: m[::-1, 1::2], lambda m: m.minor(1, 2)):
+                expected = view(python).multiply(view(python).transpose(view=True))
+                result = view(numpy).multiply(view(numpy).transpose(view=True))
+                self.assertEqual(result.data, expected.data)
+                self.assertEqual(result.data_type, expected.data_type)